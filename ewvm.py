@@ -0,0 +1,931 @@
+import operator
+import sys
+import time
+from array import array
+
+# ====== Máquina virtual EWVM ======
+
+# Interpretador de referência para o código EWVM gerado por pascal_gt.py.
+# A memória segue o modelo da EWVM: as variáveis globais ocupam a base da
+# pilha (gp = 0) e os endereços são índices nessa pilha.
+
+class EWVMError(Exception):
+    pass
+
+# Instruções cujo argumento é um rótulo
+label_instructions = {'jump', 'jz', 'pusha'}
+
+# Instruções com argumento inteiro
+int_instructions = {'pushi', 'pushn', 'pushg', 'storeg', 'pushl', 'storel', 'pop', 'dup', 'popn', 'load', 'store'}
+
+# Converte o texto de uma string EWVM (entre aspas) no seu valor
+def decode_string(text):
+    result = []
+    i = 0
+    while i < len(text):
+        c = text[i]
+        if c == '\\' and i + 1 < len(text):
+            nxt = text[i + 1]
+            result.append({'n': '\n', 't': '\t', '"': '"', '\\': '\\'}.get(nxt, '\\' + nxt))
+            i += 2
+        else:
+            result.append(c)
+            i += 1
+    return "".join(result)
+
+# Formata um real tal como a EWVM o escreve
+def format_float(value):
+    text = repr(float(value))
+    return text[:-2] if text.endswith('.0') else text
+
+# Divisão inteira com truncagem para zero (semântica de Pascal)
+def int_div(a, b):
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b >= 0) else -q
+
+# Resto com o sinal do dividendo (semântica de Pascal)
+def int_mod(a, b):
+    return a - b * int_div(a, b)
+
+# Conversão tolerante de string para inteiro (como atoi em C)
+def str_to_int(text):
+    text = text.strip()
+    end = 1 if text[:1] in ('+', '-') else 0
+    while end < len(text) and text[end].isdigit():
+        end += 1
+    try:
+        return int(text[:end])
+    except ValueError:
+        return 0
+
+# Conversão tolerante de string para real (como atof em C)
+def str_to_float(text):
+    text = text.strip()
+    for end in range(len(text), 0, -1):
+        try:
+            return float(text[:end])
+        except ValueError:
+            pass
+    return 0.0
+
+# Saída com buffer: as escritas acumulam-se e são enviadas em blocos, antes de
+# cada leitura e no fim da execução
+class OutputBuffer:
+    def __init__(self, stream, limit=4096):
+        self.stream = stream
+        self.parts = []
+        self.write = self.parts.append
+        self.limit = limit
+
+    # Escreve uma mudança de linha e despeja o buffer se estiver cheio
+    def newline(self):
+        self.parts.append('\n')
+        if len(self.parts) >= self.limit:
+            self.flush()
+
+    def flush(self):
+        if self.parts:
+            self.stream.write("".join(self.parts))
+            self.parts.clear()
+        self.stream.flush()
+
+# ====== Carregamento do programa ======
+
+# Converte o texto EWVM numa lista de instruções (op, arg) e num mapa de rótulos.
+# Os cabeçalhos '//stack N' do compilador (profundidade máxima da pilha da rotina que
+# começa na instrução seguinte) são guardados em 'stack_depths', se indicado.
+def parse_program(text, stack_depths=None):
+    code = []
+    labels = {}
+    pending = []
+    strings = {}
+    for line_num, raw_line in enumerate(text.splitlines(), 1):
+        line = raw_line.strip()
+        if not line or line.startswith('//'):
+            if stack_depths is not None and line.startswith('//stack '):
+                stack_depths[len(code)] = int(line[len('//stack '):])
+            continue
+        if line.endswith(':') and ' ' not in line:
+            labels[line[:-1]] = len(code)
+            continue
+        parts = line.split(None, 1)
+        op = parts[0].lower()
+        arg = parts[1].strip() if len(parts) > 1 else None
+        if op == 'pushs':
+            if arg is None or len(arg) < 2 or arg[0] != '"' or arg[-1] != '"':
+                raise EWVMError(f"String inválida na linha {line_num}: {raw_line}")
+            # Literais iguais partilham o mesmo objecto, criado uma vez ao carregar
+            arg = decode_string(arg[1:-1])
+            arg = strings.setdefault(arg, arg)
+        elif arg is not None and '//' in arg:
+            arg = arg.split('//', 1)[0].strip()
+        if op in int_instructions:
+            try:
+                arg = int(arg)
+            except (TypeError, ValueError):
+                raise EWVMError(f"Argumento inteiro inválido na linha {line_num}: {raw_line}")
+        elif op == 'pushf':
+            try:
+                arg = float(arg)
+            except (TypeError, ValueError):
+                raise EWVMError(f"Argumento real inválido na linha {line_num}: {raw_line}")
+        elif op in label_instructions:
+            pending.append((len(code), line_num))
+        code.append((op, arg))
+
+    # Resolução dos rótulos para índices de instrução
+    for index, line_num in pending:
+        op, name = code[index]
+        if name not in labels:
+            raise EWVMError(f"Rótulo '{name}' não definido (linha {line_num}).")
+        code[index] = (op, labels[name])
+    return code, labels
+
+# Lê um ficheiro EWVM e devolve o programa carregado
+def load_program(filename, stack_depths=None):
+    with open(filename, 'r', encoding='utf-8') as f:
+        return parse_program(f.read(), stack_depths)
+
+# ====== Pilha de inteiros ======
+
+# Um array('q') guarda os inteiros sem objectos (cerca de 20% menos memória num programa
+# com um array de 300 posições), mas cada leitura cria de novo um int Python: medido com
+# --bench-stack, é 15 a 35% mais lento do que a lista em CPython. Por isso a pilha
+# genérica é a de defeito e '--stack int' só compensa quando a memória importa.
+
+# Instruções que produzem valores não inteiros (strings ou reais)
+non_integer_instructions = {
+    'pushs', 'pushf', 'read', 'atof', 'itof', 'fadd', 'fsub', 'fmul', 'fdiv',
+    'finf', 'finfeq', 'fsup', 'fsupeq', 'writef', 'writes', 'strlen', 'charat', 'chrcode',
+}
+
+# O compilador já escolhe instruções conforme o tipo estático (pushf/fadd para reais,
+# pushs/read para strings), por isso um programa só de inteiros reconhece-se pelo
+# código. As únicas strings aceites são as consumidas de imediato: 'pushs; writes'
+# e 'read; atoi', fundidas em 'writec' e 'readi'. As strings da tabela de constantes
+# ('pushs; storeg k' uma única vez, e cada 'pushg k' seguido de 'writes') também:
+# a inicialização passa a 'nop' e os usos a 'writec'. Devolve o código especializado,
+# ou None se o programa precisar da pilha genérica.
+def integer_only_code(code, labels):
+    targets = set(labels.values())
+    specialized = list(code)
+    pooled = pooled_write_strings(code, targets)
+    for index, (op, arg) in enumerate(code):
+        if op == 'pushg' and arg in pooled:
+            specialized[index] = ('writec', pooled[arg])
+            continue
+        if op not in non_integer_instructions:
+            continue
+        if op == 'writes' and index > 0 and specialized[index - 1][0] == 'writec':
+            continue
+        following = code[index + 1][0] if index + 1 < len(code) and index + 1 not in targets else None
+        if op == 'pushs' and following == 'storeg' and code[index + 1][1] in pooled:
+            specialized[index] = specialized[index + 1] = ('nop', None)
+        elif op == 'pushs' and following == 'writes':
+            specialized[index] = ('writec', arg)
+        elif op == 'read' and following == 'atoi':
+            specialized[index] = ('readi', None)
+        else:
+            return None
+    return specialized
+
+# Globais da tabela de strings usadas só para escrita: {global: string}
+def pooled_write_strings(code, targets):
+    stores = {}
+    candidates = {}
+    for index, (op, arg) in enumerate(code):
+        if op == 'storeg':
+            stores[arg] = stores.get(arg, 0) + 1
+            if index > 0 and code[index - 1][0] == 'pushs' and index not in targets:
+                candidates[arg] = code[index - 1][1]
+    pooled = {slot: text for slot, text in candidates.items() if stores[slot] == 1}
+    for index, (op, arg) in enumerate(code):
+        if op == 'pushg' and arg in pooled and (index + 1 >= len(code) or index + 1 in targets
+                                                 or code[index + 1][0] != 'writes'):
+            del pooled[arg]
+    return pooled
+
+# ====== Superinstruções ======
+
+# Sequências mais frequentes do código gerado (medidas com --profile nos programas
+# de inputs/ e em programas de teste com ciclos e arrays) fundidas ao carregar numa
+# só instrução com os operandos combinados:
+#   jcmpg/jcmpl  'pushg a; pushg b; infeq; jz L' (teste do FOR e dos ciclos)
+#   incg/incl    'pushg v; pushi k; add; storeg v' (incrementos)
+#   loadgx       'pushgp; [pushi B; padd;] pushg i; pushi k; sub; loadn' (a[i])
+#   indexgx      a mesma sequência sem 'loadn' (endereço e índice para 'storen')
+# A instrução fundida ocupa a posição da primeira e as restantes ficam no código,
+# saltadas na execução; os índices dos rótulos e dos retornos não mudam. Uma
+# sequência só é fundida se nenhum salto entrar a meio dela.
+
+# Comparações que podem preceder 'jz' numa superinstrução
+fused_comparisons = {
+    'inf': operator.lt, 'infeq': operator.le, 'sup': operator.gt, 'supeq': operator.ge, 'equal': operator.eq,
+}
+
+# Devolve (nº de instruções, instrução fundida) ou None
+def match_compare_jump(code, index):
+    window = code[index:index + 4]
+    if len(window) < 4:
+        return None
+    (load, a), (second, b), (compare, _), (jump, target) = window
+    if load not in ('pushg', 'pushl') or second != load or compare not in fused_comparisons or jump != 'jz':
+        return None
+    name = 'jcmpg' if load == 'pushg' else 'jcmpl'
+    return 4, (name, (a, b, fused_comparisons[compare], target))
+
+def match_increment(code, index):
+    window = code[index:index + 4]
+    if len(window) < 4:
+        return None
+    (load, slot), (push, step), (add, _), (store, target) = window
+    stores = {'pushg': 'storeg', 'pushl': 'storel'}
+    if load not in stores or push != 'pushi' or add not in ('add', 'padd') or store != stores[load] or target != slot:
+        return None
+    return 4, ('incg' if load == 'pushg' else 'incl', (slot, step))
+
+def match_array_index(code, index):
+    window = code[index:index + 7]
+    ops = [op for op, _ in window]
+    if ops[:1] != ['pushgp']:
+        return None
+    base, start = 0, 1
+    if ops[1:3] == ['pushi', 'padd']:
+        base, start = window[1][1], 3
+    if ops[start:start + 2] != ['pushg', 'pushi'] or ops[start + 2:start + 3] not in (['sub'], ['add']):
+        return None
+    slot, shift = window[start][1], window[start + 1][1]
+    shift = -shift if ops[start + 2] == 'sub' else shift
+    if ops[start + 3:start + 4] == ['loadn']:
+        return start + 4, ('loadgx', (slot, base + shift, start + 3))
+    return start + 3, ('indexgx', (base, slot, shift, start + 2))
+
+superinstruction_patterns = [match_compare_jump, match_increment, match_array_index]
+
+# Devolve uma cópia do código com as superinstruções fundidas
+def fuse_superinstructions(code, labels):
+    targets = set(labels.values())
+    fused = list(code)
+    index = 0
+    while index < len(code):
+        for match in superinstruction_patterns:
+            found = match(code, index)
+            if found is not None and not any(k in targets for k in range(index + 1, index + found[0])):
+                fused[index] = found[1]
+                index += found[0]
+                break
+        else:
+            index += 1
+    return fused
+
+# ====== Execução ======
+
+# Executa o programa instrução a instrução; devolve o número de instruções executadas
+# (uma superinstrução conta as instruções que fundiu). Com 'counters' (um dicionário)
+# guarda em 'dispatches' o nº de instruções de facto despachadas.
+# Com 'profile' (um dicionário) regista execuções e tempo por instrução.
+# Com 'integer_stack', 'code' deve vir de integer_only_code e a pilha (globais
+# incluídas) é um array('q') em vez de uma lista de objectos; com 'stack_size' (limite
+# estático) esse array é reservado de uma vez (ver execute_preallocated).
+def execute(code, stdin=None, stdout=None, max_steps=None, profile=None, integer_stack=False, counters=None,
+            stack_size=None):
+    if integer_stack and stack_size is not None and profile is None:
+        return execute_preallocated(code, stack_size, stdin, stdout, max_steps, counters)
+    stdin = stdin if stdin is not None else sys.stdin
+    stdout = stdout if stdout is not None else sys.stdout
+    output = OutputBuffer(stdout)
+    write = output.write
+    stack = array('q') if integer_stack else []
+    push = stack.append
+    pop = stack.pop
+    calls = []
+    fp = 0
+    pc = 0
+    steps = 0
+    skipped = 0
+    limit = max_steps if max_steps is not None else float('inf')
+    counts = times = None
+    max_depth = 0
+    if profile is not None:
+        counts = profile['counts'] = [0] * len(code)
+        times = profile['times'] = [0.0] * len(code)
+        clock = time.perf_counter
+        last_time = clock()
+
+    try:
+        while True:
+            if steps >= limit:
+                raise EWVMError(f"Limite de {max_steps} instruções excedido.")
+            try:
+                op, arg = code[pc]
+            except IndexError:
+                raise EWVMError(f"Fim do código atingido sem 'stop' (pc={pc}).")
+            if counts is not None:
+                now = clock()
+                if steps:
+                    times[prev_pc] += now - last_time
+                last_time = now
+                prev_pc = pc
+                counts[pc] += 1
+                if len(stack) > max_depth:
+                    max_depth = len(stack)
+            pc += 1
+            steps += 1
+            try:
+                if op == 'pushi' or op == 'pushf' or op == 'pushs':
+                    push(arg)
+                elif op == 'pushg':
+                    push(stack[arg])
+                elif op == 'storeg':
+                    stack[arg] = pop()
+                elif op == 'pushl':
+                    push(stack[fp + arg])
+                elif op == 'storel':
+                    stack[fp + arg] = pop()
+                elif op == 'jcmpg':
+                    a, b, test, target = arg
+                    pc = pc + 3 if test(stack[a], stack[b]) else target
+                    steps += 3
+                    skipped += 3
+                elif op == 'incg':
+                    stack[arg[0]] += arg[1]
+                    pc += 3
+                    steps += 3
+                    skipped += 3
+                elif op == 'loadgx':
+                    push(stack[stack[arg[0]] + arg[1]])
+                    pc += arg[2]
+                    steps += arg[2]
+                    skipped += arg[2]
+                elif op == 'indexgx':
+                    push(arg[0])
+                    push(stack[arg[1]] + arg[2])
+                    pc += arg[3]
+                    steps += arg[3]
+                    skipped += arg[3]
+                elif op == 'jcmpl':
+                    a, b, test, target = arg
+                    pc = pc + 3 if test(stack[fp + a], stack[fp + b]) else target
+                    steps += 3
+                    skipped += 3
+                elif op == 'incl':
+                    stack[fp + arg[0]] += arg[1]
+                    pc += 3
+                    steps += 3
+                    skipped += 3
+                elif op == 'add':
+                    b = pop(); stack[-1] = stack[-1] + b
+                elif op == 'sub':
+                    b = pop(); stack[-1] = stack[-1] - b
+                elif op == 'mul':
+                    b = pop(); stack[-1] = stack[-1] * b
+                elif op == 'div':
+                    b = pop(); stack[-1] = int_div(stack[-1], b)
+                elif op == 'mod':
+                    b = pop(); stack[-1] = int_mod(stack[-1], b)
+                elif op == 'inf':
+                    b = pop(); stack[-1] = int(stack[-1] < b)
+                elif op == 'infeq':
+                    b = pop(); stack[-1] = int(stack[-1] <= b)
+                elif op == 'sup':
+                    b = pop(); stack[-1] = int(stack[-1] > b)
+                elif op == 'supeq':
+                    b = pop(); stack[-1] = int(stack[-1] >= b)
+                elif op == 'equal':
+                    b = pop(); stack[-1] = int(stack[-1] == b)
+                elif op == 'not':
+                    stack[-1] = int(not stack[-1])
+                elif op == 'and':
+                    b = pop(); stack[-1] = int(bool(stack[-1]) and bool(b))
+                elif op == 'or':
+                    b = pop(); stack[-1] = int(bool(stack[-1]) or bool(b))
+                elif op == 'jz':
+                    if pop() == 0:
+                        pc = arg
+                elif op == 'jump':
+                    pc = arg
+                elif op == 'pushgp':
+                    push(0)
+                elif op == 'pushfp':
+                    push(fp)
+                elif op == 'padd':
+                    b = pop(); stack[-1] = stack[-1] + b
+                elif op == 'loadn':
+                    n = pop(); stack[-1] = stack[stack[-1] + n]
+                elif op == 'storen':
+                    v = pop(); n = pop(); a = pop()
+                    stack[a + n] = v
+                elif op == 'load':
+                    stack[-1] = stack[stack[-1] + arg]
+                elif op == 'store':
+                    v = pop(); a = pop()
+                    stack[a + arg] = v
+                elif op == 'fadd':
+                    b = pop(); stack[-1] = stack[-1] + b
+                elif op == 'fsub':
+                    b = pop(); stack[-1] = stack[-1] - b
+                elif op == 'fmul':
+                    b = pop(); stack[-1] = stack[-1] * b
+                elif op == 'fdiv':
+                    b = pop(); stack[-1] = stack[-1] / b
+                elif op == 'finf':
+                    b = pop(); stack[-1] = int(stack[-1] < b)
+                elif op == 'finfeq':
+                    b = pop(); stack[-1] = int(stack[-1] <= b)
+                elif op == 'fsup':
+                    b = pop(); stack[-1] = int(stack[-1] > b)
+                elif op == 'fsupeq':
+                    b = pop(); stack[-1] = int(stack[-1] >= b)
+                elif op == 'itof':
+                    stack[-1] = float(stack[-1])
+                elif op == 'ftoi':
+                    stack[-1] = int(stack[-1])
+                elif op == 'writei':
+                    write(str(pop()))
+                elif op == 'writef':
+                    write(format_float(pop()))
+                elif op == 'writes':
+                    write(pop())
+                elif op == 'writeln':
+                    output.newline()
+                elif op == 'writec':
+                    write(arg)
+                    pc += 1
+                    steps += 1
+                    skipped += 1
+                elif op == 'readi':
+                    output.flush()
+                    push(str_to_int(stdin.readline()))
+                    pc += 1
+                    steps += 1
+                    skipped += 1
+                elif op == 'read':
+                    output.flush()
+                    line = stdin.readline()
+                    push(line[:-1] if line.endswith('\n') else line)
+                elif op == 'atoi':
+                    stack[-1] = str_to_int(stack[-1])
+                elif op == 'atof':
+                    stack[-1] = str_to_float(stack[-1])
+                elif op == 'strlen':
+                    stack[-1] = len(stack[-1])
+                elif op == 'charat':
+                    n = pop(); stack[-1] = ord(stack[-1][n])
+                elif op == 'chrcode':
+                    stack[-1] = ord(stack[-1][0])
+                elif op == 'pushn':
+                    stack.extend([0] * arg)
+                elif op == 'pop':
+                    del stack[len(stack) - arg:]
+                elif op == 'dup':
+                    stack.extend(stack[len(stack) - arg:])
+                elif op == 'swap':
+                    stack[-1], stack[-2] = stack[-2], stack[-1]
+                elif op == 'pusha':
+                    push(arg)
+                elif op == 'call':
+                    target = pop()
+                    calls.append((pc, fp))
+                    fp = len(stack)
+                    pc = target
+                elif op == 'return':
+                    del stack[fp:]
+                    pc, fp = calls.pop()
+                elif op == 'start':
+                    fp = len(stack)
+                elif op == 'nop':
+                    pass
+                elif op == 'stop':
+                    break
+                elif op == 'err':
+                    raise EWVMError(f"Instrução err: {arg}")
+                else:
+                    raise EWVMError(f"Instrução desconhecida '{op}'.")
+            except EWVMError:
+                raise
+            except (IndexError, TypeError, ValueError, ZeroDivisionError, OverflowError) as e:
+                raise EWVMError(f"Erro na instrução {pc - 1} ({op}): {e}")
+    finally:
+        output.flush()
+        if counters is not None:
+            counters['dispatches'] = steps - skipped
+        if profile is not None:
+            profile['max_stack'] = max_depth
+    return steps
+
+# Pilha de inteiros com o tamanho fixo 'stack_size' (o limite estático dos cabeçalhos
+# '//stack'), reservada de uma vez: os valores são escritos em stack[sp] em vez de
+# acrescentados, por isso o array('q') nunca cresce nem verifica o espaço a cada 'push'.
+# Um limite errado aparece como erro de índice. 'code' vem de integer_only_code.
+def execute_preallocated(code, stack_size, stdin=None, stdout=None, max_steps=None, counters=None):
+    stdin = stdin if stdin is not None else sys.stdin
+    stdout = stdout if stdout is not None else sys.stdout
+    output = OutputBuffer(stdout)
+    write = output.write
+    stack = array('q', bytes(8 * stack_size))
+    zeros = array('q', bytes(8 * stack_size))
+    sp = 0
+    calls = []
+    fp = 0
+    pc = 0
+    steps = 0
+    skipped = 0
+    limit = max_steps if max_steps is not None else float('inf')
+
+    try:
+        while True:
+            if steps >= limit:
+                raise EWVMError(f"Limite de {max_steps} instruções excedido.")
+            try:
+                op, arg = code[pc]
+            except IndexError:
+                raise EWVMError(f"Fim do código atingido sem 'stop' (pc={pc}).")
+            pc += 1
+            steps += 1
+            try:
+                if op == 'pushi':
+                    stack[sp] = arg; sp += 1
+                elif op == 'pushg':
+                    stack[sp] = stack[arg]; sp += 1
+                elif op == 'storeg':
+                    sp -= 1; stack[arg] = stack[sp]
+                elif op == 'pushl':
+                    stack[sp] = stack[fp + arg]; sp += 1
+                elif op == 'storel':
+                    sp -= 1; stack[fp + arg] = stack[sp]
+                elif op == 'jcmpg':
+                    a, b, test, target = arg
+                    pc = pc + 3 if test(stack[a], stack[b]) else target
+                    steps += 3
+                    skipped += 3
+                elif op == 'incg':
+                    stack[arg[0]] += arg[1]
+                    pc += 3
+                    steps += 3
+                    skipped += 3
+                elif op == 'loadgx':
+                    stack[sp] = stack[stack[arg[0]] + arg[1]]; sp += 1
+                    pc += arg[2]
+                    steps += arg[2]
+                    skipped += arg[2]
+                elif op == 'indexgx':
+                    stack[sp] = arg[0]
+                    stack[sp + 1] = stack[arg[1]] + arg[2]
+                    sp += 2
+                    pc += arg[3]
+                    steps += arg[3]
+                    skipped += arg[3]
+                elif op == 'jcmpl':
+                    a, b, test, target = arg
+                    pc = pc + 3 if test(stack[fp + a], stack[fp + b]) else target
+                    steps += 3
+                    skipped += 3
+                elif op == 'incl':
+                    stack[fp + arg[0]] += arg[1]
+                    pc += 3
+                    steps += 3
+                    skipped += 3
+                elif op == 'add' or op == 'padd':
+                    sp -= 1; stack[sp - 1] = stack[sp - 1] + stack[sp]
+                elif op == 'sub':
+                    sp -= 1; stack[sp - 1] = stack[sp - 1] - stack[sp]
+                elif op == 'mul':
+                    sp -= 1; stack[sp - 1] = stack[sp - 1] * stack[sp]
+                elif op == 'div':
+                    sp -= 1; stack[sp - 1] = int_div(stack[sp - 1], stack[sp])
+                elif op == 'mod':
+                    sp -= 1; stack[sp - 1] = int_mod(stack[sp - 1], stack[sp])
+                elif op == 'inf':
+                    sp -= 1; stack[sp - 1] = int(stack[sp - 1] < stack[sp])
+                elif op == 'infeq':
+                    sp -= 1; stack[sp - 1] = int(stack[sp - 1] <= stack[sp])
+                elif op == 'sup':
+                    sp -= 1; stack[sp - 1] = int(stack[sp - 1] > stack[sp])
+                elif op == 'supeq':
+                    sp -= 1; stack[sp - 1] = int(stack[sp - 1] >= stack[sp])
+                elif op == 'equal':
+                    sp -= 1; stack[sp - 1] = int(stack[sp - 1] == stack[sp])
+                elif op == 'not':
+                    stack[sp - 1] = int(not stack[sp - 1])
+                elif op == 'and':
+                    sp -= 1; stack[sp - 1] = int(bool(stack[sp - 1]) and bool(stack[sp]))
+                elif op == 'or':
+                    sp -= 1; stack[sp - 1] = int(bool(stack[sp - 1]) or bool(stack[sp]))
+                elif op == 'jz':
+                    sp -= 1
+                    if stack[sp] == 0:
+                        pc = arg
+                elif op == 'jump':
+                    pc = arg
+                elif op == 'pushgp':
+                    stack[sp] = 0; sp += 1
+                elif op == 'pushfp':
+                    stack[sp] = fp; sp += 1
+                elif op == 'loadn':
+                    sp -= 1; stack[sp - 1] = stack[stack[sp - 1] + stack[sp]]
+                elif op == 'storen':
+                    sp -= 3; stack[stack[sp] + stack[sp + 1]] = stack[sp + 2]
+                elif op == 'load':
+                    stack[sp - 1] = stack[stack[sp - 1] + arg]
+                elif op == 'store':
+                    sp -= 2; stack[stack[sp] + arg] = stack[sp + 1]
+                elif op == 'writei':
+                    sp -= 1; write(str(stack[sp]))
+                elif op == 'writeln':
+                    output.newline()
+                elif op == 'writec':
+                    write(arg)
+                    pc += 1
+                    steps += 1
+                    skipped += 1
+                elif op == 'readi':
+                    output.flush()
+                    stack[sp] = str_to_int(stdin.readline()); sp += 1
+                    pc += 1
+                    steps += 1
+                    skipped += 1
+                elif op == 'pushn':
+                    stack[sp:sp + arg] = zeros[:arg]; sp += arg
+                elif op == 'pop':
+                    sp -= arg
+                elif op == 'dup':
+                    stack[sp:sp + arg] = stack[sp - arg:sp]; sp += arg
+                elif op == 'swap':
+                    stack[sp - 1], stack[sp - 2] = stack[sp - 2], stack[sp - 1]
+                elif op == 'pusha':
+                    stack[sp] = arg; sp += 1
+                elif op == 'call':
+                    sp -= 1
+                    calls.append((pc, fp))
+                    fp = sp
+                    pc = stack[sp]
+                elif op == 'return':
+                    sp = fp
+                    pc, fp = calls.pop()
+                elif op == 'start':
+                    fp = sp
+                elif op == 'nop':
+                    pass
+                elif op == 'stop':
+                    break
+                elif op == 'err':
+                    raise EWVMError(f"Instrução err: {arg}")
+                else:
+                    raise EWVMError(f"Instrução desconhecida '{op}'.")
+            except EWVMError:
+                raise
+            except (IndexError, TypeError, ValueError, ZeroDivisionError, OverflowError) as e:
+                raise EWVMError(f"Erro na instrução {pc - 1} ({op}): {e}")
+    finally:
+        output.flush()
+        if counters is not None:
+            counters['dispatches'] = steps - skipped
+    return steps
+
+# Compara a pilha genérica com a de inteiros: tempo médio, instruções por segundo e
+# pico de memória alocada (medido numa execução à parte, com tracemalloc)
+def benchmark_stack_modes(code, labels, input_text="", repeat=3, out=None, stack_size=None):
+    import io
+    import tracemalloc
+    out = out if out is not None else sys.stdout
+    specialized = integer_only_code(code, labels)
+    # Os dois modos correm como numa execução normal, com superinstruções
+    modes = [('list', fuse_superinstructions(code, labels), False)]
+    if specialized is None:
+        out.write("O programa usa strings ou reais: só a pilha genérica é aplicável.\n")
+    else:
+        modes.append(('int', fuse_superinstructions(specialized, labels), True))
+    out.write(f"{'pilha':<6} {'tempo (ms)':>11} {'instr/s':>12} {'pico (KiB)':>11}\n")
+    for name, mode_code, integer_stack in modes:
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            steps = execute(mode_code, stdin=io.StringIO(input_text), stdout=io.StringIO(),
+                            integer_stack=integer_stack, stack_size=stack_size)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        tracemalloc.start()
+        execute(mode_code, stdin=io.StringIO(input_text), stdout=io.StringIO(), integer_stack=integer_stack,
+                stack_size=stack_size)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        out.write(f"{name:<6} {best * 1000:>11.3f} {steps / best:>12.0f} {peak / 1024:>11.1f}\n")
+
+# ====== Perfil de execução ======
+
+# Nome da função a que pertence cada instrução (rótulos alvo de 'pusha'; o resto é 'main')
+def function_names(code, labels):
+    targets = {arg for op, arg in code if op == 'pusha'}
+    names_by_index = {}
+    for name, index in labels.items():
+        if index in targets:
+            names_by_index.setdefault(index, name)
+    names = []
+    current = 'main'
+    for index in range(len(code)):
+        current = names_by_index.get(index, current)
+        names.append(current)
+    return names
+
+# Limite estático do tamanho da pilha: globais mais a pior cadeia de chamadas, somando
+# a profundidade '//stack' de cada rotina. None se faltar um cabeçalho ou houver recursão.
+def static_stack_bound(code, labels, stack_depths):
+    names = function_names(code, labels)
+    routine_depth = {}
+    for index, depth in stack_depths.items():
+        if index < len(code):
+            routine_depth[names[index]] = max(routine_depth.get(names[index], 0), depth)
+    if set(names) - set(routine_depth):
+        return None
+
+    # Chamadas directas ('pusha F; call') e indirectas (tabelas de saltos dos CASE)
+    indirect = {names[arg] for i, (op, arg) in enumerate(code)
+                if op == 'pusha' and (i + 1 == len(code) or code[i + 1][0] != 'call')}
+    callees = {name: set() for name in routine_depth}
+    for i, (op, _) in enumerate(code):
+        if op == 'call':
+            if i > 0 and code[i - 1][0] == 'pusha':
+                callees[names[i]].add(names[code[i - 1][1]])
+            else:
+                callees[names[i]] |= indirect
+
+    bounds = {}
+    def bound(name, active):
+        if name in active:
+            return None
+        if name not in bounds:
+            inner = [bound(callee, active | {name}) for callee in callees[name]]
+            bounds[name] = None if None in inner else routine_depth[name] + max(inner, default=0)
+        return bounds[name]
+
+    main_bound = bound('main', frozenset())
+    if main_bound is None:
+        return None
+    globals_size = 0
+    for op, arg in code:
+        if op == 'start':
+            break
+        globals_size += arg if op == 'pushn' else 1
+    return globals_size + main_bound
+
+# Lê o mapa de fonte escrito por pascal_gt.py --map
+def load_source_map(filename):
+    import json
+    with open(filename, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+# Soma execuções e tempo por chave (linha ou função)
+def aggregate_profile(profile, keys):
+    totals = {}
+    for index, key in enumerate(keys):
+        count = profile['counts'][index]
+        if count:
+            entry = totals.setdefault(key, [0, 0.0])
+            entry[0] += count
+            entry[1] += profile['times'][index]
+    return sorted(totals.items(), key=lambda item: item[1][1], reverse=True)
+
+# Escreve as N linhas e funções mais quentes
+def print_profile(code, labels, profile, source_map=None, top=10, out=None):
+    out = out if out is not None else sys.stderr
+    total_time = sum(profile['times']) or 1.0
+    source_text = []
+    if source_map is not None:
+        lines = source_map['lines'][:len(code)]
+        lines += [0] * (len(code) - len(lines))
+        try:
+            with open(source_map['source'], 'r', encoding='utf-8') as f:
+                source_text = f.read().splitlines()
+        except OSError:
+            pass
+        keys = [f"linha {n}" if n else "linha ?" for n in lines]
+        title = "Linhas Pascal mais quentes"
+    else:
+        keys = [f"instrução {i} ({op})" for i, (op, _) in enumerate(code)]
+        title = "Instruções mais quentes (sem mapa de fonte)"
+
+    print(f"{title}:", file=out)
+    print(f"  {'':<24} {'execuções':>12} {'tempo (ms)':>12} {'%':>6}", file=out)
+    for key, (count, elapsed) in aggregate_profile(profile, keys)[:top]:
+        text = ""
+        if source_text and key != "linha ?":
+            n = int(key.split()[1])
+            if 0 < n <= len(source_text):
+                text = "  " + source_text[n - 1].strip()
+        print(f"  {key:<24} {count:>12} {elapsed * 1000:>12.3f} {elapsed / total_time * 100:>5.1f}%{text}", file=out)
+
+    print("Funções mais quentes:", file=out)
+    for key, (count, elapsed) in aggregate_profile(profile, function_names(code, labels))[:top]:
+        print(f"  {key:<24} {count:>12} {elapsed * 1000:>12.3f} {elapsed / total_time * 100:>5.1f}%", file=out)
+    if 'max_stack' in profile:
+        print(f"Pilha: máximo observado {profile['max_stack']}", file=out)
+
+# ====== Função principal para executar um programa EWVM ======
+def main(argv=None):
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Executa um programa EWVM.")
+    arg_parser.add_argument('program', nargs='?', default='output.txt')
+    arg_parser.add_argument('--backend', choices=('vm', 'py'), default='vm',
+                            help="vm: interpretador; py: tradução para Python")
+    arg_parser.add_argument('--input', help="ficheiro usado como stdin do programa")
+    arg_parser.add_argument('--stats', action='store_true',
+                            help="mostra instruções executadas e tempo em stderr")
+    arg_parser.add_argument('--profile', action='store_true',
+                            help="conta execuções e tempo por linha Pascal e por função (usa o interpretador)")
+    arg_parser.add_argument('--map', help="mapa de fonte (por defeito <programa>.map, se existir)")
+    arg_parser.add_argument('--top', type=int, default=10, help="nº de pontos quentes a mostrar")
+    arg_parser.add_argument('--stack', choices=('list', 'int'), default='list',
+                            help="list: pilha genérica (por defeito, a mais rápida); int: array('q') se o "
+                                 "programa só usar inteiros (menos memória, mas mais lenta)")
+    arg_parser.add_argument('--bench-stack', action='store_true',
+                            help="compara o tempo e a memória das duas pilhas (sem mostrar a saída)")
+    arg_parser.add_argument('--repeat', type=int, default=3, help="repetições de --bench-stack")
+    arg_parser.add_argument('--no-fuse', action='store_true',
+                            help="executa sem superinstruções (cada instrução é despachada)")
+    args = arg_parser.parse_args(argv)
+
+    # Como script, este ficheiro é o módulo '__main__' e ewvm_py importa-o de novo
+    # como 'ewvm': os erros da tradução vêm com a classe EWVMError desse módulo
+    import ewvm
+    errors = (EWVMError, ewvm.EWVMError)
+
+    stack_depths = {}
+    try:
+        code, labels = load_program(args.program, stack_depths)
+    except FileNotFoundError:
+        print(f"Erro: Ficheiro '{args.program}' não encontrado.")
+        return 1
+    except errors as e:
+        print(f"Erro: {e}")
+        return 1
+
+    source_map = None
+    if args.profile:
+        import os
+        map_filename = args.map or os.path.splitext(args.program)[0] + '.map'
+        if args.map or os.path.exists(map_filename):
+            try:
+                source_map = load_source_map(map_filename)
+            except (OSError, ValueError) as e:
+                print(f"Aviso: Não foi possível ler o mapa de fonte '{map_filename}': {e}", file=sys.stderr)
+
+    stack_bound = static_stack_bound(code, labels, stack_depths)
+    if args.bench_stack:
+        input_text = sys.stdin.read() if not args.input else open(args.input, 'r', encoding='utf-8').read()
+        try:
+            benchmark_stack_modes(code, labels, input_text, args.repeat, stack_size=stack_bound)
+        except errors as e:
+            print(f"Erro de execução: {e}")
+            return 1
+        return 0
+
+    integer_code = None
+    if args.stack == 'int':
+        integer_code = integer_only_code(code, labels)
+        if integer_code is None:
+            print("Aviso: o programa usa strings ou reais; a usar a pilha genérica.", file=sys.stderr)
+
+    # O perfil conta cada instrução, por isso corre sobre o código sem fusões
+    run_code = integer_code if integer_code is not None else code
+    counters = None
+    if not args.no_fuse and not args.profile:
+        run_code = fuse_superinstructions(run_code, labels)
+        counters = {}
+
+    profile = {} if args.profile else None
+    stdin = open(args.input, 'r', encoding='utf-8') if args.input else sys.stdin
+    try:
+        started = time.perf_counter()
+        if args.backend == 'py' and not args.profile:
+            import ewvm_py
+            steps = ewvm_py.run(code, labels, stdin=stdin)
+        else:
+            steps = execute(run_code, stdin=stdin, profile=profile, integer_stack=integer_code is not None,
+                            counters=counters, stack_size=stack_bound)
+        elapsed = time.perf_counter() - started
+    except errors as e:
+        sys.stdout.flush()
+        print(f"Erro de execução: {e}")
+        return 1
+    finally:
+        if args.input:
+            stdin.close()
+
+    if args.stats:
+        if steps is not None:
+            print(f"Instruções executadas: {steps}", file=sys.stderr)
+        if counters and steps:
+            dispatches = counters['dispatches']
+            print(f"Despachos: {dispatches} ({(steps - dispatches) / steps * 100:.1f}% menos com superinstruções)",
+                  file=sys.stderr)
+        print(f"Tempo: {elapsed * 1000:.3f} ms", file=sys.stderr)
+        if stack_bound is not None:
+            print(f"Pilha: limite estático {stack_bound}", file=sys.stderr)
+        else:
+            print("Pilha: sem limite estático (recursão ou cabeçalhos '//stack' em falta)", file=sys.stderr)
+    if profile is not None:
+        print_profile(code, labels, profile, source_map, args.top)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+import io
+import os
+import signal
+import sys
+import time
+import ewvm
+
+# ====== Execução em lote ======
+
+# Corre um programa EWVM já compilado contra uma directoria de casos de teste.
+# Cada caso é um ficheiro '<nome>.in' usado como stdin; se existir '<nome>.out',
+# a saída é comparada com ele. O programa é carregado uma vez no processo
+# principal e, em cada processo do pool, uma vez na inicialização. Com um tempo
+# limite, um caso que não termine é interrompido por SIGALRM e conta como falha.
+
+# Estado de cada processo do pool (preenchido por init_worker)
+worker_code = None
+worker_make = None
+worker_timeout = None
+
+class CaseTimeout(Exception):
+    pass
+
+def on_timeout(signum, frame):
+    raise CaseTimeout()
+
+# Procura os casos '<nome>.in' da directoria; devolve [(nome, ficheiro .in, ficheiro .out ou None)]
+def find_cases(directory):
+    cases = []
+    for filename in sorted(os.listdir(directory)):
+        name, extension = os.path.splitext(filename)
+        if extension != '.in':
+            continue
+        expected = os.path.join(directory, name + '.out')
+        cases.append((name, os.path.join(directory, filename), expected if os.path.exists(expected) else None))
+    return cases
+
+def init_worker(code, backend, timeout=None):
+    global worker_code, worker_make, worker_timeout
+    worker_code = code
+    worker_timeout = timeout
+    if timeout:
+        signal.signal(signal.SIGALRM, on_timeout)
+    if backend == 'py':
+        import ewvm_py
+        worker_make = ewvm_py.compile_program(code)
+
+# Executa um caso; devolve (nome, saída, tempo em segundos, mensagem de erro ou None)
+def run_case(case):
+    name, input_filename, _ = case
+    with open(input_filename, 'r', encoding='utf-8') as f:
+        stdin = io.StringIO(f.read())
+    stdout = io.StringIO()
+    error = None
+    started = time.perf_counter()
+    try:
+        if worker_timeout:
+            signal.setitimer(signal.ITIMER_REAL, worker_timeout)
+        if worker_make is not None:
+            import ewvm_py
+            ewvm_py.run(worker_code, stdin=stdin, stdout=stdout, make=worker_make)
+        else:
+            ewvm.execute(worker_code, stdin=stdin, stdout=stdout)
+    except ewvm.EWVMError as e:
+        error = str(e)
+    except CaseTimeout:
+        error = f"tempo limite de {worker_timeout} s excedido"
+    finally:
+        if worker_timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    elapsed = time.perf_counter() - started
+    return name, stdout.getvalue(), elapsed, error
+
+# Percentil por interpolação linear sobre valores ordenados
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+# Corre todos os casos num pool de 'jobs' processos (1: no próprio processo), com
+# 'timeout' segundos por caso (None: sem limite); devolve a lista de resultados pela
+# ordem dos casos e o tempo total
+def run_batch(code, cases, jobs=None, backend='vm', timeout=None):
+    started = time.perf_counter()
+    if jobs == 1:
+        previous_handler = signal.getsignal(signal.SIGALRM) if timeout else None
+        init_worker(code, backend, timeout)
+        try:
+            results = [run_case(case) for case in cases]
+        finally:
+            if timeout:
+                signal.signal(signal.SIGALRM, previous_handler)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        jobs = jobs or os.cpu_count() or 1
+        chunksize = max(1, len(cases) // (jobs * 8))
+        with ProcessPoolExecutor(jobs, initializer=init_worker, initargs=(code, backend, timeout)) as pool:
+            results = list(pool.map(run_case, cases, chunksize=chunksize))
+    return results, time.perf_counter() - started
+
+# Compara os resultados com as saídas esperadas e escreve o relatório; devolve o nº de falhas
+def report(cases, results, wall_time, out=None, show=5):
+    import difflib
+    out = out if out is not None else sys.stdout
+    passed = failed = unchecked = 0
+    failures = []
+    for (name, _, expected_filename), (_, output, _, error) in zip(cases, results):
+        if error is not None:
+            failed += 1
+            failures.append((name, [f"erro de execução: {error}"]))
+            continue
+        if expected_filename is None:
+            unchecked += 1
+            continue
+        with open(expected_filename, 'r', encoding='utf-8') as f:
+            expected = f.read()
+        if output == expected:
+            passed += 1
+        else:
+            failed += 1
+            diff = difflib.unified_diff(expected.splitlines(), output.splitlines(),
+                                        'esperado', 'obtido', lineterm='', n=1)
+            failures.append((name, list(diff)[2:12]))
+
+    for name, lines in failures[:show]:
+        out.write(f"FALHOU {name}\n")
+        for line in lines:
+            out.write(f"  {line}\n")
+    if len(failures) > show:
+        out.write(f"... mais {len(failures) - show} falhas\n")
+
+    latencies = sorted(elapsed for _, _, elapsed, _ in results)
+    out.write(f"Casos: {len(cases)} (passaram {passed}, falharam {failed}, sem saída esperada {unchecked})\n")
+    out.write(f"Tempo total: {wall_time:.3f} s ({len(cases) / wall_time if wall_time else 0:.1f} casos/s)\n")
+    out.write("Latência por caso (ms): " + ", ".join(
+        f"p{int(fraction * 100)} {percentile(latencies, fraction) * 1000:.3f}"
+        for fraction in (0.5, 0.9, 0.99)) + f", máx {latencies[-1] * 1000 if latencies else 0:.3f}\n")
+    return failed
+
+def main(argv=None):
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Executa um programa EWVM contra uma directoria de casos de teste.")
+    arg_parser.add_argument('program', help="programa EWVM compilado")
+    arg_parser.add_argument('cases', help="directoria com <nome>.in (stdin) e <nome>.out (saída esperada)")
+    arg_parser.add_argument('-j', '--jobs', type=int, default=None,
+                            help="nº de processos (por defeito, um por CPU; 1 corre no próprio processo)")
+    arg_parser.add_argument('--backend', choices=('vm', 'py'), default='vm',
+                            help="vm: interpretador; py: tradução para Python")
+    arg_parser.add_argument('--update', action='store_true',
+                            help="grava a saída obtida como <nome>.out em vez de comparar")
+    arg_parser.add_argument('--show', type=int, default=5, help="nº de falhas a detalhar")
+    arg_parser.add_argument('--timeout', type=float, default=None,
+                            help="segundos por caso; um caso que não termine a tempo conta como falha")
+    args = arg_parser.parse_args(argv)
+
+    try:
+        code, labels = ewvm.load_program(args.program)
+    except FileNotFoundError:
+        print(f"Erro: Ficheiro '{args.program}' não encontrado.")
+        return 1
+    except ewvm.EWVMError as e:
+        print(f"Erro: {e}")
+        return 1
+    if not os.path.isdir(args.cases):
+        print(f"Erro: Directoria '{args.cases}' não encontrada.")
+        return 1
+    cases = find_cases(args.cases)
+    if not cases:
+        print(f"Erro: Nenhum caso '.in' em '{args.cases}'.")
+        return 1
+
+    backend = args.backend
+    if backend == 'py':
+        import ewvm_py
+        try:
+            ewvm_py.compile_program(code)
+        except ewvm_py.Untranslatable as e:
+            print(f"Aviso: programa não traduzível para Python ({e}); a usar o interpretador.", file=sys.stderr)
+            backend = 'vm'
+    if backend == 'vm':
+        code = ewvm.fuse_superinstructions(code, labels)
+
+    timeout = args.timeout
+    if timeout is not None and timeout <= 0:
+        print("Erro: --timeout deve ser positivo.")
+        return 1
+    if timeout and not hasattr(signal, 'setitimer'):
+        print("Aviso: --timeout não é suportado nesta plataforma (sem SIGALRM); ignorado.", file=sys.stderr)
+        timeout = None
+
+    results, wall_time = run_batch(code, cases, args.jobs, backend, timeout)
+    if args.update:
+        errors = 0
+        for (_, input_filename, _), (name, output, _, error) in zip(cases, results):
+            if error is None:
+                with open(os.path.splitext(input_filename)[0] + '.out', 'w', encoding='utf-8') as f:
+                    f.write(output)
+            else:
+                errors += 1
+                print(f"Erro no caso {name}: {error}")
+        print(f"Saídas gravadas para {len(cases) - errors} casos.")
+        return 1 if errors else 0
+    return 1 if report(cases, results, wall_time, show=args.show) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,752 @@
+import sys
+import time
+
+import ewvm
+
+# ====== Optimizações sobre o código EWVM gerado ======
+
+# As optimizações trabalham sobre o texto produzido pelas acções de pascal_gt.py,
+# uma função (ou o programa principal) de cada vez. Os marcadores '//line N' do
+# mapa de fonte são preservados junto da instrução que os segue.
+
+# Erro detectado pela verificação do grafo de fluxo depois de uma passagem
+class VerificationError(Exception):
+    pass
+
+# Operações sem efeitos laterais: número de operandos retirados da pilha
+pure_operations = {
+    'add': 2, 'sub': 2, 'mul': 2, 'div': 2, 'mod': 2, 'padd': 2,
+    'inf': 2, 'infeq': 2, 'sup': 2, 'supeq': 2, 'equal': 2, 'and': 2, 'or': 2,
+    'fadd': 2, 'fsub': 2, 'fmul': 2, 'fdiv': 2, 'finf': 2, 'finfeq': 2, 'fsup': 2, 'fsupeq': 2,
+    'not': 1, 'itof': 1, 'ftoi': 1, 'strlen': 1, 'chrcode': 1, 'charat': 2,
+}
+
+# Folhas puras e a variável de que dependem (None para constantes)
+pure_leaves = {'pushi', 'pushf', 'pushs', 'pushgp', 'pushg', 'pushl'}
+
+# Instruções que só consomem valores da pilha, sem escrever memória
+consuming_operations = {'writei': 1, 'writef': 1, 'writes': 1, 'writeln': 0, 'nop': 0}
+
+# Instruções que terminam um bloco básico (além dos rótulos)
+block_terminators = {'jump', 'jz', 'call', 'return', 'stop', 'start'}
+
+# Instrução a partir do seu texto: [texto, op, arg, marcadores anteriores]; os rótulos têm op ':'
+def make_instruction(text, markers=None):
+    if text.endswith(':'):
+        return [text, ':', text[:-1], markers or []]
+    parts = text.split(None, 1)
+    return [text, parts[0].lower(), parts[1] if len(parts) > 1 else None, markers or []]
+
+# Separa o código em instruções, guardando os marcadores que não precedem nenhuma
+def parse_code(code):
+    instructions = []
+    pending_markers = []
+    for line in code.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped.startswith('//'):
+            pending_markers.append(stripped)
+            continue
+        instructions.append(make_instruction(stripped, pending_markers))
+        pending_markers = []
+    return instructions, pending_markers
+
+# Volta a juntar as instruções em texto
+def format_code(instructions, trailing_markers=()):
+    lines = []
+    for text, _, _, markers in instructions:
+        lines.extend(markers)
+        lines.append(text)
+    lines.extend(trailing_markers)
+    return "".join(line + "\n" for line in lines)
+
+# ====== Eliminação de subexpressões comuns ======
+
+# Valor na pilha simbólica: chave da expressão (None se desconhecida), intervalo
+# [start, end) das instruções que o calculam e variáveis de que depende
+class StackValue:
+    __slots__ = ('key', 'start', 'end', 'deps')
+
+    def __init__(self, key, start, end, deps):
+        self.key = key
+        self.start = start
+        self.end = end
+        self.deps = deps
+
+# Ocorrências de uma expressão repetida dentro de um bloco
+class ExpressionGroup:
+    def __init__(self, key, first, consumer=None):
+        self.key = key
+        self.first = first
+        self.first_consumer = consumer
+        self.uses = []
+
+    def size(self):
+        return self.first.end - self.first.start
+
+def unknown_value(index):
+    return StackValue(None, index, index, frozenset())
+
+# Percorre um bloco básico e regista as expressões repetidas.
+# 'loadn'/'storen' usam um par (endereço, índice); pares repetidos são agrupados
+# com a chave ('elem', ...) e guardados como um único endereço.
+def collect_groups(instructions, begin, end, groups):
+    stack = []
+    available = {}
+
+    def pop():
+        return stack.pop() if stack else unknown_value(index)
+
+    def invalidate(dep):
+        for key in [key for key, group in available.items() if dep in group.first.deps]:
+            del available[key]
+
+    def record(key, value, consumer=None):
+        if key in available:
+            group = available[key]
+            group.uses.append((value, consumer))
+        else:
+            group = ExpressionGroup(key, value, consumer)
+            available[key] = group
+            groups.append(group)
+
+    for index in range(begin, end):
+        _, op, arg, _ = instructions[index]
+        if op in pure_leaves:
+            if op == 'pushg':
+                deps = frozenset([('g', arg)])
+            elif op == 'pushl':
+                deps = frozenset([('l', arg)])
+            else:
+                deps = frozenset()
+            stack.append(StackValue((op, arg), index, index + 1, deps))
+        elif op in pure_operations or op == 'loadn':
+            operands = [pop() for _ in range(2 if op == 'loadn' else pure_operations[op])][::-1]
+            known = all(value.key is not None for value in operands)
+            contiguous = all(a.end == b.start for a, b in zip(operands, operands[1:]))
+            if known and contiguous and operands[-1].end == index:
+                deps = frozenset().union(*(value.deps for value in operands))
+                if op == 'loadn':
+                    address, offset = operands
+                    record(('elem', address.key, offset.key),
+                           StackValue(None, address.start, offset.end, deps), index)
+                    deps = deps | {('mem',)}
+                value = StackValue((op,) + tuple(value.key for value in operands),
+                                   operands[0].start, index + 1, deps)
+                record(value.key, value)
+                stack.append(value)
+            else:
+                stack.append(unknown_value(index))
+        elif op == 'storeg' or op == 'storel':
+            pop()
+            invalidate(('g' if op == 'storeg' else 'l', arg))
+        elif op == 'storen':
+            pop()
+            offset = pop()
+            address = pop()
+            if address.key is not None and offset.key is not None and address.end == offset.start:
+                record(('elem', address.key, offset.key),
+                       StackValue(None, address.start, offset.end, address.deps | offset.deps), index)
+            invalidate(('mem',))
+        elif op in consuming_operations:
+            for _ in range(consuming_operations[op]):
+                pop()
+        elif op == 'pop':
+            for _ in range(int(arg)):
+                pop()
+        elif op in ('read', 'pusha'):
+            stack.append(unknown_value(index))
+        elif op in ('atoi', 'atof'):
+            pop()
+            stack.append(unknown_value(index))
+        elif op == 'dup':
+            stack.extend(unknown_value(index) for _ in range(int(arg)))
+        else:
+            # Instrução de efeito desconhecido: nada do que está na pilha ou disponível é reutilizável
+            stack.clear()
+            available.clear()
+
+# Divide o código em blocos básicos: intervalos [begin, end) sem rótulos nem saltos no meio
+def basic_blocks(instructions):
+    blocks = []
+    begin = 0
+    for index, (_, op, _, _) in enumerate(instructions):
+        if op == ':':
+            if begin < index:
+                blocks.append((begin, index))
+            begin = index + 1
+        elif op in block_terminators:
+            blocks.append((begin, index + 1))
+            begin = index + 1
+    if begin < len(instructions):
+        blocks.append((begin, len(instructions)))
+    return blocks
+
+# ====== Grafo de fluxo de controlo ======
+
+# Bloco básico: intervalo [begin, end) de instruções, rótulos que o antecedem e sucessores
+class BasicBlock:
+    def __init__(self, begin, end, labels):
+        self.begin = begin
+        self.end = end
+        self.labels = labels
+        self.successors = []
+
+# Grafo de fluxo de um troço de código. Saltos para rótulos que não estão no troço
+# (ex.: o fim de um CASE noutra rotina) são registados em 'external_targets'.
+class ControlFlowGraph:
+    def __init__(self, instructions):
+        self.instructions = instructions
+        self.blocks = []
+        self.label_blocks = {}
+        self.duplicate_labels = []
+        self.jump_targets = set()
+        self.address_targets = set()
+
+        previous_end = 0
+        for begin, end in basic_blocks(instructions):
+            block = BasicBlock(begin, end, [arg for _, op, arg, _ in instructions[previous_end:begin] if op == ':'])
+            self.add_labels(block.labels)
+            self.blocks.append(block)
+            previous_end = end
+        # Rótulos no fim do troço não antecedem nenhum bloco
+        self.add_labels([arg for _, op, arg, _ in instructions[previous_end:] if op == ':'])
+
+        for number, block in enumerate(self.blocks):
+            for _, op, arg, _ in instructions[block.begin:block.end]:
+                if op in ('jump', 'jz'):
+                    self.jump_targets.add(arg)
+                elif op == 'pusha':
+                    self.address_targets.add(arg)
+            _, op, arg, _ = instructions[block.end - 1]
+            if op in ('jump', 'jz') and self.label_blocks.get(arg, len(self.blocks)) < len(self.blocks):
+                block.successors.append(self.label_blocks[arg])
+            if op not in ('jump', 'return', 'stop') and number + 1 < len(self.blocks):
+                block.successors.append(number + 1)
+        self.external_targets = self.jump_targets - set(self.label_blocks)
+
+    def add_labels(self, labels):
+        for label in labels:
+            if label in self.label_blocks:
+                self.duplicate_labels.append(label)
+            self.label_blocks[label] = len(self.blocks)
+
+    def ends_with_terminator(self):
+        last = [op for _, op, _, _ in self.instructions if op != ':']
+        return bool(last) and last[-1] in ('jump', 'return', 'stop')
+
+# Confirma que uma passagem manteve o fluxo de controlo bem formado: rótulos únicos,
+# saltos só para rótulos existentes (ou já externos), rótulos referidos preservados
+# e nenhuma rotina passa a cair para fora do fim do código
+def verify_control_flow(pass_name, before, after):
+    if after.duplicate_labels:
+        raise VerificationError(f"passagem '{pass_name}': rótulo repetido '{after.duplicate_labels[0]}'")
+    for target in sorted(after.jump_targets):
+        if target not in after.label_blocks and target not in before.external_targets:
+            raise VerificationError(f"passagem '{pass_name}': salto para rótulo inexistente '{target}'")
+    for label in sorted((before.jump_targets | before.address_targets) & set(before.label_blocks)):
+        if label not in after.label_blocks:
+            raise VerificationError(f"passagem '{pass_name}': rótulo '{label}' removido mas ainda referido")
+    if before.ends_with_terminator() and not after.ends_with_terminator():
+        raise VerificationError(f"passagem '{pass_name}': o código passa a continuar para além do fim")
+    for index, (_, op, _, _) in enumerate(after.instructions):
+        if op == 'jz' and index + 1 == len(after.instructions):
+            raise VerificationError(f"passagem '{pass_name}': 'jz' sem continuação")
+
+# Elimina subexpressões comuns dentro de cada bloco básico. A primeira ocorrência
+# de uma expressão repetida é guardada numa global temporária ('allocate_slot')
+# e as seguintes passam a ler essa global; só se aplica quando poupa instruções.
+def eliminate_common_subexpressions(instructions, allocate_slot):
+    groups = []
+    for begin, end in basic_blocks(instructions):
+        collect_groups(instructions, begin, end, groups)
+
+    # As expressões maiores têm prioridade; uma ocorrência dentro de outra já
+    # substituída deixa de contar
+    replaced_spans = []
+    inserts = {}
+    replacements = {}
+    consumer_changes = {}
+    for group in sorted((g for g in groups if g.uses), key=lambda g: -g.size()):
+        def inside_replaced(value):
+            return any(start <= value.start and value.end <= stop for start, stop in replaced_spans)
+        if inside_replaced(group.first):
+            continue
+        uses = [(value, consumer) for value, consumer in group.uses if not inside_replaced(value)]
+        is_element = group.key[0] == 'elem'
+        saved = len(uses) * (group.size() - 1) - (3 if is_element else 2)
+        if saved <= 0:
+            continue
+        slot = allocate_slot()
+        first = group.first
+        save_code = ["dup 1", f"storeg {slot}"]
+        if is_element:
+            save_code = ["padd"] + save_code
+        inserts.setdefault(first.end, []).append((group.size(), save_code))
+        for value, consumer in [(first, group.first_consumer)] + uses:
+            if is_element:
+                consumer_changes[consumer] = "load 0" if instructions[consumer][1] == 'loadn' else "store 0"
+        for value, _ in uses:
+            replacements[value.start] = (value.end, f"pushg {slot}")
+            replaced_spans.append((value.start, value.end))
+
+    if not replacements:
+        return instructions
+
+    result = []
+    index = 0
+    while index <= len(instructions):
+        for _, save_code in sorted(inserts.get(index, [])):
+            result.extend(make_instruction(line) for line in save_code)
+        if index == len(instructions):
+            break
+        if index in replacements:
+            stop, text = replacements[index]
+            markers = [marker for k in range(index, stop) for marker in instructions[k][3]]
+            result.append(make_instruction(text, markers))
+            index = stop
+            continue
+        instruction = instructions[index]
+        if index in consumer_changes:
+            instruction = make_instruction(consumer_changes[index], instruction[3])
+        result.append(instruction)
+        index += 1
+    return result
+
+# ====== Análise de funções ======
+
+# Instruções com efeitos fora da função: E/S e acessos à memória por endereço
+impure_instructions = {
+    'writei', 'writef', 'writes', 'writeln', 'read', 'pushgp', 'pushfp',
+    'loadn', 'storen', 'load', 'store', 'err',
+}
+
+# Rótulos de funções chamadas ('pusha') no código
+def called_functions(code):
+    return [arg for _, op, arg, _ in parse_code(code)[0] if op == 'pusha']
+
+# A função 'name' é pura se não tem instruções impuras, só usa as globais 'own_slots'
+# e só chama a si própria ou funções de 'pure_functions'
+def is_pure_code(name, code, own_slots, pure_functions):
+    for _, op, arg, _ in parse_code(code)[0]:
+        if op in impure_instructions:
+            return False
+        if op in ('pushg', 'storeg') and int(arg) not in own_slots:
+            return False
+        if op == 'pusha' and arg != name and arg not in pure_functions:
+            return False
+    return True
+
+# ====== Profundidade da pilha ======
+
+# Efeito de cada instrução na pilha de operandos: (valores retirados, valores postos)
+stack_effects = {
+    'pushi': (0, 1), 'pushf': (0, 1), 'pushs': (0, 1), 'pushg': (0, 1), 'pushl': (0, 1),
+    'pushgp': (0, 1), 'pushfp': (0, 1), 'pusha': (0, 1), 'read': (0, 1),
+    'storeg': (1, 0), 'storel': (1, 0), 'jz': (1, 0), 'call': (1, 0),
+    'writei': (1, 0), 'writef': (1, 0), 'writes': (1, 0),
+    'writeln': (0, 0), 'nop': (0, 0), 'start': (0, 0), 'stop': (0, 0), 'jump': (0, 0),
+    'return': (0, 0), 'err': (0, 0), ':': (0, 0),
+    'not': (1, 1), 'itof': (1, 1), 'ftoi': (1, 1), 'atoi': (1, 1), 'atof': (1, 1),
+    'strlen': (1, 1), 'chrcode': (1, 1), 'load': (1, 1),
+    'charat': (2, 1), 'loadn': (2, 1), 'swap': (2, 2), 'store': (2, 0), 'storen': (3, 0),
+}
+stack_effects.update({op: (count, 1) for op, count in pure_operations.items() if op not in stack_effects})
+
+def stack_effect(op, arg):
+    if op in ('pushn', 'pop'):
+        count = int(arg)
+        return (0, count) if op == 'pushn' else (count, 0)
+    if op == 'dup':
+        count = int(arg)
+        return count, 2 * count
+    return stack_effects.get(op)
+
+# Calcula a profundidade máxima da pilha de operandos de cada rotina do código.
+# Uma rotina começa na primeira instrução ou num rótulo cujo endereço é tomado com
+# 'pusha' (funções e ramos de CASE chamados com 'call') ou indicado em 'entries' (ramos
+# cujo 'pusha' está noutro código, como a tabela de saltos); os outros rótulos que nenhum
+# caminho alcança são código morto e ficam de fora. Devolve ({índice de entrada:
+# máximo}, problemas), em que os problemas assinalam pilhas desequilibradas.
+def stack_depths(instructions, entries=()):
+    label_positions = {arg: index for index, (_, op, arg, _) in enumerate(instructions) if op == ':'}
+    depth_at = {}
+    routine_max = {}
+    problems = []
+
+    def analyze(entry):
+        routine_max[entry] = 0
+        depth_at[entry] = 0
+        # Um 'pushn' logo à entrada reserva as variáveis locais, que o 'return' liberta
+        first = entry + 1 if instructions[entry][1] == ':' else entry
+        frame = 0
+        if first < len(instructions) and instructions[first][1] == 'pushn':
+            frame = int(instructions[first][2])
+        pending = [entry]
+        while pending:
+            index = pending.pop()
+            text, op, arg, _ = instructions[index]
+            depth = depth_at[index]
+            effect = stack_effect(op, arg)
+            if effect is None:
+                problems.append(f"instrução desconhecida '{text}'")
+                continue
+            pops, pushes = effect
+            if pops > depth:
+                problems.append(f"'{text}' retira {pops} valor(es) com {depth} na pilha")
+                continue
+            depth += pushes - pops
+            routine_max[entry] = max(routine_max[entry], depth)
+            if op in ('return', 'stop'):
+                if depth != frame:
+                    problems.append(f"'{text}' com {depth - frame} valor(es) por retirar")
+                continue
+            successors = []
+            if op in ('jump', 'jz'):
+                if arg in label_positions:
+                    successors.append(label_positions[arg])
+            if op != 'jump' and index + 1 < len(instructions):
+                successors.append(index + 1)
+            for successor in successors:
+                if successor not in depth_at:
+                    depth_at[successor] = depth
+                    pending.append(successor)
+                elif depth_at[successor] != depth:
+                    problems.append(f"profundidades diferentes ({depth_at[successor]} e {depth}) "
+                                    f"em '{instructions[successor][0]}'")
+
+    if instructions:
+        analyze(0)
+    entries = set(entries) | {arg for _, op, arg, _ in instructions if op == 'pusha'}
+    for index, (_, op, arg, _) in enumerate(instructions):
+        if op == ':' and arg in entries and index not in depth_at:
+            analyze(index)
+    return routine_max, problems
+
+# Instruções que impedem trocar a ordem de avaliação de uma expressão
+reordering_barriers = {
+    'read', 'writei', 'writef', 'writes', 'writeln', 'storeg', 'storel', 'store', 'storen', 'err',
+}
+
+# Nº de posições da pilha de que o código de uma expressão precisa (número de
+# Sethi-Ullman); None se o código tem rótulos, saltos, chamadas ou efeitos, ou se
+# não deixa exactamente um valor na pilha
+def expression_need(code):
+    depth = need = 0
+    for _, op, arg, _ in parse_code(code)[0]:
+        if op == ':' or op in block_terminators or op in reordering_barriers:
+            return None
+        effect = stack_effect(op, arg)
+        if effect is None or effect[0] > depth:
+            return None
+        depth += effect[1] - effect[0]
+        need = max(need, depth)
+    return need if depth == 1 else None
+
+# Acrescenta '//stack N' antes da entrada de cada rotina; devolve (código, problemas)
+def annotate_stack_depths(code, entries=()):
+    instructions, trailing_markers = parse_code(code)
+    routine_max, problems = stack_depths(instructions, entries)
+    for entry, depth in routine_max.items():
+        instructions[entry][3] = instructions[entry][3] + [f"//stack {depth}"]
+    return format_code(instructions, trailing_markers), problems
+
+# ====== Passagens simples ======
+
+# 'div' e 'mod' seguem a VM (quociente truncado); com divisor 0 não são dobrados e o
+# erro fica para a execução
+folding_operations = {
+    'add': lambda a, b: a + b, 'sub': lambda a, b: a - b, 'mul': lambda a, b: a * b,
+    'div': ewvm.int_div, 'mod': ewvm.int_mod,
+}
+
+def integer_constant(instruction):
+    if instruction[1] != 'pushi':
+        return None
+    try:
+        return int(instruction[2])
+    except (TypeError, ValueError):
+        return None
+
+# Avalia operações entre constantes inteiras e retira as neutras ('pushi 0' + add/sub/padd,
+# 'pushi 1' + mul). Os marcadores das instruções retiradas passam para a seguinte.
+def fold_constants(instructions, allocate_slot):
+    result = []
+    pending_markers = []
+    for instruction in instructions:
+        markers = pending_markers + instruction[3]
+        pending_markers = []
+        op = instruction[1]
+        right = integer_constant(result[-1]) if result else None
+        if right is not None:
+            left = integer_constant(result[-2]) if len(result) > 1 else None
+            if op in folding_operations and left is not None and (right != 0 or op not in ('div', 'mod')):
+                second = result.pop()
+                first = result.pop()
+                value = folding_operations[op](left, right)
+                result.append(make_instruction(f"pushi {value}", first[3] + second[3] + markers))
+                continue
+            if (right == 0 and op in ('add', 'sub', 'padd')) or (right == 1 and op == 'mul'):
+                pending_markers = result.pop()[3] + markers
+                continue
+        result.append(instruction if markers is instruction[3] else make_instruction(instruction[0], markers))
+    if pending_markers and result:
+        result[-1][3].extend(pending_markers)
+    return result
+
+# Índice da primeira instrução (que não seja rótulo) a partir de 'index'
+def next_instruction(instructions, index):
+    while index < len(instructions) and instructions[index][1] == ':':
+        index += 1
+    return index
+
+# Retira 'jump L' seguido do próprio 'L:' e troca 'jz L' seguido de 'L:' por 'pop 1'.
+# Saltos encadeados não são encaminhados: o tradutor de ewvm_py depende do
+# aninhamento estruturado dos saltos gerados para if/while/for.
+def simplify_jumps(instructions, allocate_slot):
+    result = []
+    pending_markers = []
+    for index, instruction in enumerate(instructions):
+        markers = pending_markers + instruction[3]
+        pending_markers = []
+        op = instruction[1]
+        if op in ('jump', 'jz'):
+            following = {arg for _, _, arg, _ in instructions[index + 1:next_instruction(instructions, index + 1)]}
+            if instruction[2] in following:
+                if op == 'jump':
+                    pending_markers = markers
+                else:
+                    result.append(make_instruction("pop 1", markers))
+                continue
+        if markers is not instruction[3]:
+            instruction = make_instruction(instruction[0], markers)
+        result.append(instruction)
+    if pending_markers and result:
+        result[-1][3].extend(pending_markers)
+    return result
+
+# Retira as instruções que se seguem a um 'jump', 'return' ou 'stop' até ao próximo rótulo
+def remove_unreachable(instructions, allocate_slot):
+    result = []
+    reachable = True
+    for instruction in instructions:
+        if instruction[1] == ':':
+            reachable = True
+        if reachable:
+            result.append(instruction)
+        if instruction[1] in ('jump', 'return', 'stop'):
+            reachable = False
+    return result
+
+# ====== Redução de força das variáveis de indução ======
+
+# Ciclos 'for' gerados por p_for_statement (V e LIM globais ou, nas funções, locais):
+#   L: pushg V; pushg LIM; infeq|supeq; jz E; <corpo>; pushg V; pushi 1; add|sub; storeg V; jump L; E:
+# Dentro do corpo, um acesso 'pushgp [pushi S; padd] pushg V [pushi c; add|sub]... [pushi k; mul]'
+# seguido de loadn (ou de um valor e storen) calcula base + (V + desvio) * k a cada iteração
+# (k é o tamanho do registo nos arrays de registos). Se V não é alterado no corpo, esse
+# endereço passa para uma global T, inicializada antes do ciclo e avançada k posições por
+# iteração; os acessos passam a 'pushg T' com 'load 0'/'store 0'.
+
+# Custo de manter um endereço por iteração (pushg, pushi, padd, storeg)
+induction_update_cost = 4
+
+# Instrução de escrita correspondente a cada leitura de variável
+variable_stores = {'pushg': 'storeg', 'pushl': 'storel'}
+
+# Reconhece o ciclo com rótulo em 'index'; devolve (V, corpo [início, fim), direcção),
+# com V = (instrução de leitura, posição)
+def match_for_loop(instructions, index, label_positions):
+    head = instructions[index + 1:index + 5]
+    if (len(head) < 4 or head[0][1] not in variable_stores or head[1][1] not in variable_stores
+            or head[2][1] not in ('infeq', 'supeq') or head[3][1] != 'jz'):
+        return None
+    variable = (head[0][1], head[0][2])
+    end = label_positions.get(head[3][2])
+    if end is None or end < index + 10:
+        return None
+    step = instructions[end - 5:end]
+    direction = 1 if head[2][1] == 'infeq' else -1
+    load, slot = variable
+    expected = [(load, slot), ('pushi', '1'), ('add' if direction == 1 else 'sub', None),
+                (variable_stores[load], slot), ('jump', instructions[index][2])]
+    if [(op, arg) for _, op, arg, _ in step] != expected:
+        return None
+    return variable, index + 5, end - 5, direction
+
+# Endereço base + (V + desvio) * passo a partir de 'k'; devolve (fim, base, desvio, passo) ou None
+def match_induction_address(instructions, k, end, variable):
+    if instructions[k][1] != 'pushgp':
+        return None
+    k += 1
+    base = 0
+    if k + 1 < end and instructions[k][1] == 'pushi' and instructions[k + 1][1] == 'padd':
+        base = int(instructions[k][2])
+        k += 2
+    if k >= end or (instructions[k][1], instructions[k][2]) != variable:
+        return None
+    k += 1
+    offset = 0
+    while k + 1 < end and instructions[k][1] == 'pushi' and instructions[k + 1][1] in ('add', 'sub'):
+        value = int(instructions[k][2])
+        offset += value if instructions[k + 1][1] == 'add' else -value
+        k += 2
+    stride = 1
+    if k + 1 < end and instructions[k][1] == 'pushi' and instructions[k + 1][1] == 'mul':
+        stride = int(instructions[k][2])
+        k += 2
+    return k, base, offset, stride
+
+# Instrução que consome o par (endereço, índice) que termina em 'k', sem sair do bloco
+def address_consumer(instructions, k, end):
+    depth = 0
+    while k < end:
+        _, op, arg, _ = instructions[k]
+        if op in block_terminators or op == ':':
+            return None
+        effect = stack_effect(op, arg)
+        if effect is None:
+            return None
+        pops, pushes = effect
+        if pops > depth:
+            if (op == 'loadn' and depth == 0) or (op == 'storen' and depth == 1):
+                return k
+            return None
+        depth += pushes - pops
+        k += 1
+    return None
+
+def reduce_induction_variables(instructions, allocate_slot):
+    done = set()
+    while True:
+        label_positions = {arg: index for index, (_, op, arg, _) in enumerate(instructions) if op == ':'}
+        for index, (_, op, arg, _) in enumerate(instructions):
+            if op != ':' or arg in done:
+                continue
+            loop = match_for_loop(instructions, index, label_positions)
+            if loop is None:
+                continue
+            done.add(arg)
+            rewritten = rewrite_induction_loop(instructions, index, loop, allocate_slot)
+            if rewritten is not None:
+                instructions = rewritten
+                break
+        else:
+            return instructions
+
+# Aplica a redução a um ciclo; devolve as novas instruções ou None se não compensar
+def rewrite_induction_loop(instructions, label_index, loop, allocate_slot):
+    variable, body_begin, body_end, direction = loop
+    load, variable_slot = variable
+    for _, op, arg, _ in instructions[body_begin:body_end]:
+        # Uma chamada pode alterar V, se for global
+        if op == 'call' or (op == variable_stores[load] and arg == variable_slot):
+            return None
+
+    accesses = {}
+    k = body_begin
+    while k < body_end:
+        match = match_induction_address(instructions, k, body_end, variable)
+        if match is None:
+            k += 1
+            continue
+        pair_end, base, offset, stride = match
+        consumer = address_consumer(instructions, pair_end, body_end)
+        if consumer is not None:
+            accesses.setdefault((base, offset, stride), []).append((k, pair_end, consumer))
+        k = pair_end
+
+    replacements = {}
+    init_code = []
+    step_code = []
+    for (base, offset, stride), uses in accesses.items():
+        if sum(pair_end - start - 1 for start, pair_end, _ in uses) <= induction_update_cost:
+            continue
+        slot = allocate_slot()
+        init_code += ["pushgp"] + ([f"pushi {base}", "padd"] if base else []) + [f"{load} {variable_slot}"]
+        init_code += ([f"pushi {offset}", "add"] if offset else []) + ([f"pushi {stride}", "mul"] if stride != 1 else [])
+        init_code += ["padd", f"storeg {slot}"]
+        step_code += [f"pushg {slot}", f"pushi {direction * stride}", "padd", f"storeg {slot}"]
+        for start, pair_end, consumer in uses:
+            replacements[start] = (pair_end, f"pushg {slot}")
+            replacements[consumer] = (consumer + 1, "load 0" if instructions[consumer][1] == 'loadn' else "store 0")
+    if not replacements:
+        return None
+
+    result = instructions[:label_index] + [make_instruction(line) for line in init_code]
+    index = label_index
+    jump_index = body_end + 4
+    while index < len(instructions):
+        if index == jump_index:
+            result.extend(make_instruction(line) for line in step_code)
+        if index in replacements:
+            stop, text = replacements[index]
+            markers = [marker for k in range(index, stop) for marker in instructions[k][3]]
+            result.append(make_instruction(text, markers))
+            index = stop
+            continue
+        result.append(instructions[index])
+        index += 1
+    return result
+
+# ====== Gestor de passagens ======
+
+# Passagens disponíveis: função (instruções, allocate_slot) -> instruções
+optimization_passes = {
+    'fold': fold_constants,
+    'ivsr': reduce_induction_variables,
+    'cse': eliminate_common_subexpressions,
+    'jumps': simplify_jumps,
+    'unreachable': remove_unreachable,
+}
+
+# Passagens activas em cada nível de optimização, pela ordem em que correm
+optimization_levels = {
+    0: [],
+    1: ['fold', 'ivsr', 'cse'],
+    2: ['fold', 'ivsr', 'cse', 'jumps', 'unreachable'],
+}
+
+def count_instructions(instructions):
+    return sum(1 for instruction in instructions if instruction[1] != ':')
+
+# Corre as passagens de um nível sobre cada troço de código, acumulando o tempo gasto
+# e as instruções retiradas por passagem; com 'verify', o grafo de fluxo é verificado
+# depois de cada passagem.
+class PassManager:
+    def __init__(self, level=1, verify=False):
+        self.level = level
+        self.passes = optimization_levels[level]
+        self.verify = verify
+        self.stats = {name: {'time': 0.0, 'removed': 0, 'runs': 0} for name in self.passes}
+
+    def run(self, code, allocate_slot):
+        if not self.passes or not code:
+            return code
+        instructions, trailing_markers = parse_code(code)
+        graph = ControlFlowGraph(instructions) if self.verify else None
+        for name in self.passes:
+            before = count_instructions(instructions)
+            started = time.perf_counter()
+            instructions = optimization_passes[name](instructions, allocate_slot)
+            stats = self.stats[name]
+            stats['time'] += time.perf_counter() - started
+            stats['removed'] += before - count_instructions(instructions)
+            stats['runs'] += 1
+            if self.verify:
+                new_graph = ControlFlowGraph(instructions)
+                verify_control_flow(name, graph, new_graph)
+                graph = new_graph
+        return format_code(instructions, trailing_markers)
+
+    def report(self, out=None):
+        out = out if out is not None else sys.stdout
+        out.write(f"Optimização -O{self.level}\n")
+        if not self.passes:
+            out.write("  (nenhuma passagem activa)\n")
+            return
+        out.write(f"  {'passagem':<12} {'execuções':>9} {'tempo (ms)':>11} {'removidas':>10}\n")
+        for name in self.passes:
+            stats = self.stats[name]
+            out.write(f"  {name:<12} {stats['runs']:>9} {stats['time'] * 1000:>11.3f} {stats['removed']:>10}\n")
@@ -0,0 +1,520 @@
+import sys
+import ewvm
+
+# ====== Tradução de EWVM para Python ======
+
+# Cada função do programa EWVM (o corpo principal entre 'start' e 'stop' e cada
+# rótulo alvo de 'pusha') é traduzida para uma função Python. As posições da
+# pilha passam a ser variáveis locais (s0, s1, ...), as posições abaixo do fp
+# do chamador passam a ser parâmetros (b1, b2, ...) e as globais ficam numa
+# lista 'g'. Os ciclos e condicionais gerados pelo compilador são reconstruídos
+# como 'while'/'if' nativos. Código que não encaixa neste modelo é executado
+# pelo interpretador de ewvm.py.
+
+class Untranslatable(Exception):
+    pass
+
+# Excepção usada para implementar 'stop' dentro de uma função
+class _Halt(Exception):
+    pass
+
+# Uma região chama um ramo que lê mais posições abaixo do fp do que ela recebe:
+# a tradução recomeça com a moldura dessa região alargada
+class _FrameTooSmall(Exception):
+    def __init__(self, begin, depth, writes):
+        super().__init__(begin, depth, writes)
+        self.begin, self.depth, self.writes = begin, depth, writes
+
+# Cada chamada EWVM é uma chamada Python; o interpretador não tem limite de
+# profundidade, por isso durante a execução o limite de recursão sobe para este valor
+recursion_limit = 1000000
+
+# Operadores binários que produzem expressões Python simples
+binary_ops = {
+    'add': '+', 'sub': '-', 'mul': '*', 'padd': '+',
+    'fadd': '+', 'fsub': '-', 'fmul': '*', 'fdiv': '/',
+}
+compare_ops = {
+    'inf': '<', 'infeq': '<=', 'sup': '>', 'supeq': '>=', 'equal': '==',
+    'finf': '<', 'finfeq': '<=', 'fsup': '>', 'fsupeq': '>=',
+}
+
+# Converte uma entrada da pilha simbólica numa expressão inteira
+def _as_int(entry):
+    return entry[0] if entry[1] == 'i' else f"(1 if {entry[0]} else 0)"
+
+# Converte uma entrada da pilha simbólica numa expressão booleana
+def _as_bool(entry):
+    return entry[0] if entry[1] == 'b' else f"({entry[0]} != 0)"
+
+# Divide o código em regiões: prólogo, corpo principal e funções
+def find_regions(code):
+    start_idx = next((i for i, (op, _) in enumerate(code) if op == 'start'), None)
+    if start_idx is None:
+        raise Untranslatable("programa sem 'start'")
+    targets = {arg for op, arg in code if op == 'pusha'}
+    bounds = sorted(targets | {start_idx})
+    regions = []
+    for k, begin in enumerate(bounds):
+        end = bounds[k + 1] if k + 1 < len(bounds) else len(code)
+        regions.append((begin, end))
+    return bounds[0], start_idx, regions
+
+# Entradas das tabelas de saltos dos CASE, preenchidas no arranque com 'pusha R; storeg T'
+def table_entries(code, start_idx):
+    entries = {}
+    for i in range(start_idx, len(code) - 1):
+        op, arg = code[i]
+        if op == 'stop':
+            break
+        if op == 'pusha' and code[i + 1][0] == 'storeg':
+            entries[code[i + 1][1]] = arg
+    return entries
+
+# Alvos de uma chamada indirecta gerada por case_jump_table_code, ou None:
+#   pushi N; inf; and; jz E; pushgp; pushi T; padd; <selector>; loadn; call
+def indirect_targets(code, i, tables):
+    shape = ['pushi', 'inf', 'and', 'jz', 'pushgp', 'pushi', 'padd', None, 'loadn']
+    window = code[i - len(shape):i] if i >= len(shape) else []
+    if len(window) != len(shape) or any(op != expected for (op, _), expected in zip(window, shape) if expected):
+        return None
+    span, base = window[0][1], window[5][1]
+    targets = [tables.get(base + k) for k in range(span)]
+    return None if None in targets else set(targets)
+
+# Informação de chamada de uma região: nº de posições do chamador usadas e se são escritas
+def frame_usage(code, begin, end):
+    depth = 0
+    writes = False
+    for op, arg in code[begin:end]:
+        if op in ('pushl', 'storel') and arg < 0:
+            depth = max(depth, -arg)
+            writes = writes or op == 'storel'
+    return depth, writes
+
+# Tradutor de uma região de código para uma função Python
+class _RegionTranslator:
+    def __init__(self, code, begin, end, name, usage, calls_info, tables=None):
+        self.code = code
+        self.begin = begin
+        self.end = end
+        self.name = name
+        self.frame_depth, self.frame_writes = usage
+        self.calls_info = calls_info
+        self.tables = tables or {}
+        # Os ramos das tabelas aceitam (e devolvem) as posições a mais de uma chamada indirecta
+        self.table_target = begin in self.tables.values()
+        self.lines = []
+        self.indent = 1
+        self.stack = []
+        self.loops = []
+        self.active_heads = set()
+        self.dead = False
+        self.back_refs = {}
+        self.jump_targets = set()
+        for q in range(begin, end):
+            op, arg = code[q]
+            if op in ('jump', 'jz'):
+                if not begin <= arg <= end:
+                    raise Untranslatable(f"salto para fora da função em {q}")
+                self.jump_targets.add(arg)
+                if arg <= q:
+                    self.back_refs.setdefault(arg, []).append(q)
+
+    def emit(self, line):
+        self.lines.append("    " * self.indent + line)
+
+    def pop(self):
+        if not self.stack:
+            raise Untranslatable("pilha vazia")
+        return self.stack.pop()
+
+    # Materializa todas as entradas pendentes em variáveis locais
+    def flush(self):
+        for idx, entry in enumerate(self.stack):
+            self.materialize(idx)
+
+    def materialize(self, idx):
+        entry = self.stack[idx]
+        var = f"s{idx}"
+        if entry[0] != var:
+            self.emit(f"{var} = {_as_int(entry)}")
+            self.stack[idx] = [var, 'i', entry[2]]
+
+    def return_code(self):
+        if self.table_target:
+            values = "".join(f"b{k}, " for k in range(1, self.frame_depth + 1))
+            return f"return ({values}) + _rest"
+        if self.frame_writes:
+            values = ", ".join(f"b{k}" for k in range(1, self.frame_depth + 1))
+            return f"return ({values},)"
+        return "return"
+
+    # Traduz o bloco de instruções [i, j)
+    def block(self, i, j):
+        code = self.code
+        while i < j:
+            if self.dead:
+                if any(k in self.jump_targets for k in range(i, j)):
+                    raise Untranslatable(f"código inalcançável com rótulos em {i}")
+                return
+            refs = self.back_refs.get(i)
+            if refs and i not in self.active_heads:
+                inner = [q for q in refs if i <= q < j]
+                if inner:
+                    q = max(inner)
+                    self.loop(i, q)
+                    i = q + 1
+                    continue
+            op, arg = code[i]
+            if op in ('jz', 'jump'):
+                i = self.branch(i, j, op, arg)
+                continue
+            self.instruction(i, op, arg)
+            i += 1
+
+    # Ciclo com cabeça em 'head' e salto de retorno em 'q'
+    def loop(self, head, q):
+        self.flush()
+        depth = len(self.stack)
+        snapshot = [list(e) for e in self.stack]
+        self.emit("while True:")
+        self.indent += 1
+        mark = len(self.lines)
+        self.loops.append({'head': head, 'exit': q + 1, 'depth': depth, 'breaks': False})
+        self.active_heads.add(head)
+        self.block(head, q)
+        info = self.loops[-1]
+        if not self.dead:
+            op, _ = self.code[q]
+            if op == 'jz':
+                cond = self.pop()
+                self.flush()
+                self.check_depth(depth)
+                self.emit(f"if {_as_bool(cond)}: break")
+                info['breaks'] = True
+            else:
+                self.flush()
+                self.check_depth(depth)
+        if len(self.lines) == mark:
+            self.emit("pass")
+        self.active_heads.discard(head)
+        self.loops.pop()
+        self.indent -= 1
+        self.stack = snapshot
+        self.dead = not info['breaks']
+
+    def check_depth(self, depth):
+        if len(self.stack) != depth:
+            raise Untranslatable("profundidade da pilha inconsistente")
+
+    # Saltos: break/continue, if-then e if-then-else; devolve o próximo índice
+    def branch(self, i, j, op, target):
+        cond = self.pop() if op == 'jz' else None
+        self.flush()
+        loop = self.loops[-1] if self.loops else None
+        if loop and target in (loop['exit'], loop['head']):
+            self.check_depth(loop['depth'])
+            keyword = 'break' if target == loop['exit'] else 'continue'
+            if cond is None:
+                self.emit(keyword)
+                self.dead = True
+            else:
+                self.emit(f"if not {_as_bool(cond)}: {keyword}")
+            if keyword == 'break':
+                loop['breaks'] = True
+            return i + 1
+        if cond is None or not i < target <= j:
+            raise Untranslatable(f"salto não estruturado em {i}")
+
+        snapshot = [list(e) for e in self.stack]
+        depth = len(snapshot)
+        else_jump = self.code[target - 1] if target - 1 > i else None
+        has_else = (else_jump is not None and else_jump[0] == 'jump'
+                    and target <= else_jump[1] <= j
+                    and not (loop and else_jump[1] in (loop['exit'], loop['head'])))
+
+        self.emit(f"if {_as_bool(cond)}:")
+        self.indent += 1
+        mark = len(self.lines)
+        self.block(i + 1, target - 1 if has_else else target)
+        then_dead = self.dead
+        if not then_dead:
+            self.flush()
+            self.check_depth(depth)
+        if len(self.lines) == mark:
+            self.emit("pass")
+        self.indent -= 1
+        self.stack = [list(e) for e in snapshot]
+        self.dead = False
+        if not has_else:
+            return target
+
+        self.emit("else:")
+        self.indent += 1
+        mark = len(self.lines)
+        after = else_jump[1]
+        self.block(target, after)
+        else_dead = self.dead
+        if not else_dead:
+            self.flush()
+            self.check_depth(depth)
+        if len(self.lines) == mark:
+            self.emit("pass")
+        self.indent -= 1
+        self.stack = [list(e) for e in snapshot]
+        self.dead = then_dead and else_dead
+        return after
+
+    # Instruções sem saltos
+    def instruction(self, i, op, arg):
+        stack = self.stack
+        if op in ('pushi', 'pushf', 'pushs'):
+            stack.append([repr(arg), 'i', None])
+        elif op == 'pushn':
+            stack.extend(['0', 'i', None] for _ in range(arg))
+        elif op == 'pushg':
+            stack.append([f"g[{arg}]", 'i', None])
+        elif op == 'storeg':
+            value = self.pop()
+            self.flush()
+            self.emit(f"g[{arg}] = {_as_int(value)}")
+        elif op == 'pushl':
+            if arg < 0:
+                stack.append([f"b{-arg}", 'i', None])
+            else:
+                if arg >= len(stack):
+                    raise Untranslatable(f"pushl fora da pilha em {i}")
+                self.materialize(arg)
+                stack.append([f"s{arg}", 'i', None])
+        elif op == 'storel':
+            value = self.pop()
+            self.flush()
+            if arg < 0:
+                self.emit(f"b{-arg} = {_as_int(value)}")
+            elif arg < len(stack):
+                self.emit(f"s{arg} = {_as_int(value)}")
+            else:
+                raise Untranslatable(f"storel fora da pilha em {i}")
+        elif op in binary_ops:
+            b = self.pop(); a = self.pop()
+            stack.append([f"({a[0]} {binary_ops[op]} {b[0]})", 'i', None])
+        elif op in compare_ops:
+            b = self.pop(); a = self.pop()
+            stack.append([f"({a[0]} {compare_ops[op]} {b[0]})", 'b', None])
+        elif op == 'div':
+            b = self.pop(); a = self.pop()
+            stack.append([f"_div({a[0]}, {b[0]})", 'i', None])
+        elif op == 'mod':
+            b = self.pop(); a = self.pop()
+            stack.append([f"_mod({a[0]}, {b[0]})", 'i', None])
+        elif op == 'not':
+            a = self.pop()
+            stack.append([f"(not {a[0]})", 'b', None])
+        elif op in ('and', 'or'):
+            b = self.pop(); a = self.pop()
+            symbol = '&' if op == 'and' else '|'
+            stack.append([f"({_as_bool(a)} {symbol} {_as_bool(b)})", 'b', None])
+        elif op == 'itof':
+            a = self.pop()
+            stack.append([f"float({a[0]})", 'i', None])
+        elif op == 'ftoi':
+            a = self.pop()
+            stack.append([f"int({a[0]})", 'i', None])
+        elif op == 'pushgp':
+            stack.append(['0', 'i', None])
+        elif op == 'loadn':
+            n = self.pop(); a = self.pop()
+            stack.append([f"g[{a[0]} + {n[0]}]", 'i', None])
+        elif op == 'storen':
+            v = self.pop(); n = self.pop(); a = self.pop()
+            self.flush()
+            self.emit(f"g[{a[0]} + {n[0]}] = {_as_int(v)}")
+        elif op == 'load':
+            a = self.pop()
+            stack.append([f"g[{a[0]} + {arg}]", 'i', None])
+        elif op == 'store':
+            v = self.pop(); a = self.pop()
+            self.flush()
+            self.emit(f"g[{a[0]} + {arg}] = {_as_int(v)}")
+        elif op == 'writei':
+            a = self.pop()
+            self.flush()
+            self.emit(f"_w(str({_as_int(a)}))")
+        elif op == 'writef':
+            a = self.pop()
+            self.flush()
+            self.emit(f"_w(_fmt({a[0]}))")
+        elif op == 'writes':
+            a = self.pop()
+            self.flush()
+            self.emit(f"_w({a[0]})")
+        elif op == 'writeln':
+            self.flush()
+            self.emit("_nl()")
+        elif op == 'read':
+            self.flush()
+            idx = len(stack)
+            self.emit(f"s{idx} = _read()")
+            stack.append([f"s{idx}", 'i', None])
+        elif op in ('atoi', 'atof', 'strlen', 'chrcode'):
+            a = self.pop()
+            template = {'atoi': "_atoi({})", 'atof': "_atof({})",
+                        'strlen': "len({})", 'chrcode': "ord({}[0])"}[op]
+            stack.append([template.format(a[0]), 'i', None])
+        elif op == 'charat':
+            n = self.pop(); a = self.pop()
+            stack.append([f"ord({a[0]}[{n[0]}])", 'i', None])
+        elif op == 'pop':
+            for _ in range(arg):
+                self.pop()
+        elif op == 'dup':
+            if arg > len(stack):
+                raise Untranslatable(f"dup fora da pilha em {i}")
+            # As cópias partilham a variável, não a expressão (que pode ler s{idx})
+            for idx in range(len(stack) - arg, len(stack)):
+                self.materialize(idx)
+            stack.extend(list(e) for e in stack[len(stack) - arg:])
+        elif op == 'swap':
+            b = self.pop(); a = self.pop()
+            stack.extend([b, a])
+        elif op == 'pusha':
+            stack.append([str(arg), 'i', arg])
+        elif op == 'call':
+            self.call(i)
+        elif op == 'return':
+            if self.name == 'f_main':
+                raise Untranslatable("return fora de uma função")
+            self.emit(self.return_code())
+            self.dead = True
+        elif op == 'stop':
+            self.flush()
+            self.emit("return" if self.name == 'f_main' else "raise _Halt")
+            self.dead = True
+        elif op in ('nop', 'start') and (op == 'nop' or i == self.begin):
+            pass
+        else:
+            raise Untranslatable(f"instrução '{op}' não suportada em {i}")
+
+    # Chamada: as posições do chamador abaixo do novo fp passam como argumentos. Um ramo
+    # de CASE chamado de uma função lê também a moldura dela (b1, b2, ... do chamador).
+    def call(self, i):
+        target = self.pop()
+        self.flush()
+        depth = len(self.stack)
+        if target[2] is not None:
+            if target[2] not in self.calls_info:
+                raise Untranslatable(f"chamada para endereço desconhecido em {i}")
+            callee = f"f_{target[2]}"
+            used, writes = self.calls_info[target[2]]
+        else:
+            # Chamada indirecta: recebe as posições de que precisa o ramo mais exigente
+            callee = f"_F[{target[0]}]"
+            targets = indirect_targets(self.code, i, self.tables)
+            if targets is None:
+                if any(self.calls_info[t][0] for t in self.tables.values()):
+                    raise Untranslatable(f"chamada indirecta sem tabela conhecida em {i}")
+                used, writes = 0, False
+            else:
+                used = max(self.calls_info[t][0] for t in targets)
+                writes = any(self.calls_info[t][1] for t in targets)
+        below = used - depth
+        if below > 0 and (below > self.frame_depth or (writes and not self.frame_writes)):
+            if self.name == 'f_main':
+                raise Untranslatable(f"chamada sem argumentos suficientes em {i}")
+            raise _FrameTooSmall(self.begin, max(below, self.frame_depth), writes or self.frame_writes)
+        args = ", ".join(f"s{depth - k}" if k <= depth else f"b{k - depth}" for k in range(1, used + 1))
+        if writes and used:
+            self.emit(f"{args}, = {callee}({args})")
+        else:
+            self.emit(f"{callee}({args})")
+
+    def translate(self):
+        self.block(self.begin, self.end)
+        if not self.dead:
+            raise Untranslatable(f"fim da função {self.name} sem return/stop")
+        params = [f"b{k}" for k in range(1, self.frame_depth + 1)]
+        if self.table_target:
+            params.append("*_rest")
+        return [f"def {self.name}({', '.join(params)}):"] + self.lines
+
+# Gera o código Python de um programa EWVM carregado
+def translate(code):
+    first, start_idx, regions = find_regions(code)
+    for op, _ in code[:first]:
+        if op not in ('pushn', 'pushi', 'pushf', 'pushs'):
+            raise Untranslatable(f"instrução '{op}' antes de 'start'")
+
+    calls_info = {}
+    for begin, end in regions:
+        if begin != start_idx:
+            calls_info[begin] = frame_usage(code, begin, end)
+    tables = table_entries(code, start_idx)
+
+    while True:
+        try:
+            lines = ["def _make(g, _w, _nl, _read, _div, _mod, _atoi, _atof, _fmt, _Halt):"]
+            for begin, end in regions:
+                if begin == start_idx:
+                    translator = _RegionTranslator(code, begin, end, 'f_main', (0, False), calls_info, tables)
+                else:
+                    translator = _RegionTranslator(code, begin, end, f"f_{begin}", calls_info[begin],
+                                                   calls_info, tables)
+                lines.extend("    " + line for line in translator.translate())
+            break
+        except _FrameTooSmall as e:
+            calls_info[e.begin] = (e.depth, e.writes)
+    entries = ", ".join(f"{begin}: f_{begin}" for begin in calls_info)
+    lines.append(f"    _F = {{{entries}}}")
+    lines.append("    return f_main")
+    return "\n".join(lines) + "\n"
+
+# Valores iniciais das globais (instruções antes de 'start')
+def initial_globals(code):
+    values = []
+    for op, arg in code:
+        if op == 'start':
+            break
+        values.extend([0] * arg if op == 'pushn' else [arg])
+    return values
+
+# Compila o programa e devolve a fábrica das funções traduzidas
+def compile_program(code):
+    source = translate(code)
+    namespace = {}
+    exec(compile(source, '<ewvm_py>', 'exec'), namespace)
+    return namespace['_make']
+
+# Executa o programa traduzido; recorre ao interpretador se não for traduzível.
+# 'make' permite reutilizar a tradução de compile_program em várias execuções.
+def run(code, labels=None, stdin=None, stdout=None, make=None):
+    stdin = stdin if stdin is not None else sys.stdin
+    stdout = stdout if stdout is not None else sys.stdout
+    if make is None:
+        try:
+            make = compile_program(code)
+        except Untranslatable as e:
+            print(f"Aviso: programa não traduzível para Python ({e}); a usar o interpretador.", file=sys.stderr)
+            return ewvm.execute(code, stdin=stdin, stdout=stdout)
+
+    output = ewvm.OutputBuffer(stdout)
+
+    def read_line():
+        output.flush()
+        line = stdin.readline()
+        return line[:-1] if line.endswith('\n') else line
+
+    main = make(initial_globals(code), output.write, output.newline, read_line, ewvm.int_div, ewvm.int_mod,
+                ewvm.str_to_int, ewvm.str_to_float, ewvm.format_float, _Halt)
+    previous_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(previous_limit, recursion_limit))
+    try:
+        main()
+    except _Halt:
+        pass
+    except (IndexError, TypeError, ValueError, ZeroDivisionError, RecursionError) as e:
+        raise ewvm.EWVMError(f"Erro na execução traduzida: {e}")
+    finally:
+        sys.setrecursionlimit(previous_limit)
+        output.flush()
+    return None
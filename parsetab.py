@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'programnonassocIFXnonassocELSEleftORleftANDnonassocEQNEQLTLEGTGEleftPLUSMINUSleftTIMESDIVIDEDIVMODrightNOTAND ARRAY ASSIGN BEGIN BOOLEAN CASE COLON COMMA CONST DIV DIVIDE DO DOT DOTDOT DOWNTO ELSE END EQ FALSE FILE FOR FUNCTION GE GOTO GT ID IF IN INTEGER LABEL LBRACKET LE LPAREN LT MINUS MOD NEQ NIL NOT NUMBER OF OR PACKED PLUS PROCEDURE PROGRAM RBRACKET READ READLN REAL RECORD REPEAT RPAREN SEMI SET STRING STRING_LITERAL THEN TIMES TO TRUE TYPE UNTIL VAR WHILE WITH WRITE WRITELNprogram : PROGRAM ID SEMI declarations functions BEGIN statements END DOTdeclarations : VAR var_declaration_list\n                    | emptyvar_declaration_list : var_declaration_list var_declaration\n                            | var_declarationvar_declaration : id_list COLON type SEMIid_list : ID\n              | ID COMMA id_listtype : simple_type\n            | array_typesimple_type : INTEGER\n                   | BOOLEAN\n                   | STRING\n                   | REALarray_type : ARRAY LBRACKET index_range RBRACKET OF typeindex_range : NUMBER DOTDOT NUMBERvariable : ID\n                | ID LBRACKET expression RBRACKETfunctions : function functions\n                 | emptyfunction : FUNCTION ID LPAREN param_list RPAREN COLON type SEMI declarations BEGIN statements END SEMIparam_list : ID COLON typeparam_list : param_list SEMI ID COLON typeargument_list : expressionargument_list : argument_list COMMA expressionexpression : ID LPAREN argument_list RPAREN\n                  | ID LPAREN RPARENstatements : statement_sequencestatement_sequence : statement\n                          | statement_sequence SEMI statementstatement : assignment_statement\n                 | writeln_statement\n                 | write_statement\n                 | readln_statement\n                 | for_statement\n                 | if_statement\n                 | while_statement\n                 | statement_compound\n                 | concrete_empty_statementconcrete_empty_statement :assignment_statement : variable ASSIGN expressionwriteln_statement : WRITELN LPAREN writelist RPARENwrite_statement : WRITE LPAREN writelist RPARENwritelist : writelist COMMA writeitem\n                 | writeitemwriteitem : expressionreadln_statement : READLN LPAREN variable RPARENfor_statement : FOR ID ASSIGN expression TO expression DO statement\n                     | FOR ID ASSIGN expression DOWNTO expression DO statementexpression : TRUE\n                  | FALSEexpression : expression AND expression\n                  | expression OR expressionexpression : expression LT expression\n                  | expression LE expression\n                  | expression GT expression\n                  | expression GE expression\n                  | expression EQ expression\n                  | expression NEQ expressionexpression : LPAREN expression RPARENexpression : expression DIV expressionexpression : expression MOD expressionstatement_compound : BEGIN statements ENDif_statement : IF expression THEN statement %prec IFX\n                    | IF expression THEN statement ELSE statementwhile_statement : WHILE expression DO statementexpression : expression PLUS expression\n                  | expression MINUS expression\n                  | expression TIMES expression\n                  | expression DIVIDE expressionexpression : variableexpression : STRING_LITERALexpression : NUMBERexpression : REALempty :'
+_lr_signature = 'sourcenonassocIFXnonassocELSEleftORleftANDnonassocEQNEQLTLEGTGEINleftPLUSMINUSleftTIMESDIVIDEDIVMODrightNOTrightUMINUSAND ARRAY ASSIGN BEGIN BOOLEAN CASE COLON COMMA CONST DIV DIVIDE DO DOT DOTDOT DOWNTO ELSE END EQ FALSE FILE FOR FUNCTION GE GOTO GT ID IF IMPLEMENTATION IN INTEGER INTERFACE LABEL LBRACKET LE LPAREN LT MINUS MOD NEQ NIL NOT NUMBER OF OR PACKED PLUS PROCEDURE PROGRAM RBRACKET READ READLN REAL RECORD REPEAT RPAREN SEMI SET STRING STRING_LITERAL THEN TIMES TO TRUE TYPE UNIT UNTIL USES VAR WHILE WITH WRITE WRITELNsource : program\n              | unitprogram : PROGRAM ID SEMI uses_clause declarations functions BEGIN statements END DOTuses_clause : USES id_list SEMI\n                   | emptydeclarations : VAR var_declaration_list\n                    | emptydeclarations : CONST const_declaration_list\n                    | CONST const_declaration_list VAR var_declaration_listconst_declaration_list : const_declaration_list const_declaration\n                              | const_declarationconst_declaration : ID EQ expression SEMIvar_declaration_list : var_declaration_list var_declaration\n                            | var_declarationvar_declaration : id_list COLON type SEMIid_list : ID\n              | ID COMMA id_listtype : simple_type\n            | array_type\n            | set_type\n            | record_typesimple_type : INTEGER\n                   | BOOLEAN\n                   | STRING\n                   | REALarray_type : ARRAY LBRACKET index_range RBRACKET OF typearray_type : PACKED ARRAY LBRACKET index_range RBRACKET OF typeset_type : SET OF index_range\n                | SET OF BOOLEANrecord_type : RECORD field_list END\n                   | RECORD field_list SEMI ENDfield_list : field_list SEMI field_declaration\n                  | field_declarationfield_declaration : id_list COLON typeindex_range : index_bound DOTDOT index_boundindex_bound : NUMBER\n                   | IDvariable : ID\n                | ID LBRACKET expression RBRACKETvariable : ID DOT ID\n                | ID LBRACKET expression RBRACKET DOT IDfunctions : function functions\n                 | emptyfunction : function_header declarations BEGIN statements END SEMIfunction_header : function_signaturefunction_signature : FUNCTION ID LPAREN param_list RPAREN COLON type SEMI\n                          | FUNCTION ID COLON type SEMIparam_list : ID COLON typeparam_list : param_list SEMI ID COLON typeargument_list : expressionargument_list : argument_list COMMA expressionexpression : ID LPAREN argument_list RPAREN\n                  | ID LPAREN RPARENunit : UNIT ID SEMI INTERFACE interface_list IMPLEMENTATION declarations functions END DOTinterface_list : interface_list function_signature\n                      | function_signaturestatements : statement_sequencestatement_sequence : statement\n                          | statement_sequence SEMI statementstatement : assignment_statement\n                 | writeln_statement\n                 | write_statement\n                 | readln_statement\n                 | for_statement\n                 | if_statement\n                 | while_statement\n                 | case_statement\n                 | statement_compound\n                 | concrete_empty_statementconcrete_empty_statement :assignment_statement : variable ASSIGN expressionwriteln_statement : WRITELN LPAREN writelist RPARENwrite_statement : WRITE LPAREN writelist RPARENwritelist : writelist COMMA writeitem\n                 | writeitemwriteitem : expressionreadln_statement : READLN LPAREN variable RPARENfor_statement : FOR ID ASSIGN expression TO expression DO statement\n                     | FOR ID ASSIGN expression DOWNTO expression DO statementexpression : TRUE\n                  | FALSEexpression : expression AND expression\n                  | expression OR expressionexpression : expression LT expression\n                  | expression LE expression\n                  | expression GT expression\n                  | expression GE expression\n                  | expression EQ expression\n                  | expression NEQ expressionexpression : LPAREN expression RPARENexpression : MINUS expression %prec UMINUSexpression : expression DIV expressionexpression : expression MOD expressionstatement_compound : BEGIN statements ENDif_statement : IF expression THEN statement %prec IFX\n                    | IF expression THEN statement ELSE statementwhile_statement : WHILE expression DO statementcase_statement : CASE expression OF case_list END\n                      | CASE expression OF case_list SEMI END\n                      | CASE expression OF case_list ELSE statements END\n                      | CASE expression OF case_list SEMI ELSE statements ENDcase_list : case_list SEMI case_element\n                 | case_elementcase_element : case_label_list COLON statementcase_label_list : case_label_list COMMA case_label\n                       | case_labelcase_label : case_constant\n                  | case_constant DOTDOT case_constantcase_constant : NUMBER\n                     | MINUS NUMBER\n                     | STRING_LITERAL\n                     | TRUE\n                     | FALSE\n                     | IDexpression : expression IN expressionexpression : LBRACKET set_element_list RBRACKET\n                  | LBRACKET RBRACKETset_element_list : set_element_list COMMA set_element\n                        | set_elementset_element : expression\n                   | expression DOTDOT expressionexpression : expression PLUS expression\n                  | expression MINUS expression\n                  | expression TIMES expression\n                  | expression DIVIDE expressionexpression : variableexpression : STRING_LITERALexpression : NUMBERexpression : REALempty :statement : errorvar_declaration : error SEMI'
     
-_lr_action_items = {'PROGRAM':([0,],[2,]),'$end':([1,78,],[0,-1,]),'ID':([2,6,11,12,13,16,19,21,23,40,41,42,43,53,56,57,58,59,60,64,74,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,104,107,112,142,143,144,146,158,159,163,],[3,15,18,15,-5,22,-4,15,22,61,63,63,72,63,22,63,63,63,22,63,-6,63,22,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,22,138,63,63,63,22,63,22,22,22,]),'SEMI':([3,16,23,25,26,27,28,29,30,31,32,33,34,35,44,45,46,47,48,49,50,56,63,65,66,67,68,69,70,73,77,79,80,87,104,110,111,113,114,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,134,135,136,144,145,147,153,156,157,158,159,161,162,163,165,],[4,-40,-40,56,-29,-31,-32,-33,-34,-35,-36,-37,-38,-39,74,-9,-10,-11,-12,-13,-14,-40,-17,-50,-51,-71,-72,-73,-74,107,-63,-30,-41,-40,-40,-18,-42,-43,-47,-64,-52,-53,-54,-55,-56,-57,-58,-59,-61,-62,-67,-68,-69,-70,-27,-60,-66,-22,-40,-26,155,-65,-23,-15,-40,-40,-48,-49,-40,166,]),'VAR':([4,155,],[6,6,]),'FUNCTION':([4,5,7,9,12,13,19,74,166,],[-75,11,-3,11,-2,-5,-4,-6,-21,]),'BEGIN':([4,5,7,8,9,10,12,13,16,17,19,23,56,74,87,104,144,155,158,159,160,163,166,],[-75,-75,-3,16,-75,-20,-2,-5,23,-19,-4,23,23,-6,23,23,23,-75,23,23,163,23,-21,]),'COLON':([14,15,52,72,106,138,],[20,-7,-8,105,137,148,]),'COMMA':([15,63,65,66,67,68,69,70,81,82,83,84,110,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,141,145,154,],[21,-17,-50,-51,-71,-72,-73,-74,112,-45,-46,112,-18,-52,-53,-54,-55,-56,-57,-58,-59,-61,-62,-67,-68,-69,-70,146,-27,-24,-60,-44,-26,-25,]),'WRITELN':([16,23,56,87,104,144,158,159,163,],[37,37,37,37,37,37,37,37,37,]),'WRITE':([16,23,56,87,104,144,158,159,163,],[38,38,38,38,38,38,38,38,38,]),'READLN':([16,23,56,87,104,144,158,159,163,],[39,39,39,39,39,39,39,39,39,]),'FOR':([16,23,56,87,104,144,158,159,163,],[40,40,40,40,40,40,40,40,40,]),'IF':([16,23,56,87,104,144,158,159,163,],[41,41,41,41,41,41,41,41,41,]),'WHILE':([16,23,56,87,104,144,158,159,163,],[42,42,42,42,42,42,42,42,42,]),'END':([16,23,24,25,26,27,28,29,30,31,32,33,34,35,54,56,63,65,66,67,68,69,70,77,79,80,87,104,110,111,113,114,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,134,135,144,145,153,158,159,161,162,163,164,],[-40,-40,55,-28,-29,-31,-32,-33,-34,-35,-36,-37,-38,-39,77,-40,-17,-50,-51,-71,-72,-73,-74,-63,-30,-41,-40,-40,-18,-42,-43,-47,-64,-52,-53,-54,-55,-56,-57,-58,-59,-61,-62,-67,-68,-69,-70,-27,-60,-66,-40,-26,-65,-40,-40,-48,-49,-40,165,]),'LPAREN':([18,37,38,39,41,42,53,57,58,59,63,64,86,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,112,142,143,146,],[43,58,59,60,64,64,64,64,64,64,102,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'INTEGER':([20,105,137,148,149,],[47,47,47,47,47,]),'BOOLEAN':([20,105,137,148,149,],[48,48,48,48,48,]),'STRING':([20,105,137,148,149,],[49,49,49,49,49,]),'REAL':([20,41,42,53,57,58,59,64,86,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,105,112,137,142,143,146,148,149,],[50,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,50,70,50,70,70,70,50,50,]),'ARRAY':([20,105,137,148,149,],[51,51,51,51,51,]),'ASSIGN':([22,36,61,110,],[-17,57,86,-18,]),'RPAREN':([22,45,46,47,48,49,50,63,65,66,67,68,69,70,73,81,82,83,84,85,102,103,110,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,141,145,154,156,157,],[-17,-9,-10,-11,-12,-13,-14,-17,-50,-51,-71,-72,-73,-74,106,111,-45,-46,113,114,132,134,-18,-52,-53,-54,-55,-56,-57,-58,-59,-61,-62,-67,-68,-69,-70,145,-27,-24,-60,-22,-44,-26,-25,-23,-15,]),'LBRACKET':([22,51,63,],[53,75,53,]),'ELSE':([27,28,29,30,31,32,33,34,35,63,65,66,67,68,69,70,77,80,87,104,110,111,113,114,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,134,135,144,145,153,158,159,161,162,],[-31,-32,-33,-34,-35,-36,-37,-38,-39,-17,-50,-51,-71,-72,-73,-74,-63,-41,-40,-40,-18,-42,-43,-47,144,-52,-53,-54,-55,-56,-57,-58,-59,-61,-62,-67,-68,-69,-70,-27,-60,-66,-40,-26,-65,-40,-40,-48,-49,]),'TRUE':([41,42,53,57,58,59,64,86,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,112,142,143,146,],[65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'FALSE':([41,42,53,57,58,59,64,86,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,112,142,143,146,],[66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'STRING_LITERAL':([41,42,53,57,58,59,64,86,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,112,142,143,146,],[68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,]),'NUMBER':([41,42,53,57,58,59,64,75,86,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,112,140,142,143,146,],[69,69,69,69,69,69,69,109,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,150,69,69,69,]),'DOT':([55,],[78,]),'THEN':([62,63,65,66,67,68,69,70,110,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,134,145,],[87,-17,-50,-51,-71,-72,-73,-74,-18,-52,-53,-54,-55,-56,-57,-58,-59,-61,-62,-67,-68,-69,-70,-27,-60,-26,]),'AND':([62,63,65,66,67,68,69,70,71,76,80,83,103,110,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,133,134,145,151,152,154,],[88,-17,-50,-51,-71,-72,-73,-74,88,88,88,88,88,-18,88,-52,88,-54,-55,-56,-57,-58,-59,-61,-62,-67,-68,-69,-70,-27,88,-60,-26,88,88,88,]),'OR':([62,63,65,66,67,68,69,70,71,76,80,83,103,110,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,133,134,145,151,152,154,],[89,-17,-50,-51,-71,-72,-73,-74,89,89,89,89,89,-18,89,-52,-53,-54,-55,-56,-57,-58,-59,-61,-62,-67,-68,-69,-70,-27,89,-60,-26,89,89,89,]),'LT':([62,63,65,66,67,68,69,70,71,76,80,83,103,110,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,133,134,145,151,152,154,],[90,-17,-50,-51,-71,-72,-73,-74,90,90,90,90,90,-18,90,90,90,None,None,None,None,None,None,-61,-62,-67,-68,-69,-70,-27,90,-60,-26,90,90,90,]),'LE':([62,63,65,66,67,68,69,70,71,76,80,83,103,110,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,133,134,145,151,152,154,],[91,-17,-50,-51,-71,-72,-73,-74,91,91,91,91,91,-18,91,91,91,None,None,None,None,None,None,-61,-62,-67,-68,-69,-70,-27,91,-60,-26,91,91,91,]),'GT':([62,63,65,66,67,68,69,70,71,76,80,83,103,110,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,133,134,145,151,152,154,],[92,-17,-50,-51,-71,-72,-73,-74,92,92,92,92,92,-18,92,92,92,None,None,None,None,None,None,-61,-62,-67,-68,-69,-70,-27,92,-60,-26,92,92,92,]),'GE':([62,63,65,66,67,68,69,70,71,76,80,83,103,110,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,133,134,145,151,152,154,],[93,-17,-50,-51,-71,-72,-73,-74,93,93,93,93,93,-18,93,93,93,None,None,None,None,None,None,-61,-62,-67,-68,-69,-70,-27,93,-60,-26,93,93,93,]),'EQ':([62,63,65,66,67,68,69,70,71,76,80,83,103,110,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,133,134,145,151,152,154,],[94,-17,-50,-51,-71,-72,-73,-74,94,94,94,94,94,-18,94,94,94,None,None,None,None,None,None,-61,-62,-67,-68,-69,-70,-27,94,-60,-26,94,94,94,]),'NEQ':([62,63,65,66,67,68,69,70,71,76,80,83,103,110,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,133,134,145,151,152,154,],[95,-17,-50,-51,-71,-72,-73,-74,95,95,95,95,95,-18,95,95,95,None,None,None,None,None,None,-61,-62,-67,-68,-69,-70,-27,95,-60,-26,95,95,95,]),'DIV':([62,63,65,66,67,68,69,70,71,76,80,83,103,110,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,133,134,145,151,152,154,],[96,-17,-50,-51,-71,-72,-73,-74,96,96,96,96,96,-18,96,96,96,96,96,96,96,96,96,-61,-62,96,96,-69,-70,-27,96,-60,-26,96,96,96,]),'MOD':([62,63,65,66,67,68,69,70,71,76,80,83,103,110,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,133,134,145,151,152,154,],[97,-17,-50,-51,-71,-72,-73,-74,97,97,97,97,97,-18,97,97,97,97,97,97,97,97,97,-61,-62,97,97,-69,-70,-27,97,-60,-26,97,97,97,]),'PLUS':([62,63,65,66,67,68,69,70,71,76,80,83,103,110,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,133,134,145,151,152,154,],[98,-17,-50,-51,-71,-72,-73,-74,98,98,98,98,98,-18,98,98,98,98,98,98,98,98,98,-61,-62,-67,-68,-69,-70,-27,98,-60,-26,98,98,98,]),'MINUS':([62,63,65,66,67,68,69,70,71,76,80,83,103,110,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,133,134,145,151,152,154,],[99,-17,-50,-51,-71,-72,-73,-74,99,99,99,99,99,-18,99,99,99,99,99,99,99,99,99,-61,-62,-67,-68,-69,-70,-27,99,-60,-26,99,99,99,]),'TIMES':([62,63,65,66,67,68,69,70,71,76,80,83,103,110,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,133,134,145,151,152,154,],[100,-17,-50,-51,-71,-72,-73,-74,100,100,100,100,100,-18,100,100,100,100,100,100,100,100,100,-61,-62,100,100,-69,-70,-27,100,-60,-26,100,100,100,]),'DIVIDE':([62,63,65,66,67,68,69,70,71,76,80,83,103,110,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,133,134,145,151,152,154,],[101,-17,-50,-51,-71,-72,-73,-74,101,101,101,101,101,-18,101,101,101,101,101,101,101,101,101,-61,-62,101,101,-69,-70,-27,101,-60,-26,101,101,101,]),'DO':([63,65,66,67,68,69,70,71,110,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,134,145,151,152,],[-17,-50,-51,-71,-72,-73,-74,104,-18,-52,-53,-54,-55,-56,-57,-58,-59,-61,-62,-67,-68,-69,-70,-27,-60,-26,158,159,]),'RBRACKET':([63,65,66,67,68,69,70,76,108,110,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,134,145,150,],[-17,-50,-51,-71,-72,-73,-74,110,139,-18,-52,-53,-54,-55,-56,-57,-58,-59,-61,-62,-67,-68,-69,-70,-27,-60,-26,-16,]),'TO':([63,65,66,67,68,69,70,110,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,134,145,],[-17,-50,-51,-71,-72,-73,-74,-18,142,-52,-53,-54,-55,-56,-57,-58,-59,-61,-62,-67,-68,-69,-70,-27,-60,-26,]),'DOWNTO':([63,65,66,67,68,69,70,110,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,134,145,],[-17,-50,-51,-71,-72,-73,-74,-18,143,-52,-53,-54,-55,-56,-57,-58,-59,-61,-62,-67,-68,-69,-70,-27,-60,-26,]),'DOTDOT':([109,],[140,]),'OF':([139,],[149,]),}
+_lr_action_items = {'PROGRAM':([0,],[4,]),'UNIT':([0,],[5,]),'$end':([1,2,3,159,204,],[0,-1,-2,-3,-54,]),'ID':([4,5,11,15,17,22,28,29,32,33,36,40,43,45,46,47,48,51,54,73,74,75,76,77,90,91,94,97,98,107,108,111,112,113,114,115,121,122,124,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,154,167,168,169,170,176,180,202,203,210,229,235,240,242,243,244,246,247,248,249,250,263,271,272,],[6,7,19,19,34,39,19,-14,34,-11,19,53,-13,-132,19,-10,92,104,53,116,92,92,92,53,19,19,92,92,92,92,157,53,92,92,92,53,-15,175,175,92,92,-12,92,92,92,92,92,92,92,92,92,92,92,92,92,92,207,92,53,53,226,175,19,92,92,92,175,92,258,92,92,53,226,53,53,226,226,53,53,53,]),'SEMI':([6,7,18,19,31,40,49,54,56,57,58,59,60,61,62,63,64,65,66,67,68,77,78,79,80,81,82,83,84,85,86,92,93,95,96,99,100,101,102,105,106,111,125,126,146,148,157,158,160,161,168,169,171,174,175,177,178,179,183,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,205,208,209,211,212,214,215,216,217,231,232,233,234,238,244,245,247,248,253,257,258,261,262,263,264,266,269,271,272,274,275,276,277,278,],[8,9,35,-16,45,-70,-17,-70,111,-58,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-131,-70,121,-18,-19,-20,-21,-22,-23,-24,-25,-38,130,-80,-81,-126,-127,-128,-129,154,155,-70,180,-33,-91,-117,-40,-94,-59,-71,-70,-70,227,-36,-37,-28,-29,-30,-53,-88,-82,-83,-84,-85,-86,-87,-89,-92,-93,-115,-122,-123,-124,-125,-90,-116,-48,-39,-72,-73,-77,-95,-97,246,-103,-31,-32,-34,-52,256,-70,-98,-70,-70,-35,-49,-41,-96,-99,-70,-102,-104,-26,-70,-70,-100,-27,-78,-79,-101,]),'USES':([8,],[11,]),'VAR':([8,10,12,26,27,32,33,35,37,47,130,155,256,],[-130,15,-5,15,-45,46,-11,-4,15,-10,-12,-47,-46,]),'CONST':([8,10,12,26,27,35,37,155,256,],[-130,17,-5,17,-45,-4,17,-47,-46,]),'FUNCTION':([8,10,12,13,14,16,20,21,24,28,29,32,33,35,37,38,43,45,47,50,91,121,130,155,227,256,],[-130,-130,-5,22,22,-7,22,-56,22,-6,-14,-8,-11,-4,-130,-55,-13,-132,-10,22,-9,-15,-12,-47,-44,-46,]),'BEGIN':([8,10,12,14,16,23,24,25,26,27,28,29,32,33,35,40,41,42,43,45,47,54,77,91,111,121,130,155,168,169,227,244,247,248,256,263,271,272,],[-130,-130,-5,-130,-7,40,-130,-43,-130,-45,-6,-14,-8,-11,-4,54,-42,77,-13,-132,-10,54,54,-9,54,-15,-12,-47,54,54,-44,54,54,54,-46,54,54,54,]),'INTERFACE':([9,],[13,]),'error':([15,28,29,40,43,45,46,54,77,91,111,121,168,169,244,247,248,263,271,272,],[31,31,-14,68,-13,-132,31,68,68,31,68,-15,68,68,68,68,68,68,68,68,]),'END':([16,24,25,28,29,32,33,37,40,41,43,45,47,50,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,77,79,80,81,82,83,84,85,86,91,92,95,96,99,100,101,102,103,109,111,120,121,125,126,130,146,148,157,158,160,161,168,169,174,175,177,178,179,180,183,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,209,211,212,214,215,216,217,227,231,232,233,234,244,245,246,247,248,253,258,261,262,263,264,265,266,269,271,272,273,274,275,276,277,278,],[-7,-130,-43,-6,-14,-8,-11,-130,-70,-42,-13,-132,-10,-130,-70,110,-57,-58,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-131,-70,-18,-19,-20,-21,-22,-23,-24,-25,-9,-38,-80,-81,-126,-127,-128,-129,151,158,-70,171,-15,179,-33,-12,-91,-117,-40,-94,-59,-71,-70,-70,-36,-37,-28,-29,-30,231,-53,-88,-82,-83,-84,-85,-86,-87,-89,-92,-93,-115,-122,-123,-124,-125,-90,-116,-39,-72,-73,-77,-95,-97,245,-103,-44,-31,-32,-34,-52,-70,-98,262,-70,-70,-35,-41,-96,-99,-70,-102,274,-104,-26,-70,-70,278,-100,-27,-78,-79,-101,]),'COLON':([19,30,39,49,104,127,153,207,218,219,220,221,223,224,225,226,251,267,268,],[-16,44,52,-17,152,181,206,239,248,-106,-107,-109,-111,-112,-113,-114,-110,-105,-108,]),'COMMA':([19,92,95,96,99,100,101,102,146,147,148,149,150,157,162,163,164,165,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,218,219,220,221,223,224,225,226,234,236,237,241,251,255,258,267,268,],[36,-38,-80,-81,-126,-127,-128,-129,-91,202,-117,-119,-120,-40,210,-75,-76,210,235,-53,-50,-88,-82,-83,-84,-85,-86,-87,-89,-92,-93,-115,-122,-123,-124,-125,-90,-116,-39,249,-106,-107,-109,-111,-112,-113,-114,-52,-118,-121,-74,-110,-51,-41,-105,-108,]),'IMPLEMENTATION':([20,21,38,155,256,],[37,-56,-55,-47,-46,]),'EQ':([34,92,93,95,96,99,100,101,102,117,118,119,145,146,148,150,156,157,161,164,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,213,234,237,255,258,259,260,],[48,-38,129,-80,-81,-126,-127,-128,-129,129,129,129,129,-91,-117,129,129,-40,129,129,-53,129,None,129,129,None,None,None,None,None,-92,-93,None,-122,-123,-124,-125,-90,-116,-39,129,-52,129,129,-41,129,129,]),'LPAREN':([39,48,70,71,72,74,75,76,92,94,97,98,107,112,113,114,128,129,131,132,133,134,135,136,137,138,139,140,141,142,143,144,167,202,203,210,235,242,243,],[51,94,113,114,115,94,94,94,128,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,]),'WRITELN':([40,54,77,111,168,169,244,247,248,263,271,272,],[70,70,70,70,70,70,70,70,70,70,70,70,]),'WRITE':([40,54,77,111,168,169,244,247,248,263,271,272,],[71,71,71,71,71,71,71,71,71,71,71,71,]),'READLN':([40,54,77,111,168,169,244,247,248,263,271,272,],[72,72,72,72,72,72,72,72,72,72,72,72,]),'FOR':([40,54,77,111,168,169,244,247,248,263,271,272,],[73,73,73,73,73,73,73,73,73,73,73,73,]),'IF':([40,54,77,111,168,169,244,247,248,263,271,272,],[74,74,74,74,74,74,74,74,74,74,74,74,]),'WHILE':([40,54,77,111,168,169,244,247,248,263,271,272,],[75,75,75,75,75,75,75,75,75,75,75,75,]),'CASE':([40,54,77,111,168,169,244,247,248,263,271,272,],[76,76,76,76,76,76,76,76,76,76,76,76,]),'INTEGER':([44,52,152,181,206,239,252,270,],[83,83,83,83,83,83,83,83,]),'BOOLEAN':([44,52,124,152,181,206,239,252,270,],[84,84,178,84,84,84,84,84,84,]),'STRING':([44,52,152,181,206,239,252,270,],[85,85,85,85,85,85,85,85,]),'REAL':([44,48,52,74,75,76,94,97,98,107,112,113,114,128,129,131,132,133,134,135,136,137,138,139,140,141,142,143,144,152,167,181,202,203,206,210,235,239,242,243,252,270,],[86,102,86,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,86,102,86,102,102,86,102,102,86,102,102,86,86,]),'ARRAY':([44,52,88,152,181,206,239,252,270,],[87,87,123,87,87,87,87,87,87,]),'PACKED':([44,52,152,181,206,239,252,270,],[88,88,88,88,88,88,88,88,]),'SET':([44,52,152,181,206,239,252,270,],[89,89,89,89,89,89,89,89,]),'RECORD':([44,52,152,181,206,239,252,270,],[90,90,90,90,90,90,90,90,]),'TRUE':([48,74,75,76,94,97,98,107,112,113,114,128,129,131,132,133,134,135,136,137,138,139,140,141,142,143,144,167,170,202,203,210,235,242,243,246,249,250,],[95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,224,95,95,95,95,95,95,224,224,224,]),'FALSE':([48,74,75,76,94,97,98,107,112,113,114,128,129,131,132,133,134,135,136,137,138,139,140,141,142,143,144,167,170,202,203,210,235,242,243,246,249,250,],[96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,225,96,96,96,96,96,96,225,225,225,]),'MINUS':([48,74,75,76,92,93,94,95,96,97,98,99,100,101,102,107,112,113,114,117,118,119,128,129,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,150,156,157,161,164,167,170,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,208,210,213,234,235,237,242,243,246,249,250,255,258,259,260,],[97,97,97,97,-38,142,97,-80,-81,97,97,-126,-127,-128,-129,97,97,97,97,142,142,142,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,142,-91,-117,142,142,-40,142,142,97,222,-53,142,142,142,142,142,142,142,142,142,-92,-93,142,-122,-123,-124,-125,-90,-116,97,97,-39,97,142,-52,97,142,97,97,222,222,222,142,-41,142,142,]),'LBRACKET':([48,53,74,75,76,87,92,94,97,98,107,112,113,114,123,128,129,131,132,133,134,135,136,137,138,139,140,141,142,143,144,167,202,203,210,235,242,243,],[98,107,98,98,98,122,107,98,98,98,98,98,98,98,176,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,]),'STRING_LITERAL':([48,74,75,76,94,97,98,107,112,113,114,128,129,131,132,133,134,135,136,137,138,139,140,141,142,143,144,167,170,202,203,210,235,242,243,246,249,250,],[100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,223,100,100,100,100,100,100,223,223,223,]),'NUMBER':([48,74,75,76,94,97,98,107,112,113,114,122,124,128,129,131,132,133,134,135,136,137,138,139,140,141,142,143,144,167,170,176,202,203,210,222,229,235,242,243,246,249,250,],[101,101,101,101,101,101,101,101,101,101,101,174,174,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,221,174,101,101,101,251,174,101,101,101,221,221,221,]),'ASSIGN':([53,69,116,157,208,258,],[-38,112,167,-40,-39,-41,]),'RPAREN':([53,79,80,81,82,83,84,85,86,92,95,96,99,100,101,102,105,128,145,146,148,157,162,163,164,165,166,174,175,177,178,179,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,205,208,231,234,241,253,255,257,258,269,275,],[-38,-18,-19,-20,-21,-22,-23,-24,-25,-38,-80,-81,-126,-127,-128,-129,153,183,200,-91,-117,-40,209,-75,-76,211,212,-36,-37,-28,-29,-30,234,-53,-50,-88,-82,-83,-84,-85,-86,-87,-89,-92,-93,-115,-122,-123,-124,-125,-90,-116,-48,-39,-31,-52,-74,-35,-51,-49,-41,-26,-27,]),'DOT':([53,92,110,151,208,],[108,108,159,204,240,]),'ELSE':([58,59,60,61,62,63,64,65,66,67,68,92,95,96,99,100,101,102,146,148,157,158,161,168,169,183,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,209,211,212,214,215,216,217,234,244,245,246,248,258,261,262,264,266,271,272,274,276,277,278,],[-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-131,-38,-80,-81,-126,-127,-128,-129,-91,-117,-40,-94,-71,-70,-70,-53,-88,-82,-83,-84,-85,-86,-87,-89,-92,-93,-115,-122,-123,-124,-125,-90,-116,-39,-72,-73,-77,244,-97,247,-103,-52,-70,-98,263,-70,-41,-96,-99,-102,-104,-70,-70,-100,-78,-79,-101,]),'OF':([89,92,95,96,99,100,101,102,119,146,148,157,183,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,228,234,254,258,],[124,-38,-80,-81,-126,-127,-128,-129,170,-91,-117,-40,-53,-88,-82,-83,-84,-85,-86,-87,-89,-92,-93,-115,-122,-123,-124,-125,-90,-116,-39,252,-52,270,-41,]),'AND':([92,93,95,96,99,100,101,102,117,118,119,145,146,148,150,156,157,161,164,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,213,234,237,255,258,259,260,],[-38,131,-80,-81,-126,-127,-128,-129,131,131,131,131,-91,-117,131,131,-40,131,131,-53,131,-88,-82,131,-84,-85,-86,-87,-89,-92,-93,-115,-122,-123,-124,-125,-90,-116,-39,131,-52,131,131,-41,131,131,]),'OR':([92,93,95,96,99,100,101,102,117,118,119,145,146,148,150,156,157,161,164,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,213,234,237,255,258,259,260,],[-38,132,-80,-81,-126,-127,-128,-129,132,132,132,132,-91,-117,132,132,-40,132,132,-53,132,-88,-82,-83,-84,-85,-86,-87,-89,-92,-93,-115,-122,-123,-124,-125,-90,-116,-39,132,-52,132,132,-41,132,132,]),'LT':([92,93,95,96,99,100,101,102,117,118,119,145,146,148,150,156,157,161,164,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,213,234,237,255,258,259,260,],[-38,133,-80,-81,-126,-127,-128,-129,133,133,133,133,-91,-117,133,133,-40,133,133,-53,133,None,133,133,None,None,None,None,None,-92,-93,None,-122,-123,-124,-125,-90,-116,-39,133,-52,133,133,-41,133,133,]),'LE':([92,93,95,96,99,100,101,102,117,118,119,145,146,148,150,156,157,161,164,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,213,234,237,255,258,259,260,],[-38,134,-80,-81,-126,-127,-128,-129,134,134,134,134,-91,-117,134,134,-40,134,134,-53,134,None,134,134,None,None,None,None,None,-92,-93,None,-122,-123,-124,-125,-90,-116,-39,134,-52,134,134,-41,134,134,]),'GT':([92,93,95,96,99,100,101,102,117,118,119,145,146,148,150,156,157,161,164,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,213,234,237,255,258,259,260,],[-38,135,-80,-81,-126,-127,-128,-129,135,135,135,135,-91,-117,135,135,-40,135,135,-53,135,None,135,135,None,None,None,None,None,-92,-93,None,-122,-123,-124,-125,-90,-116,-39,135,-52,135,135,-41,135,135,]),'GE':([92,93,95,96,99,100,101,102,117,118,119,145,146,148,150,156,157,161,164,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,213,234,237,255,258,259,260,],[-38,136,-80,-81,-126,-127,-128,-129,136,136,136,136,-91,-117,136,136,-40,136,136,-53,136,None,136,136,None,None,None,None,None,-92,-93,None,-122,-123,-124,-125,-90,-116,-39,136,-52,136,136,-41,136,136,]),'NEQ':([92,93,95,96,99,100,101,102,117,118,119,145,146,148,150,156,157,161,164,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,213,234,237,255,258,259,260,],[-38,137,-80,-81,-126,-127,-128,-129,137,137,137,137,-91,-117,137,137,-40,137,137,-53,137,None,137,137,None,None,None,None,None,-92,-93,None,-122,-123,-124,-125,-90,-116,-39,137,-52,137,137,-41,137,137,]),'DIV':([92,93,95,96,99,100,101,102,117,118,119,145,146,148,150,156,157,161,164,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,213,234,237,255,258,259,260,],[-38,138,-80,-81,-126,-127,-128,-129,138,138,138,138,-91,-117,138,138,-40,138,138,-53,138,138,138,138,138,138,138,138,138,-92,-93,138,138,138,-124,-125,-90,-116,-39,138,-52,138,138,-41,138,138,]),'MOD':([92,93,95,96,99,100,101,102,117,118,119,145,146,148,150,156,157,161,164,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,213,234,237,255,258,259,260,],[-38,139,-80,-81,-126,-127,-128,-129,139,139,139,139,-91,-117,139,139,-40,139,139,-53,139,139,139,139,139,139,139,139,139,-92,-93,139,139,139,-124,-125,-90,-116,-39,139,-52,139,139,-41,139,139,]),'IN':([92,93,95,96,99,100,101,102,117,118,119,145,146,148,150,156,157,161,164,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,213,234,237,255,258,259,260,],[-38,140,-80,-81,-126,-127,-128,-129,140,140,140,140,-91,-117,140,140,-40,140,140,-53,140,None,140,140,None,None,None,None,None,-92,-93,None,-122,-123,-124,-125,-90,-116,-39,140,-52,140,140,-41,140,140,]),'PLUS':([92,93,95,96,99,100,101,102,117,118,119,145,146,148,150,156,157,161,164,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,213,234,237,255,258,259,260,],[-38,141,-80,-81,-126,-127,-128,-129,141,141,141,141,-91,-117,141,141,-40,141,141,-53,141,141,141,141,141,141,141,141,141,-92,-93,141,-122,-123,-124,-125,-90,-116,-39,141,-52,141,141,-41,141,141,]),'TIMES':([92,93,95,96,99,100,101,102,117,118,119,145,146,148,150,156,157,161,164,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,213,234,237,255,258,259,260,],[-38,143,-80,-81,-126,-127,-128,-129,143,143,143,143,-91,-117,143,143,-40,143,143,-53,143,143,143,143,143,143,143,143,143,-92,-93,143,143,143,-124,-125,-90,-116,-39,143,-52,143,143,-41,143,143,]),'DIVIDE':([92,93,95,96,99,100,101,102,117,118,119,145,146,148,150,156,157,161,164,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,213,234,237,255,258,259,260,],[-38,144,-80,-81,-126,-127,-128,-129,144,144,144,144,-91,-117,144,144,-40,144,144,-53,144,144,144,144,144,144,144,144,144,-92,-93,144,144,144,-124,-125,-90,-116,-39,144,-52,144,144,-41,144,144,]),'THEN':([92,95,96,99,100,101,102,117,146,148,157,183,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,234,258,],[-38,-80,-81,-126,-127,-128,-129,168,-91,-117,-40,-53,-88,-82,-83,-84,-85,-86,-87,-89,-92,-93,-115,-122,-123,-124,-125,-90,-116,-39,-52,-41,]),'DO':([92,95,96,99,100,101,102,118,146,148,157,183,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,234,258,259,260,],[-38,-80,-81,-126,-127,-128,-129,169,-91,-117,-40,-53,-88,-82,-83,-84,-85,-86,-87,-89,-92,-93,-115,-122,-123,-124,-125,-90,-116,-39,-52,-41,271,272,]),'DOTDOT':([92,95,96,99,100,101,102,146,148,150,157,173,174,175,183,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,220,221,223,224,225,226,234,251,258,],[-38,-80,-81,-126,-127,-128,-129,-91,-117,203,-40,229,-36,-37,-53,-88,-82,-83,-84,-85,-86,-87,-89,-92,-93,-115,-122,-123,-124,-125,-90,-116,-39,250,-109,-111,-112,-113,-114,-52,-110,-41,]),'RBRACKET':([92,95,96,98,99,100,101,102,146,147,148,149,150,156,157,172,174,175,183,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,230,234,236,237,253,258,],[-38,-80,-81,148,-126,-127,-128,-129,-91,201,-117,-119,-120,208,-40,228,-36,-37,-53,-88,-82,-83,-84,-85,-86,-87,-89,-92,-93,-115,-122,-123,-124,-125,-90,-116,-39,254,-52,-118,-121,-35,-41,]),'TO':([92,95,96,99,100,101,102,146,148,157,183,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,213,234,258,],[-38,-80,-81,-126,-127,-128,-129,-91,-117,-40,-53,-88,-82,-83,-84,-85,-86,-87,-89,-92,-93,-115,-122,-123,-124,-125,-90,-116,-39,242,-52,-41,]),'DOWNTO':([92,95,96,99,100,101,102,146,148,157,183,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,208,213,234,258,],[-38,-80,-81,-126,-127,-128,-129,-91,-117,-40,-53,-88,-82,-83,-84,-85,-86,-87,-89,-92,-93,-115,-122,-123,-124,-125,-90,-116,-39,243,-52,-41,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'declarations':([4,155,],[5,160,]),'empty':([4,5,9,155,],[7,10,10,7,]),'functions':([5,9,],[8,17,]),'function':([5,9,],[9,9,]),'var_declaration_list':([6,],[12,]),'var_declaration':([6,12,],[13,19,]),'id_list':([6,12,21,],[14,14,52,]),'statements':([16,23,163,],[24,54,164,]),'statement_sequence':([16,23,163,],[25,25,25,]),'statement':([16,23,56,87,104,144,158,159,163,],[26,26,79,116,135,153,161,162,26,]),'assignment_statement':([16,23,56,87,104,144,158,159,163,],[27,27,27,27,27,27,27,27,27,]),'writeln_statement':([16,23,56,87,104,144,158,159,163,],[28,28,28,28,28,28,28,28,28,]),'write_statement':([16,23,56,87,104,144,158,159,163,],[29,29,29,29,29,29,29,29,29,]),'readln_statement':([16,23,56,87,104,144,158,159,163,],[30,30,30,30,30,30,30,30,30,]),'for_statement':([16,23,56,87,104,144,158,159,163,],[31,31,31,31,31,31,31,31,31,]),'if_statement':([16,23,56,87,104,144,158,159,163,],[32,32,32,32,32,32,32,32,32,]),'while_statement':([16,23,56,87,104,144,158,159,163,],[33,33,33,33,33,33,33,33,33,]),'statement_compound':([16,23,56,87,104,144,158,159,163,],[34,34,34,34,34,34,34,34,34,]),'concrete_empty_statement':([16,23,56,87,104,144,158,159,163,],[35,35,35,35,35,35,35,35,35,]),'variable':([16,23,41,42,53,56,57,58,59,60,64,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,104,112,142,143,144,146,158,159,163,],[36,36,67,67,67,36,67,67,67,85,67,67,36,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,36,67,67,67,36,67,36,36,36,]),'type':([20,105,137,148,149,],[44,136,147,156,157,]),'simple_type':([20,105,137,148,149,],[45,45,45,45,45,]),'array_type':([20,105,137,148,149,],[46,46,46,46,46,]),'expression':([41,42,53,57,58,59,64,86,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,112,142,143,146,],[62,71,76,80,83,83,103,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,133,83,151,152,154,]),'param_list':([43,],[73,]),'writelist':([58,59,],[81,84,]),'writeitem':([58,59,112,],[82,82,141,]),'index_range':([75,],[108,]),'argument_list':([102,],[131,]),}
+_lr_goto_items = {'source':([0,],[1,]),'program':([0,],[2,]),'unit':([0,],[3,]),'uses_clause':([8,],[10,]),'empty':([8,10,14,24,26,37,50,],[12,16,25,25,16,16,25,]),'declarations':([10,26,37,],[14,42,50,]),'id_list':([11,15,28,36,46,90,91,180,],[18,30,30,49,30,127,30,127,]),'interface_list':([13,],[20,]),'function_signature':([13,14,20,24,50,],[21,27,38,27,27,]),'functions':([14,24,50,],[23,41,103,]),'function':([14,24,50,],[24,24,24,]),'function_header':([14,24,50,],[26,26,26,]),'var_declaration_list':([15,46,],[28,91,]),'var_declaration':([15,28,46,91,],[29,43,29,43,]),'const_declaration_list':([17,],[32,]),'const_declaration':([17,32,],[33,47,]),'statements':([40,54,77,247,263,],[55,109,120,265,273,]),'statement_sequence':([40,54,77,247,263,],[56,56,56,56,56,]),'statement':([40,54,77,111,168,169,244,247,248,263,271,272,],[57,57,57,160,214,215,261,57,266,57,276,277,]),'assignment_statement':([40,54,77,111,168,169,244,247,248,263,271,272,],[58,58,58,58,58,58,58,58,58,58,58,58,]),'writeln_statement':([40,54,77,111,168,169,244,247,248,263,271,272,],[59,59,59,59,59,59,59,59,59,59,59,59,]),'write_statement':([40,54,77,111,168,169,244,247,248,263,271,272,],[60,60,60,60,60,60,60,60,60,60,60,60,]),'readln_statement':([40,54,77,111,168,169,244,247,248,263,271,272,],[61,61,61,61,61,61,61,61,61,61,61,61,]),'for_statement':([40,54,77,111,168,169,244,247,248,263,271,272,],[62,62,62,62,62,62,62,62,62,62,62,62,]),'if_statement':([40,54,77,111,168,169,244,247,248,263,271,272,],[63,63,63,63,63,63,63,63,63,63,63,63,]),'while_statement':([40,54,77,111,168,169,244,247,248,263,271,272,],[64,64,64,64,64,64,64,64,64,64,64,64,]),'case_statement':([40,54,77,111,168,169,244,247,248,263,271,272,],[65,65,65,65,65,65,65,65,65,65,65,65,]),'statement_compound':([40,54,77,111,168,169,244,247,248,263,271,272,],[66,66,66,66,66,66,66,66,66,66,66,66,]),'concrete_empty_statement':([40,54,77,111,168,169,244,247,248,263,271,272,],[67,67,67,67,67,67,67,67,67,67,67,67,]),'variable':([40,48,54,74,75,76,77,94,97,98,107,111,112,113,114,115,128,129,131,132,133,134,135,136,137,138,139,140,141,142,143,144,167,168,169,202,203,210,235,242,243,244,247,248,263,271,272,],[69,99,69,99,99,99,69,99,99,99,99,69,99,99,99,166,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,69,69,99,99,99,99,99,99,69,69,69,69,69,69,]),'type':([44,52,152,181,206,239,252,270,],[78,106,205,233,238,257,269,275,]),'simple_type':([44,52,152,181,206,239,252,270,],[79,79,79,79,79,79,79,79,]),'array_type':([44,52,152,181,206,239,252,270,],[80,80,80,80,80,80,80,80,]),'set_type':([44,52,152,181,206,239,252,270,],[81,81,81,81,81,81,81,81,]),'record_type':([44,52,152,181,206,239,252,270,],[82,82,82,82,82,82,82,82,]),'expression':([48,74,75,76,94,97,98,107,112,113,114,128,129,131,132,133,134,135,136,137,138,139,140,141,142,143,144,167,202,203,210,235,242,243,],[93,117,118,119,145,146,150,156,161,164,164,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,213,150,237,164,255,259,260,]),'param_list':([51,],[105,]),'field_list':([90,],[125,]),'field_declaration':([90,180,],[126,232,]),'set_element_list':([98,],[147,]),'set_element':([98,202,],[149,236,]),'writelist':([113,114,],[162,165,]),'writeitem':([113,114,210,],[163,163,241,]),'index_range':([122,124,176,],[172,177,230,]),'index_bound':([122,124,176,229,],[173,173,173,253,]),'argument_list':([128,],[182,]),'case_list':([170,],[216,]),'case_element':([170,246,],[217,264,]),'case_label_list':([170,246,],[218,218,]),'case_label':([170,246,249,],[219,219,267,]),'case_constant':([170,246,249,250,],[220,220,220,268,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -26,80 +26,137 @@ for _k, _v in _lr_goto_items.items():
        _lr_goto[_x][_k] = _y
 del _lr_goto_items
 _lr_productions = [
-  ("S' -> program","S'",1,None,None,None),
-  ('program -> PROGRAM ID SEMI declarations functions BEGIN statements END DOT','program',9,'p_program','pascal_gt.py',33),
-  ('declarations -> VAR var_declaration_list','declarations',2,'p_declarations','pascal_gt.py',48),
-  ('declarations -> empty','declarations',1,'p_declarations','pascal_gt.py',49),
-  ('var_declaration_list -> var_declaration_list var_declaration','var_declaration_list',2,'p_var_declaration_list','pascal_gt.py',53),
-  ('var_declaration_list -> var_declaration','var_declaration_list',1,'p_var_declaration_list','pascal_gt.py',54),
-  ('var_declaration -> id_list COLON type SEMI','var_declaration',4,'p_var_declaration','pascal_gt.py',58),
-  ('id_list -> ID','id_list',1,'p_id_list','pascal_gt.py',87),
-  ('id_list -> ID COMMA id_list','id_list',3,'p_id_list','pascal_gt.py',88),
-  ('type -> simple_type','type',1,'p_type','pascal_gt.py',92),
-  ('type -> array_type','type',1,'p_type','pascal_gt.py',93),
-  ('simple_type -> INTEGER','simple_type',1,'p_simple_type','pascal_gt.py',97),
-  ('simple_type -> BOOLEAN','simple_type',1,'p_simple_type','pascal_gt.py',98),
-  ('simple_type -> STRING','simple_type',1,'p_simple_type','pascal_gt.py',99),
-  ('simple_type -> REAL','simple_type',1,'p_simple_type','pascal_gt.py',100),
-  ('array_type -> ARRAY LBRACKET index_range RBRACKET OF type','array_type',6,'p_array_type','pascal_gt.py',104),
-  ('index_range -> NUMBER DOTDOT NUMBER','index_range',3,'p_index_range','pascal_gt.py',110),
-  ('variable -> ID','variable',1,'p_variable','pascal_gt.py',114),
-  ('variable -> ID LBRACKET expression RBRACKET','variable',4,'p_variable','pascal_gt.py',115),
-  ('functions -> function functions','functions',2,'p_functions','pascal_gt.py',176),
-  ('functions -> empty','functions',1,'p_functions','pascal_gt.py',177),
-  ('function -> FUNCTION ID LPAREN param_list RPAREN COLON type SEMI declarations BEGIN statements END SEMI','function',13,'p_function','pascal_gt.py',181),
-  ('param_list -> ID COLON type','param_list',3,'p_param_list_single','pascal_gt.py',192),
-  ('param_list -> param_list SEMI ID COLON type','param_list',5,'p_param_list_multiple','pascal_gt.py',196),
-  ('argument_list -> expression','argument_list',1,'p_argument_list_single','pascal_gt.py',201),
-  ('argument_list -> argument_list COMMA expression','argument_list',3,'p_argument_list_multiple','pascal_gt.py',206),
-  ('expression -> ID LPAREN argument_list RPAREN','expression',4,'p_expression_function_call','pascal_gt.py',212),
-  ('expression -> ID LPAREN RPAREN','expression',3,'p_expression_function_call','pascal_gt.py',213),
-  ('statements -> statement_sequence','statements',1,'p_statements','pascal_gt.py',240),
-  ('statement_sequence -> statement','statement_sequence',1,'p_statement_sequence','pascal_gt.py',244),
-  ('statement_sequence -> statement_sequence SEMI statement','statement_sequence',3,'p_statement_sequence','pascal_gt.py',245),
-  ('statement -> assignment_statement','statement',1,'p_statement','pascal_gt.py',259),
-  ('statement -> writeln_statement','statement',1,'p_statement','pascal_gt.py',260),
-  ('statement -> write_statement','statement',1,'p_statement','pascal_gt.py',261),
-  ('statement -> readln_statement','statement',1,'p_statement','pascal_gt.py',262),
-  ('statement -> for_statement','statement',1,'p_statement','pascal_gt.py',263),
-  ('statement -> if_statement','statement',1,'p_statement','pascal_gt.py',264),
-  ('statement -> while_statement','statement',1,'p_statement','pascal_gt.py',265),
-  ('statement -> statement_compound','statement',1,'p_statement','pascal_gt.py',266),
-  ('statement -> concrete_empty_statement','statement',1,'p_statement','pascal_gt.py',267),
-  ('concrete_empty_statement -> <empty>','concrete_empty_statement',0,'p_concrete_empty_statement','pascal_gt.py',271),
-  ('assignment_statement -> variable ASSIGN expression','assignment_statement',3,'p_assignment_statement','pascal_gt.py',275),
-  ('writeln_statement -> WRITELN LPAREN writelist RPAREN','writeln_statement',4,'p_writeln_statement','pascal_gt.py',316),
-  ('write_statement -> WRITE LPAREN writelist RPAREN','write_statement',4,'p_write_statement','pascal_gt.py',320),
-  ('writelist -> writelist COMMA writeitem','writelist',3,'p_writelist','pascal_gt.py',324),
-  ('writelist -> writeitem','writelist',1,'p_writelist','pascal_gt.py',325),
-  ('writeitem -> expression','writeitem',1,'p_writeitem_expr','pascal_gt.py',329),
-  ('readln_statement -> READLN LPAREN variable RPAREN','readln_statement',4,'p_readln_statement','pascal_gt.py',344),
-  ('for_statement -> FOR ID ASSIGN expression TO expression DO statement','for_statement',8,'p_for_statement','pascal_gt.py',403),
-  ('for_statement -> FOR ID ASSIGN expression DOWNTO expression DO statement','for_statement',8,'p_for_statement','pascal_gt.py',404),
-  ('expression -> TRUE','expression',1,'p_expression_boolean','pascal_gt.py',465),
-  ('expression -> FALSE','expression',1,'p_expression_boolean','pascal_gt.py',466),
-  ('expression -> expression AND expression','expression',3,'p_expression_logical','pascal_gt.py',470),
-  ('expression -> expression OR expression','expression',3,'p_expression_logical','pascal_gt.py',471),
-  ('expression -> expression LT expression','expression',3,'p_expression_relop','pascal_gt.py',478),
-  ('expression -> expression LE expression','expression',3,'p_expression_relop','pascal_gt.py',479),
-  ('expression -> expression GT expression','expression',3,'p_expression_relop','pascal_gt.py',480),
-  ('expression -> expression GE expression','expression',3,'p_expression_relop','pascal_gt.py',481),
-  ('expression -> expression EQ expression','expression',3,'p_expression_relop','pascal_gt.py',482),
-  ('expression -> expression NEQ expression','expression',3,'p_expression_relop','pascal_gt.py',483),
-  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_paren','pascal_gt.py',515),
-  ('expression -> expression DIV expression','expression',3,'p_expression_div','pascal_gt.py',519),
-  ('expression -> expression MOD expression','expression',3,'p_expression_mod','pascal_gt.py',525),
-  ('statement_compound -> BEGIN statements END','statement_compound',3,'p_statement_compound','pascal_gt.py',531),
-  ('if_statement -> IF expression THEN statement','if_statement',4,'p_if_statement','pascal_gt.py',535),
-  ('if_statement -> IF expression THEN statement ELSE statement','if_statement',6,'p_if_statement','pascal_gt.py',536),
-  ('while_statement -> WHILE expression DO statement','while_statement',4,'p_while_statement','pascal_gt.py',565),
-  ('expression -> expression PLUS expression','expression',3,'p_expression_binop','pascal_gt.py',583),
-  ('expression -> expression MINUS expression','expression',3,'p_expression_binop','pascal_gt.py',584),
-  ('expression -> expression TIMES expression','expression',3,'p_expression_binop','pascal_gt.py',585),
-  ('expression -> expression DIVIDE expression','expression',3,'p_expression_binop','pascal_gt.py',586),
-  ('expression -> variable','expression',1,'p_expression_from_variable','pascal_gt.py',622),
-  ('expression -> STRING_LITERAL','expression',1,'p_expression_from_literal_string','pascal_gt.py',679),
-  ('expression -> NUMBER','expression',1,'p_expression_number','pascal_gt.py',684),
-  ('expression -> REAL','expression',1,'p_expression_real','pascal_gt.py',688),
-  ('empty -> <empty>','empty',0,'p_empty','pascal_gt.py',692),
+  ("S' -> source","S'",1,None,None,None),
+  ('source -> program','source',1,'p_source','pascal_gt.py',86),
+  ('source -> unit','source',1,'p_source','pascal_gt.py',87),
+  ('program -> PROGRAM ID SEMI uses_clause declarations functions BEGIN statements END DOT','program',10,'p_program','pascal_gt.py',94),
+  ('uses_clause -> USES id_list SEMI','uses_clause',3,'p_uses_clause','pascal_gt.py',138),
+  ('uses_clause -> empty','uses_clause',1,'p_uses_clause','pascal_gt.py',139),
+  ('declarations -> VAR var_declaration_list','declarations',2,'p_declarations','pascal_gt.py',147),
+  ('declarations -> empty','declarations',1,'p_declarations','pascal_gt.py',148),
+  ('declarations -> CONST const_declaration_list','declarations',2,'p_declarations_const','pascal_gt.py',153),
+  ('declarations -> CONST const_declaration_list VAR var_declaration_list','declarations',4,'p_declarations_const','pascal_gt.py',154),
+  ('const_declaration_list -> const_declaration_list const_declaration','const_declaration_list',2,'p_const_declaration_list','pascal_gt.py',159),
+  ('const_declaration_list -> const_declaration','const_declaration_list',1,'p_const_declaration_list','pascal_gt.py',160),
+  ('const_declaration -> ID EQ expression SEMI','const_declaration',4,'p_const_declaration','pascal_gt.py',166),
+  ('var_declaration_list -> var_declaration_list var_declaration','var_declaration_list',2,'p_var_declaration_list','pascal_gt.py',190),
+  ('var_declaration_list -> var_declaration','var_declaration_list',1,'p_var_declaration_list','pascal_gt.py',191),
+  ('var_declaration -> id_list COLON type SEMI','var_declaration',4,'p_var_declaration','pascal_gt.py',196),
+  ('id_list -> ID','id_list',1,'p_id_list','pascal_gt.py',260),
+  ('id_list -> ID COMMA id_list','id_list',3,'p_id_list','pascal_gt.py',261),
+  ('type -> simple_type','type',1,'p_type','pascal_gt.py',266),
+  ('type -> array_type','type',1,'p_type','pascal_gt.py',267),
+  ('type -> set_type','type',1,'p_type','pascal_gt.py',268),
+  ('type -> record_type','type',1,'p_type','pascal_gt.py',269),
+  ('simple_type -> INTEGER','simple_type',1,'p_simple_type','pascal_gt.py',274),
+  ('simple_type -> BOOLEAN','simple_type',1,'p_simple_type','pascal_gt.py',275),
+  ('simple_type -> STRING','simple_type',1,'p_simple_type','pascal_gt.py',276),
+  ('simple_type -> REAL','simple_type',1,'p_simple_type','pascal_gt.py',277),
+  ('array_type -> ARRAY LBRACKET index_range RBRACKET OF type','array_type',6,'p_array_type','pascal_gt.py',282),
+  ('array_type -> PACKED ARRAY LBRACKET index_range RBRACKET OF type','array_type',7,'p_packed_array_type','pascal_gt.py',289),
+  ('set_type -> SET OF index_range','set_type',3,'p_set_type','pascal_gt.py',298),
+  ('set_type -> SET OF BOOLEAN','set_type',3,'p_set_type','pascal_gt.py',299),
+  ('record_type -> RECORD field_list END','record_type',3,'p_record_type','pascal_gt.py',309),
+  ('record_type -> RECORD field_list SEMI END','record_type',4,'p_record_type','pascal_gt.py',310),
+  ('field_list -> field_list SEMI field_declaration','field_list',3,'p_field_list','pascal_gt.py',321),
+  ('field_list -> field_declaration','field_list',1,'p_field_list','pascal_gt.py',322),
+  ('field_declaration -> id_list COLON type','field_declaration',3,'p_field_declaration','pascal_gt.py',327),
+  ('index_range -> index_bound DOTDOT index_bound','index_range',3,'p_index_range','pascal_gt.py',337),
+  ('index_bound -> NUMBER','index_bound',1,'p_index_bound','pascal_gt.py',342),
+  ('index_bound -> ID','index_bound',1,'p_index_bound','pascal_gt.py',343),
+  ('variable -> ID','variable',1,'p_variable','pascal_gt.py',358),
+  ('variable -> ID LBRACKET expression RBRACKET','variable',4,'p_variable','pascal_gt.py',359),
+  ('variable -> ID DOT ID','variable',3,'p_variable_field','pascal_gt.py',469),
+  ('variable -> ID LBRACKET expression RBRACKET DOT ID','variable',6,'p_variable_field','pascal_gt.py',470),
+  ('functions -> function functions','functions',2,'p_functions','pascal_gt.py',549),
+  ('functions -> empty','functions',1,'p_functions','pascal_gt.py',550),
+  ('function -> function_header declarations BEGIN statements END SEMI','function',6,'p_function','pascal_gt.py',555),
+  ('function_header -> function_signature','function_header',1,'p_function_header','pascal_gt.py',590),
+  ('function_signature -> FUNCTION ID LPAREN param_list RPAREN COLON type SEMI','function_signature',8,'p_function_signature','pascal_gt.py',607),
+  ('function_signature -> FUNCTION ID COLON type SEMI','function_signature',5,'p_function_signature','pascal_gt.py',608),
+  ('param_list -> ID COLON type','param_list',3,'p_param_list_single','pascal_gt.py',632),
+  ('param_list -> param_list SEMI ID COLON type','param_list',5,'p_param_list_multiple','pascal_gt.py',637),
+  ('argument_list -> expression','argument_list',1,'p_argument_list_single','pascal_gt.py',661),
+  ('argument_list -> argument_list COMMA expression','argument_list',3,'p_argument_list_multiple','pascal_gt.py',666),
+  ('expression -> ID LPAREN argument_list RPAREN','expression',4,'p_expression_function_call','pascal_gt.py',671),
+  ('expression -> ID LPAREN RPAREN','expression',3,'p_expression_function_call','pascal_gt.py',672),
+  ('unit -> UNIT ID SEMI INTERFACE interface_list IMPLEMENTATION declarations functions END DOT','unit',10,'p_unit','pascal_gt.py',853),
+  ('interface_list -> interface_list function_signature','interface_list',2,'p_interface_list','pascal_gt.py',883),
+  ('interface_list -> function_signature','interface_list',1,'p_interface_list','pascal_gt.py',884),
+  ('statements -> statement_sequence','statements',1,'p_statements','pascal_gt.py',1058),
+  ('statement_sequence -> statement','statement_sequence',1,'p_statement_sequence','pascal_gt.py',1063),
+  ('statement_sequence -> statement_sequence SEMI statement','statement_sequence',3,'p_statement_sequence','pascal_gt.py',1064),
+  ('statement -> assignment_statement','statement',1,'p_statement','pascal_gt.py',1079),
+  ('statement -> writeln_statement','statement',1,'p_statement','pascal_gt.py',1080),
+  ('statement -> write_statement','statement',1,'p_statement','pascal_gt.py',1081),
+  ('statement -> readln_statement','statement',1,'p_statement','pascal_gt.py',1082),
+  ('statement -> for_statement','statement',1,'p_statement','pascal_gt.py',1083),
+  ('statement -> if_statement','statement',1,'p_statement','pascal_gt.py',1084),
+  ('statement -> while_statement','statement',1,'p_statement','pascal_gt.py',1085),
+  ('statement -> case_statement','statement',1,'p_statement','pascal_gt.py',1086),
+  ('statement -> statement_compound','statement',1,'p_statement','pascal_gt.py',1087),
+  ('statement -> concrete_empty_statement','statement',1,'p_statement','pascal_gt.py',1088),
+  ('concrete_empty_statement -> <empty>','concrete_empty_statement',0,'p_concrete_empty_statement','pascal_gt.py',1093),
+  ('assignment_statement -> variable ASSIGN expression','assignment_statement',3,'p_assignment_statement','pascal_gt.py',1098),
+  ('writeln_statement -> WRITELN LPAREN writelist RPAREN','writeln_statement',4,'p_writeln_statement','pascal_gt.py',1176),
+  ('write_statement -> WRITE LPAREN writelist RPAREN','write_statement',4,'p_write_statement','pascal_gt.py',1181),
+  ('writelist -> writelist COMMA writeitem','writelist',3,'p_writelist','pascal_gt.py',1186),
+  ('writelist -> writeitem','writelist',1,'p_writelist','pascal_gt.py',1187),
+  ('writeitem -> expression','writeitem',1,'p_writeitem_expr','pascal_gt.py',1192),
+  ('readln_statement -> READLN LPAREN variable RPAREN','readln_statement',4,'p_readln_statement','pascal_gt.py',1211),
+  ('for_statement -> FOR ID ASSIGN expression TO expression DO statement','for_statement',8,'p_for_statement','pascal_gt.py',1277),
+  ('for_statement -> FOR ID ASSIGN expression DOWNTO expression DO statement','for_statement',8,'p_for_statement','pascal_gt.py',1278),
+  ('expression -> TRUE','expression',1,'p_expression_boolean','pascal_gt.py',1361),
+  ('expression -> FALSE','expression',1,'p_expression_boolean','pascal_gt.py',1362),
+  ('expression -> expression AND expression','expression',3,'p_expression_logical','pascal_gt.py',1367),
+  ('expression -> expression OR expression','expression',3,'p_expression_logical','pascal_gt.py',1368),
+  ('expression -> expression LT expression','expression',3,'p_expression_relop','pascal_gt.py',1376),
+  ('expression -> expression LE expression','expression',3,'p_expression_relop','pascal_gt.py',1377),
+  ('expression -> expression GT expression','expression',3,'p_expression_relop','pascal_gt.py',1378),
+  ('expression -> expression GE expression','expression',3,'p_expression_relop','pascal_gt.py',1379),
+  ('expression -> expression EQ expression','expression',3,'p_expression_relop','pascal_gt.py',1380),
+  ('expression -> expression NEQ expression','expression',3,'p_expression_relop','pascal_gt.py',1381),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_paren','pascal_gt.py',1462),
+  ('expression -> MINUS expression','expression',2,'p_expression_uminus','pascal_gt.py',1467),
+  ('expression -> expression DIV expression','expression',3,'p_expression_div','pascal_gt.py',1481),
+  ('expression -> expression MOD expression','expression',3,'p_expression_mod','pascal_gt.py',1488),
+  ('statement_compound -> BEGIN statements END','statement_compound',3,'p_statement_compound','pascal_gt.py',1495),
+  ('if_statement -> IF expression THEN statement','if_statement',4,'p_if_statement','pascal_gt.py',1500),
+  ('if_statement -> IF expression THEN statement ELSE statement','if_statement',6,'p_if_statement','pascal_gt.py',1501),
+  ('while_statement -> WHILE expression DO statement','while_statement',4,'p_while_statement','pascal_gt.py',1545),
+  ('case_statement -> CASE expression OF case_list END','case_statement',5,'p_case_statement','pascal_gt.py',1583),
+  ('case_statement -> CASE expression OF case_list SEMI END','case_statement',6,'p_case_statement','pascal_gt.py',1584),
+  ('case_statement -> CASE expression OF case_list ELSE statements END','case_statement',7,'p_case_statement','pascal_gt.py',1585),
+  ('case_statement -> CASE expression OF case_list SEMI ELSE statements END','case_statement',8,'p_case_statement','pascal_gt.py',1586),
+  ('case_list -> case_list SEMI case_element','case_list',3,'p_case_list','pascal_gt.py',1808),
+  ('case_list -> case_element','case_list',1,'p_case_list','pascal_gt.py',1809),
+  ('case_element -> case_label_list COLON statement','case_element',3,'p_case_element','pascal_gt.py',1814),
+  ('case_label_list -> case_label_list COMMA case_label','case_label_list',3,'p_case_label_list','pascal_gt.py',1819),
+  ('case_label_list -> case_label','case_label_list',1,'p_case_label_list','pascal_gt.py',1820),
+  ('case_label -> case_constant','case_label',1,'p_case_label','pascal_gt.py',1825),
+  ('case_label -> case_constant DOTDOT case_constant','case_label',3,'p_case_label','pascal_gt.py',1826),
+  ('case_constant -> NUMBER','case_constant',1,'p_case_constant','pascal_gt.py',1831),
+  ('case_constant -> MINUS NUMBER','case_constant',2,'p_case_constant','pascal_gt.py',1832),
+  ('case_constant -> STRING_LITERAL','case_constant',1,'p_case_constant','pascal_gt.py',1833),
+  ('case_constant -> TRUE','case_constant',1,'p_case_constant','pascal_gt.py',1834),
+  ('case_constant -> FALSE','case_constant',1,'p_case_constant','pascal_gt.py',1835),
+  ('case_constant -> ID','case_constant',1,'p_case_constant','pascal_gt.py',1836),
+  ('expression -> expression IN expression','expression',3,'p_expression_in','pascal_gt.py',2111),
+  ('expression -> LBRACKET set_element_list RBRACKET','expression',3,'p_expression_set_constructor','pascal_gt.py',2246),
+  ('expression -> LBRACKET RBRACKET','expression',2,'p_expression_set_constructor','pascal_gt.py',2247),
+  ('set_element_list -> set_element_list COMMA set_element','set_element_list',3,'p_set_element_list','pascal_gt.py',2286),
+  ('set_element_list -> set_element','set_element_list',1,'p_set_element_list','pascal_gt.py',2287),
+  ('set_element -> expression','set_element',1,'p_set_element','pascal_gt.py',2292),
+  ('set_element -> expression DOTDOT expression','set_element',3,'p_set_element','pascal_gt.py',2293),
+  ('expression -> expression PLUS expression','expression',3,'p_expression_binop','pascal_gt.py',2298),
+  ('expression -> expression MINUS expression','expression',3,'p_expression_binop','pascal_gt.py',2299),
+  ('expression -> expression TIMES expression','expression',3,'p_expression_binop','pascal_gt.py',2300),
+  ('expression -> expression DIVIDE expression','expression',3,'p_expression_binop','pascal_gt.py',2301),
+  ('expression -> variable','expression',1,'p_expression_from_variable','pascal_gt.py',2347),
+  ('expression -> STRING_LITERAL','expression',1,'p_expression_from_literal_string','pascal_gt.py',2409),
+  ('expression -> NUMBER','expression',1,'p_expression_number','pascal_gt.py',2415),
+  ('expression -> REAL','expression',1,'p_expression_real','pascal_gt.py',2420),
+  ('empty -> <empty>','empty',0,'p_empty','pascal_gt.py',2424),
+  ('statement -> error','statement',1,'p_statement_error','pascal_gt.py',2440),
+  ('var_declaration -> error SEMI','var_declaration',2,'p_var_declaration_error','pascal_gt.py',2445),
 ]
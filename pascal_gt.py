@@ -1,5 +1,10 @@
+import io
 import sys
+import tempfile
 import ply.yacc as yacc
+import ewvm
+import ewvm_opt
+import pascal_lex
 from pascal_lex import tokens
 
 # ====== Variáveis globais ======
@@ -7,10 +12,25 @@ from pascal_lex import tokens
 # Variáveis para armazenar o estado do parser e informações sobre variáveis e funções
 parser_success = True
 parser_functions = {} # map de nomes de funções para seus códigos
-parser_params = {} 
+parser_params = {} # map de nomes de funções para a lista de parâmetros [(nome, tipo), ...]
+parser_function_types = {} # map de nomes de funções para o tipo de retorno
+parser_current_function = None # assinatura da função a ser compilada (None no programa principal)
+parser_unit_code = [] # código das unidades ligadas, já relocalizado
+parser_unit_paths = ['.'] # directorias onde procurar unidades
+parser_output = None # CodeWriter para onde o programa é escrito à medida que é gerado
+parser_function_spill = None # ficheiro temporário com o código das funções já completas
+parser_pass_manager = ewvm_opt.PassManager(1) # passagens de optimização (nível -O)
+parser_pure_functions = {} # funções puras: nome -> (código, fim das globais que usa)
+parser_eval_budget = 100000 # máximo de instruções por avaliação em tempo de compilação
+parser_check_only = False # só verificação (--check): o código não é optimizado nem escrito
 parser_var = {} # regista variáveis locais
 parser_var_count = 0 
 parser_var_types = {} # armazena os tipos de variáveis
+parser_constants = {} # constantes declaradas em CONST: nome -> (código imediato, tipo)
+parser_negated_conditions = {} # condições AND/OR booleanas: código -> código da negação (None se ambíguo)
+parser_init_code = [] # código executado logo após 'start' (ex.: tabelas de saltos)
+parser_deferred_code = [] # código colocado depois de 'stop' (ex.: ramos de CASE)
+parser_runtime_slots = {} # globais partilhadas por rotinas de suporte (ex.: tabela de potências de 2)
 label_seq_num = 0 # contador de rótulos únicos para saltos
 
 # Função para gerar rótulos únicos para saltos
@@ -19,6 +39,32 @@ def generate_unique_label_num():
     label_seq_num += 1
     return label_seq_num
 
+# Aplica as optimizações activas ao código completo de uma função ou do programa principal
+def optimize_code(code):
+    global parser_success
+    if parser_check_only:
+        return code
+    try:
+        return parser_pass_manager.run(code, allocate_temp_slot)
+    except ewvm_opt.VerificationError as error:
+        print(f"Erro interno na optimização: {error}")
+        parser_success = False
+        return code
+
+# Regista em '//stack N' a profundidade máxima da pilha de cada rotina e avisa de desequilíbrios.
+# Depois de um erro o código está incompleto e os avisos só acrescentariam ruído.
+def annotate_stack(code, routine, entries=()):
+    if parser_check_only or not parser_success:
+        return code
+    code, problems = ewvm_opt.annotate_stack_depths(code, entries)
+    for problem in problems:
+        print(f"Aviso: Pilha desequilibrada em {routine}: {problem}")
+    return code
+
+# Marcador da linha Pascal de origem; é retirado do código final e usado no mapa de fonte
+def line_marker(lineno):
+    return f"//line {lineno}\n"
+
 # ====== Definição da gramática ======
 
 # Definição da precedência dos operadores
@@ -27,29 +73,75 @@ precedence = (
     ('nonassoc', 'ELSE'),   
     ('left', 'OR'),
     ('left', 'AND'),
-    ('nonassoc', 'EQ', 'NEQ', 'LT', 'LE', 'GT', 'GE'),
+    ('nonassoc', 'EQ', 'NEQ', 'LT', 'LE', 'GT', 'GE', 'IN'),
     ('left', 'PLUS', 'MINUS'),
     ('left', 'TIMES', 'DIVIDE', 'DIV', 'MOD'),
     ('right', 'NOT'),
+    ('right', 'UMINUS'),
 )
 
-start = 'program'
+start = 'source'
 
-# Corresponde à regra inicial do parser, ou seja, o programa completo
+# Um ficheiro fonte é um programa ou uma unidade
+def p_source(p):
+    """source : program
+              | unit"""
+    p[0] = p[1]
+
+# Corresponde à regra inicial do parser, ou seja, o programa completo.
+# As funções já foram escritas no ficheiro temporário; aqui escreve-se o cabeçalho
+# 'pushn' (só agora se conhece o número de globais), o programa principal e as funções.
 def p_program(p):
-    """program : PROGRAM ID SEMI declarations functions BEGIN statements END DOT"""
-    functions_code_str = "\n".join(f_code for f_code in parser_functions.values() if f_code)
-    main_statements_code = p[7] 
+    """program : PROGRAM ID SEMI uses_clause declarations functions BEGIN statements END DOT"""
+    if parser_check_only:
+        p[0] = ""
+        return
+    main_statements_code = optimize_code(p[8])
+    deferred_code = optimize_code("".join(parser_deferred_code))
+    output = parser_output if parser_output is not None else CodeWriter(io.StringIO())
+    functions_code_str = "\n".join(f_code for f_code in parser_functions.values() if isinstance(f_code, str) and f_code)
+    string_pool = {}
+    if parser_pass_manager.level >= 1:
+        string_pool = build_string_pool(main_statements_code, deferred_code, functions_code_str)
+        main_statements_code = use_string_pool(main_statements_code, string_pool)
+        deferred_code = use_string_pool(deferred_code, string_pool)
     
+    if parser_var_count > 0:
+        output.write(f"pushn {parser_var_count}\n")
     final_code = []
-    if functions_code_str:
-        final_code.append(functions_code_str)
     final_code.append("start")
+    if string_pool:
+        final_code.append("".join(f"pushs \"{literal}\"\nstoreg {slot}\n" for literal, slot in string_pool.items()))
+    if parser_init_code:
+        final_code.append("".join(parser_init_code))
     if main_statements_code: 
         final_code.append(main_statements_code)
     final_code.append("stop")
+    if deferred_code:
+        final_code.append(deferred_code)
+    output.write(annotate_stack("\n".join(final_code), "programa principal").rstrip("\n"))
+
+    if parser_function_spill is not None and parser_function_spill.tell() > 0:
+        output.write("\n")
+        parser_function_spill.seek(0)
+        for chunk in spill_chunks(parser_function_spill):
+            output.write(use_string_pool(chunk, string_pool))
+    if functions_code_str:
+        output.write("\n" + use_string_pool(functions_code_str, string_pool))
+    for unit_code in parser_unit_code:
+        output.write("\n" + unit_code)
+    output.write("\n")
     
-    p[0] = "\n".join(final_code) + "\n"
+    p[0] = output.stream.getvalue() if parser_output is None else ""
+
+# Definição da cláusula USES: liga as unidades pré-compiladas indicadas
+def p_uses_clause(p):
+    """uses_clause : USES id_list SEMI
+                   | empty"""
+    if len(p) == 4:
+        for unit_name in p[2]:
+            link_unit(unit_name)
+    p[0] = ""
 
 # Definição das declarações de variáveis
 def p_declarations(p):
@@ -57,6 +149,43 @@ def p_declarations(p):
                     | empty"""
     p[0] = p[2] if len(p) > 2 else ""
 
+# Definição das declarações com secção de constantes
+def p_declarations_const(p):
+    """declarations : CONST const_declaration_list
+                    | CONST const_declaration_list VAR var_declaration_list"""
+    p[0] = ""
+
+# Definição da lista de declarações de constantes
+def p_const_declaration_list(p):
+    """const_declaration_list : const_declaration_list const_declaration
+                              | const_declaration"""
+    p[0] = ""
+
+# Definição de uma constante: o valor é dobrado em tempo de compilação até um único
+# 'pushi'/'pushf'/'pushs', que substitui cada referência ao nome
+def p_const_declaration(p):
+    """const_declaration : ID EQ expression SEMI"""
+    global parser_success
+    const_name = p[1]
+    code, const_type = p[3]
+    instructions = ewvm_opt.fold_constants(ewvm_opt.parse_code(code)[0], None)
+    folded_code = ewvm_opt.format_code(instructions, [])
+    if name_declared_in_scope(const_name):
+        print(f"Erro: Identificador duplicado '{const_name}'.")
+        parser_success = False
+    elif any(op in ('div', 'mod') and ewvm_opt.integer_constant(previous) == 0
+             for previous, (_, op, _, _) in zip(instructions, instructions[1:])):
+        print(f"Erro: Divisão por zero no valor da constante '{const_name}'.")
+        parser_success = False
+    elif len(instructions) != 1 or instructions[0][1] not in ('pushi', 'pushf', 'pushs'):
+        print(f"Erro: O valor da constante '{const_name}' não é calculável em tempo de compilação.")
+        parser_success = False
+    else:
+        parser_constants[const_name] = (folded_code, const_type)
+        if parser_current_function is not None:
+            parser_current_function['constants'].add(const_name)
+    p[0] = ""
+
 # Definição da lista de declarações de variáveis
 def p_var_declaration_list(p):
     """var_declaration_list : var_declaration_list var_declaration
@@ -70,29 +199,63 @@ def p_var_declaration(p):
     type_representation = p[3]
 
     for var_name in p[1]: 
-        if var_name in parser_var:
+        if name_declared_in_scope(var_name):
             print(f"Erro: variável duplicada {var_name}")
             parser_success = False
-        else:
-            parser_var[var_name] = parser_var_count
-            parser_var_types[var_name] = type_representation 
-            
-            if isinstance(type_representation, str) and type_representation.startswith("array["):
-                try:
-                    range_part = type_representation.split('[')[1].split(']')[0] 
-                    low_bound_str, high_bound_str = range_part.split('..')
-                    low = int(low_bound_str)
-                    high = int(high_bound_str)
-                    size = high - low + 1
-                    parser_var_count +=size 
-                except:
-                    print(f"Aviso: Não foi possível determinar o tamanho para o array {var_name}. A contagem de vars pode estar incorreta.")
-                    parser_var_count += 1 
-            else:
-                parser_var_count += 1 
+            continue
+        size = type_slot_count(var_name, type_representation)
+        if parser_current_function is not None:
+            # Variável local: ocupa posições da moldura da função, a partir de fp
+            local_vars = parser_current_function['locals']
+            first_offset = parser_current_function['local_count']
+            local_vars[var_name] = (first_offset, type_representation)
+            if is_record_type(type_representation):
+                for offset, (field_name, field_type) in enumerate(record_fields(type_representation)):
+                    local_vars[f"{var_name}.{field_name}"] = (first_offset + offset, field_type)
+            parser_current_function['local_count'] += size
+            continue
+
+        parser_var[var_name] = parser_var_count
+        parser_var_types[var_name] = type_representation 
+        if is_record_type(type_representation):
+            # Cada campo fica acessível como a global '<variável>.<campo>'
+            for offset, (field_name, field_type) in enumerate(record_fields(type_representation)):
+                parser_var[f"{var_name}.{field_name}"] = parser_var_count + offset
+                parser_var_types[f"{var_name}.{field_name}"] = field_type
+        parser_var_count += size
             
     p[0] = ""
 
+# Nº de posições ocupadas por uma variável do tipo indicado
+def type_slot_count(var_name, type_representation):
+    if isinstance(type_representation, str) and type_representation.startswith("packed_array["):
+        low, high = packed_array_bounds(type_representation)
+        return packed_array_words(low, high)
+    if is_record_type(type_representation):
+        return len(record_fields(type_representation))
+    if isinstance(type_representation, str) and type_representation.startswith("array["):
+        try:
+            range_part = type_representation.split('[')[1].split(']')[0] 
+            low_bound_str, high_bound_str = range_part.split('..')
+            low = int(low_bound_str)
+            high = int(high_bound_str)
+            size = high - low + 1
+            element_type = type_representation.split("_of_", 1)[1]
+            if is_record_type(element_type):
+                size *= len(record_fields(element_type))
+            return size
+        except:
+            print(f"Aviso: Não foi possível determinar o tamanho para o array {var_name}. A contagem de vars pode estar incorreta.")
+    return 1
+
+# O nome já está declarado no âmbito actual (programa ou função)?
+def name_declared_in_scope(name):
+    if parser_current_function is None:
+        return name in parser_var or name in parser_constants
+    return (name in parser_current_function['locals'] or name in parser_current_function['constants']
+            or name == parser_current_function['name']
+            or any(param_name == name for param_name, _ in parser_current_function['params']))
+
 # Definição da lista de identificadores
 def p_id_list(p):
     """id_list : ID
@@ -102,7 +265,9 @@ def p_id_list(p):
 # Definição do tipo de dados
 def p_type(p):
     """type : simple_type
-            | array_type"""
+            | array_type
+            | set_type
+            | record_type"""
     p[0] = p[1] 
 
 # Definição do tipo simples
@@ -120,19 +285,95 @@ def p_array_type(p):
     base_type = p[6] 
     p[0] = f"array[{low_bound}..{high_bound}]_of_{base_type}"
 
+# Definição do tipo array compactado: só os arrays de booleanos passam a bits
+def p_packed_array_type(p):
+    """array_type : PACKED ARRAY LBRACKET index_range RBRACKET OF type"""
+    low_bound, high_bound = p[4]
+    if p[7] == "boolean":
+        p[0] = f"packed_array[{low_bound}..{high_bound}]_of_boolean"
+    else:
+        p[0] = f"array[{low_bound}..{high_bound}]_of_{p[7]}"
+
+# Definição do tipo conjunto, representado como máscara de bits numa única global
+def p_set_type(p):
+    """set_type : SET OF index_range
+                | SET OF BOOLEAN"""
+    global parser_success
+    low_bound, high_bound = p[3] if isinstance(p[3], tuple) else (0, 1)
+    if high_bound - low_bound + 1 > set_max_width or high_bound < low_bound:
+        print(f"Erro: Domínio de conjunto {low_bound}..{high_bound} inválido (máximo {set_max_width} elementos).")
+        parser_success = False
+    p[0] = f"set[{low_bound}..{high_bound}]"
+
+# Definição do tipo registo; os campos ocupam globais consecutivas, pela ordem declarada
+def p_record_type(p):
+    """record_type : RECORD field_list END
+                   | RECORD field_list SEMI END"""
+    global parser_success
+    field_names = [field_name for field_name, _ in p[2]]
+    for field_name in set(field_names):
+        if field_names.count(field_name) > 1:
+            print(f"Erro: Campo duplicado '{field_name}' no registo.")
+            parser_success = False
+    p[0] = "record{" + ";".join(f"{field_name}:{field_type}" for field_name, field_type in p[2]) + "}"
+
+# Definição da lista de campos de um registo
+def p_field_list(p):
+    """field_list : field_list SEMI field_declaration
+                  | field_declaration"""
+    p[0] = p[1] + p[3] if len(p) == 4 else p[1]
+
+# Definição de uma declaração de campos: só tipos que cabem numa global
+def p_field_declaration(p):
+    """field_declaration : id_list COLON type"""
+    global parser_success
+    field_type = p[3]
+    if field_type.startswith(("array[", "packed_array[")) or is_record_type(field_type):
+        print(f"Erro: Campo '{p[1][0]}' do tipo '{field_type}' não suportado num registo.")
+        parser_success = False
+    p[0] = [(field_name, field_type) for field_name in p[1]]
+
 # Definição do intervalo de índices para arrays
 def p_index_range(p):
-    """index_range : NUMBER DOTDOT NUMBER"""
+    """index_range : index_bound DOTDOT index_bound"""
     p[0] = (p[1], p[3]) 
 
+# Definição de um limite de intervalo: número ou constante inteira
+def p_index_bound(p):
+    """index_bound : NUMBER
+                   | ID"""
+    p[0] = p[1] if p.slice[1].type == 'NUMBER' else integer_constant_value(p[1])
+
+# Valor de uma constante inteira (limites de arrays, conjuntos e etiquetas de CASE)
+def integer_constant_value(const_name):
+    global parser_success
+    const_code, const_type = parser_constants.get(const_name, ("", None))
+    if const_type not in ('integer', 'boolean'):
+        print(f"Erro: '{const_name}' não é uma constante inteira.")
+        parser_success = False
+        return 0
+    return constant_int(const_code)
+
 # Definição da variável, que pode ser simples ou indexada
 def p_variable(p):
     """variable : ID
                 | ID LBRACKET expression RBRACKET"""
     global parser_success, parser_var, parser_var_types
+    var_type = variable_type(p[1])
+    if is_record_type(var_type) or (len(p) > 2 and is_record_type(var_type.split("_of_", 1)[-1])):
+        print(f"Erro: O registo '{p[1]}' só pode ser usado campo a campo.")
+        parser_success = False
+        p[0] = {'type': 'error', 'name': p[1], 'basetype': 'unknown'}
+        return
     if len(p) == 2:
         var_name = p[1]
-        if var_name not in parser_var:
+        frame_variable = function_frame_variable(var_name)
+        if frame_variable is not None:
+            p[0] = frame_variable
+        elif var_name in parser_constants:
+            const_code, const_type = parser_constants[var_name]
+            p[0] = {'type': 'constant', 'name': var_name, 'code': const_code, 'basetype': const_type}
+        elif var_name not in parser_var:
             print(f"Erro: Variável '{var_name}' não declarada.")
             parser_success = False
             p[0] = {'type': 'error', 'name': var_name, 'basetype': 'unknown'}
@@ -150,13 +391,32 @@ def p_variable(p):
             p[0] = {'type': 'error', 'name': var_name, 'basetype': 'unknown'}
             return
 
-        if var_name not in parser_var:
+        # Strings passadas como parâmetro são valores do frame, indexados como as locais
+        frame_variable = function_frame_variable(var_name)
+        if (frame_variable is not None and not frame_variable.get('local')
+                and frame_variable['basetype'].startswith(("array[", "packed_array["))):
+            print(f"Erro: Parâmetro '{var_name}' não pode ser indexado.")
+            parser_success = False
+            p[0] = {'type': 'error', 'name': var_name, 'basetype': 'unknown'}
+            return
+
+        if frame_variable is None and parser_constants.get(var_name, ("", None))[1] == "string":
+            p[0] = {
+                'type': 'indexed_string_char',
+                'name': var_name,
+                'index_code': index_expr_code,
+                'basetype': 'char',
+                'string_code': parser_constants[var_name][0]
+            }
+            return
+
+        if frame_variable is None and var_name not in parser_var:
             print(f"Erro: Variável '{var_name}' não declarada.")
             parser_success = False
             p[0] = {'type': 'error', 'name': var_name, 'basetype': 'unknown'}
             return
 
-        var_actual_type = parser_var_types.get(var_name)
+        var_actual_type = variable_type(var_name)
 
         if isinstance(var_actual_type, str) and var_actual_type.startswith("array[") and "_of_" in var_actual_type:
             element_basetype = var_actual_type.split("_of_")[-1]
@@ -175,6 +435,14 @@ def p_variable(p):
                 'basetype': element_basetype, 
                 'low_bound': low_bound_val
             }
+        elif isinstance(var_actual_type, str) and var_actual_type.startswith("packed_array["):
+            p[0] = {
+                'type': 'indexed_packed',
+                'name': var_name,
+                'index_code': index_expr_code,
+                'basetype': 'boolean',
+                'low_bound': packed_array_bounds(var_actual_type)[0]
+            }
         elif var_actual_type == "string":
             p[0] = {
                 'type': 'indexed_string_char',
@@ -187,7 +455,96 @@ def p_variable(p):
             parser_success = False
             p[0] = {'type': 'error', 'name': var_name, 'basetype': 'unknown'}
             return
-        
+        if frame_variable is not None:
+            p[0]['frame_offset'] = frame_variable['offset']
+
+# Tipo de uma variável visível no âmbito actual ("" se não existe)
+def variable_type(var_name):
+    frame_variable = function_frame_variable(var_name)
+    if frame_variable is not None:
+        return frame_variable['basetype']
+    return parser_var_types.get(var_name, "")
+
+# Definição do acesso a um campo de registo
+def p_variable_field(p):
+    """variable : ID DOT ID
+                | ID LBRACKET expression RBRACKET DOT ID"""
+    global parser_success
+    var_name, field_name = p[1], p[len(p) - 1]
+    var_type = variable_type(var_name)
+    frame_variable = function_frame_variable(var_name)
+    if frame_variable is None and var_name not in parser_var:
+        print(f"Erro: Variável '{var_name}' não declarada.")
+        parser_success = False
+        p[0] = {'type': 'error', 'name': var_name, 'basetype': 'unknown'}
+        return
+    record_type = var_type if len(p) == 4 else var_type.split("_of_", 1)[-1]
+    if not is_record_type(record_type) or (len(p) == 7 and not var_type.startswith("array[")):
+        print(f"Erro: Variável '{var_name}' do tipo '{var_type}' não é um registo" +
+              (" nem um array de registos." if len(p) == 7 else "."))
+        parser_success = False
+        p[0] = {'type': 'error', 'name': var_name, 'basetype': 'unknown'}
+        return
+    fields = record_fields(record_type)
+    offsets = {name: offset for offset, (name, _) in enumerate(fields)}
+    if field_name not in offsets:
+        print(f"Erro: O registo '{var_name}' não tem o campo '{field_name}'.")
+        parser_success = False
+        p[0] = {'type': 'error', 'name': var_name, 'basetype': 'unknown'}
+        return
+    field_type = fields[offsets[field_name]][1]
+
+    if len(p) == 4:
+        # O endereço do campo é conhecido em tempo de compilação
+        if frame_variable is not None:
+            p[0] = function_frame_variable(f"{var_name}.{field_name}")
+        else:
+            p[0] = {'type': 'simple', 'name': f"{var_name}.{field_name}", 'basetype': field_type}
+        return
+
+    index_expr_code, index_expr_type = p[3]
+    if index_expr_type != 'integer':
+        print(f"Erro: Índice para '{var_name}' deve ser um inteiro, mas foi {index_expr_type}.")
+        parser_success = False
+        p[0] = {'type': 'error', 'name': var_name, 'basetype': 'unknown'}
+        return
+    # a[i].x: o desvio do campo soma-se à base e o índice é escalado pelo tamanho do registo
+    p[0] = {
+        'type': 'indexed_array',
+        'name': var_name,
+        'index_code': index_expr_code,
+        'basetype': field_type,
+        'low_bound': int(var_type.split('[')[1].split('..')[0]),
+        'offset': offsets[field_name],
+        'stride': len(fields),
+    }
+    if frame_variable is not None:
+        p[0]['frame_offset'] = frame_variable['offset']
+
+# Tipos registo têm a forma "record{campo:tipo;...}"
+def is_record_type(type_str):
+    return isinstance(type_str, str) and type_str.startswith("record{")
+
+# Lista [(campo, tipo)] de um tipo registo, pela ordem das globais
+def record_fields(type_str):
+    return [tuple(field.split(":", 1)) for field in type_str[len("record{"):-1].split(";")]
+
+# Endereço da primeira posição de um array: global (pushgp) ou local à função (pushfp)
+def array_base_code(var_info, offset=0):
+    if 'frame_offset' in var_info:
+        return f"pushfp\npushi {var_info['frame_offset'] + offset}\npadd\n"
+    return f"pushgp\npushi {parser_var[var_info['name']] + offset}\npadd\n"
+
+# Endereço (base, índice) de um elemento de array; para arrays de registos inclui o desvio do campo
+def indexed_address_code(var_info):
+    code = array_base_code(var_info, var_info.get('offset', 0))
+    code += var_info['index_code']
+    code += f"pushi {var_info.get('low_bound', 1)}\n"
+    code += "sub\n"
+    if var_info.get('stride', 1) != 1:
+        code += f"pushi {var_info['stride']}\nmul\n"
+    return code
+
 # Definição das funções do programa
 def p_functions(p):
     """functions : function functions
@@ -196,38 +553,119 @@ def p_functions(p):
 
 # Definição de uma função
 def p_function(p):
-    """function : FUNCTION ID LPAREN param_list RPAREN COLON type SEMI declarations BEGIN statements END SEMI"""
-    name = p[2]
-    param_code = p[4]
-    local_code = p[9] 
-    body_code = p[11] 
-    full_code = f"{name}:\n{param_code}{local_code}{body_code}RETURN\n" 
-    parser_functions[name] = full_code
-    parser_params[name] = param_code.count("STOREL")
+    """function : function_header declarations BEGIN statements END SEMI"""
+    global parser_current_function, parser_constants
+    name = p[1]['name']
+    local_code = p[2] 
+    body_code = p[4] 
+    # Só as variáveis locais da função vão para a moldura; as chamadas de cauda
+    # saltam para depois do 'pushn', reaproveitando-a
+    frame_code = f"{name}:\n"
+    tail_target = name
+    if p[1]['local_count']:
+        tail_target = f"{name}_frame"
+        frame_code += f"pushn {p[1]['local_count']}\n{tail_target}:\n"
+    arms_code = shift_case_arms("".join(p[1]['case_arms']), p[1]['local_count'])
+    full_code = optimize_code(apply_tail_calls(name, f"{frame_code}{local_code}{body_code}RETURN\n{arms_code}",
+                                               tail_target))
+    arm_labels = [arm.split(":", 1)[0] for arm in p[1]['case_arms']]
+    full_code = annotate_stack(full_code, f"'{name}'", arm_labels)
+    own_slots = range(p[1]['first_slot'], parser_var_count)
+    if (not parser_check_only and parser_pass_manager.level >= 1 and p[1]['type'] in evaluable_types
+            and ewvm_opt.is_pure_code(name, full_code, own_slots, parser_pure_functions)):
+        parser_pure_functions[name] = (full_code, parser_var_count)
+    if parser_function_spill is not None:
+        # A função fica completa aqui: vai já para disco em vez de ficar em memória
+        if parser_function_spill.tell() > 0:
+            parser_function_spill.write("\n")
+        parser_function_spill.write(full_code)
+        parser_functions[name] = True
+    else:
+        parser_functions[name] = full_code
+    parser_constants = p[1]['outer_constants']
+    parser_current_function = None
     p[0] = ""
 
+# Cabeçalho de uma função: regista a assinatura antes do corpo (permite recursão)
+def p_function_header(p):
+    """function_header : function_signature"""
+    global parser_success, parser_current_function
+    signature = p[1]
+    name = signature['name']
+    if name in parser_functions and parser_functions[name] != "":
+        print(f"Erro: Função '{name}' definida mais do que uma vez.")
+        parser_success = False
+    elif name in parser_params and (parser_params[name], parser_function_types[name]) != (signature['params'], signature['type']):
+        print(f"Erro: A definição de '{name}' não corresponde à assinatura declarada.")
+        parser_success = False
+    register_function(signature)
+    parser_current_function = dict(signature, first_slot=parser_var_count, locals={}, local_count=0,
+                                   case_arms=[], constants=set(), outer_constants=dict(parser_constants))
+    p[0] = parser_current_function
+
+# Definição da assinatura de uma função: {'name', 'params': [(nome, tipo), ...], 'type'}
+def p_function_signature(p):
+    """function_signature : FUNCTION ID LPAREN param_list RPAREN COLON type SEMI
+                          | FUNCTION ID COLON type SEMI"""
+    global parser_success
+    params = p[4] if len(p) == 9 else []
+    return_type = p[len(p) - 2]
+    for param_name, param_type in params:
+        if not isinstance(param_type, str) or param_type.startswith(("array[", "packed_array[", "record{")):
+            print(f"Erro: Parâmetro '{param_name}' de '{p[2]}' não pode ser um array nem um registo.")
+            parser_success = False
+    if return_type.startswith(("array[", "packed_array[", "record{")):
+        print(f"Erro: Função '{p[2]}' não pode devolver um array nem um registo.")
+        parser_success = False
+    if [name for name, _ in params].count(p[2]) or len({name for name, _ in params}) != len(params):
+        print(f"Erro: Parâmetros repetidos em '{p[2]}'.")
+        parser_success = False
+    p[0] = {'name': p[2], 'params': params, 'type': return_type}
+
+# Regista a assinatura de uma função
+def register_function(signature):
+    parser_params[signature['name']] = signature['params']
+    parser_function_types[signature['name']] = signature['type']
+    parser_functions.setdefault(signature['name'], "")
+
 # Definição da lista de parâmetros da função
 def p_param_list_single(p):
     "param_list : ID COLON type"
-    p[0] = "storel 0\n" 
+    p[0] = [(p[1], p[3])]
 
 # Definição da lista de parâmetros com múltiplos parâmetros
 def p_param_list_multiple(p):
     "param_list : param_list SEMI ID COLON type"
-    idx = p[1].count("storel") 
-    p[0] = p[1] + f"storel {idx}\n" 
+    p[0] = p[1] + [(p[3], p[5])]
+
+# Os argumentos ficam na pilha do chamador, por baixo do endereço de retorno:
+# o parâmetro i de n está em fp-(n-i) e o resultado em fp-(n+1). As variáveis
+# locais ocupam fp+0, fp+1, ..., reservadas com 'pushn' à entrada da função.
+def function_frame_variable(var_name):
+    if parser_current_function is None:
+        return None
+    params = parser_current_function['params']
+    for index, (param_name, param_type) in enumerate(params):
+        if param_name == var_name:
+            return {'type': 'frame', 'name': var_name, 'basetype': param_type,
+                    'offset': index - len(params)}
+    local = parser_current_function['locals'].get(var_name)
+    if local is not None:
+        return {'type': 'frame', 'name': var_name, 'basetype': local[1], 'offset': local[0], 'local': True}
+    if var_name == parser_current_function['name']:
+        return {'type': 'frame', 'name': var_name, 'basetype': parser_current_function['type'],
+                'offset': -len(params) - 1}
+    return None
 
 # Definição da lista de argumentos para chamadas de função
 def p_argument_list_single(p):
     "argument_list : expression"
-    expr_val = p[1]
-    p[0] = expr_val[0] if isinstance(expr_val, tuple) else expr_val 
+    p[0] = [p[1]]
 
 # Definição da lista de argumentos com múltiplos argumentos
 def p_argument_list_multiple(p):
     "argument_list : argument_list COMMA expression"
-    new_expr_code = p[3][0] if isinstance(p[3], tuple) else p[3]
-    p[0] = p[1] + new_expr_code
+    p[0] = p[1] + [p[3]]
 
 # Definição da chamada de função
 def p_expression_function_call(p):
@@ -238,25 +676,384 @@ def p_expression_function_call(p):
     fname = p[1].lower() 
     
     if len(p) == 5: 
-        args_code = p[3] 
+        args = p[3] 
     else: 
-        args_code = ""
+        args = []
 
     if fname == "length":
-        if not args_code:
+        if len(args) != 1:
             print(f"Erro: Função 'length' requer um argumento string.")
             parser_success = False
             p[0] = ("", "integer")
             return
-        p[0] = (args_code + "STRLEN\n", "integer")
+        p[0] = (args[0][0] + "STRLEN\n", "integer")
     else:
+        fname = p[1]
         if fname not in parser_functions:
             print(f"Erro: Função '{p[1]}' não declarada.")
             parser_success = False
             p[0] = ("", "integer")
             return
-        
-        p[0] = (args_code + f"pusha {fname}\ncall\n", "integer")
+
+        params = parser_params[fname]
+        if len(args) != len(params):
+            print(f"Erro: Função '{fname}' espera {len(params)} argumento(s), mas recebeu {len(args)}.")
+            parser_success = False
+            p[0] = ("", parser_function_types[fname])
+            return
+
+        # Espaço para o resultado, argumentos, chamada e remoção dos argumentos
+        arg_codes = []
+        for (arg_code, arg_type), (param_name, param_type) in zip(args, params):
+            if is_set_type(param_type):
+                arg_code = set_coerce((arg_code, arg_type), set_domain(param_type))
+            elif param_type == "real" and arg_type == "integer":
+                arg_code += "itof\n"
+            elif param_type == "integer" and arg_type == "real":
+                arg_code += "ftoi\n"
+            arg_codes.append(arg_code)
+        code = "pushi 0\n" + "".join(arg_codes) + f"pusha {fname}\ncall\n"
+        if params:
+            code += f"pop {len(params)}\n"
+        if fname in parser_pure_functions and all(is_constant_code(arg_code) for arg_code in arg_codes):
+            code = evaluate_pure_call(fname, code) or code
+        p[0] = (code, parser_function_types[fname])
+
+# ====== Chamadas de cauda ======
+
+# Uma atribuição 'F := F(...)' é marcada pela acção da atribuição. Se depois dela só
+# houver saltos e rótulos até ao RETURN, a chamada passa a guardar os argumentos nos
+# parâmetros e a saltar para o início de F, sem crescer a pilha de chamadas.
+
+tail_call_marker = "//tailcall\n"
+
+# Sufixo do código de uma chamada a 'name' (ver p_expression_function_call)
+def call_suffix(name):
+    param_count = len(parser_params[name])
+    return f"pusha {name}\ncall\n" + (f"pop {param_count}\n" if param_count else "")
+
+# O valor da expressão é o resultado de uma chamada à função actual
+def is_self_call(code):
+    return code.startswith("pushi 0\n") and code.endswith(call_suffix(parser_current_function['name']))
+
+# Está na cauda se a partir de 'index' só há saltos incondicionais e rótulos até ao RETURN
+def reaches_return(lines, index, label_positions):
+    visited = set()
+    while index < len(lines) and index not in visited:
+        visited.add(index)
+        line = lines[index]
+        if line.startswith("//") or line.endswith(":"):
+            index += 1
+        elif line.startswith("jump "):
+            index = label_positions.get(line[5:], len(lines))
+        else:
+            return line == "RETURN"
+    return False
+
+# Substitui as chamadas de cauda marcadas no corpo da função 'name' por saltos para 'target'
+def apply_tail_calls(name, code, target):
+    if tail_call_marker not in code:
+        return code
+    params = parser_params[name]
+    result_store = f"storel {-len(params) - 1}"
+    lines = code.splitlines()
+    label_positions = {line[:-1]: index for index, line in enumerate(lines) if line.endswith(":")}
+    result = []
+    index = 0
+    while index < len(lines):
+        if lines[index] + "\n" != tail_call_marker:
+            result.append(lines[index])
+            index += 1
+            continue
+        store_index = lines.index(result_store, index)
+        if reaches_return(lines, store_index + 1, label_positions):
+            # Entre 'pushi 0' e o sufixo da chamada ficam só os argumentos
+            suffix_length = len(call_suffix(name).splitlines())
+            result.extend(lines[index + 2:store_index - suffix_length])
+            result.extend(f"storel {-k}" for k in range(1, len(params) + 1))
+            result.append(f"jump {target}")
+            index = store_index + 1
+        else:
+            index += 1
+    return "".join(line + "\n" for line in result)
+
+# ====== Avaliação em tempo de compilação ======
+
+# Uma função é pura se não faz E/S, não acede a memória por endereço, só lê e escreve
+# as globais reservadas durante a sua compilação (locais e temporárias) e só chama
+# funções puras. Uma chamada com argumentos constantes é executada pela VM durante
+# a compilação (até parser_eval_budget instruções) e substituída pelo resultado.
+
+evaluable_types = ('integer', 'boolean', 'real')
+
+def is_constant_code(code):
+    return code.count("\n") == 1 and code.split(None, 1)[0] in ('pushi', 'pushf')
+
+# Código das funções puras usadas a partir de 'name' (incluindo a própria)
+def pure_function_closure(name):
+    names = [name]
+    for current in names:
+        for label in ewvm_opt.called_functions(parser_pure_functions[current][0]):
+            if label in parser_pure_functions and label not in names:
+                names.append(label)
+    return names
+
+# Executa 'call_code' sobre as funções puras; devolve 'pushi'/'pushf' com o resultado,
+# ou None se a execução falhar ou exceder o orçamento
+def evaluate_pure_call(name, call_code):
+    names = pure_function_closure(name)
+    slot_count = max(parser_pure_functions[n][1] for n in names)
+    write_code = "writef\n" if parser_function_types[name] == 'real' else "writei\n"
+    program_text = (f"pushn {slot_count}\nstart\n{call_code}{write_code}stop\n" +
+                    "".join(parser_pure_functions[n][0] for n in names))
+    output = io.StringIO()
+    try:
+        program, _ = ewvm.parse_program(program_text)
+        ewvm.execute(program, stdin=io.StringIO(), stdout=output, max_steps=parser_eval_budget)
+    except ewvm.EWVMError:
+        return None
+    if parser_function_types[name] == 'real':
+        return f"pushf {output.getvalue()}\n"
+    return f"pushi {output.getvalue()}\n"
+
+# ====== Ordem dos operandos ======
+
+# Operações que aceitam os operandos trocados, com a operação equivalente
+# (as comparações são espelhadas: a < b é o mesmo que b > a)
+swapped_operations = {
+    'add': 'add', 'mul': 'mul', 'fadd': 'fadd', 'fmul': 'fmul', 'equal': 'equal',
+    'and': 'AND', 'or': 'OR',
+    'inf': 'sup', 'sup': 'inf', 'infeq': 'supeq', 'supeq': 'infeq',
+    'finf': 'fsup', 'fsup': 'finf', 'finfeq': 'fsupeq', 'fsupeq': 'finfeq',
+}
+
+# Ordena os operandos de uma operação binária pela numeração de Sethi-Ullman:
+# avaliar primeiro o operando que precisa de mais pilha poupa uma posição enquanto
+# o outro é calculado. Só troca operandos sem efeitos nem chamadas, e apenas a
+# partir de -O1; devolve (primeiro código, segundo código, operação)
+def ordered_operands(left_code, right_code, op):
+    swapped = swapped_operations.get(op.lower())
+    if parser_pass_manager.level < 1 or swapped is None:
+        return left_code, right_code, op
+    left_need = ewvm_opt.expression_need(left_code)
+    right_need = ewvm_opt.expression_need(right_code)
+    if left_need is None or right_need is None or right_need <= left_need:
+        return left_code, right_code, op
+    return right_code, left_code, swapped
+
+# ====== Unidades ======
+
+# Uma unidade é compilada uma vez para um artefacto JSON (<unidade>.ewu) com a interface
+# (assinaturas das funções exportadas) e o código gerado. Os programas que a usam lêem
+# a interface e ligam o código do artefacto, relocalizando globais e rótulos privados.
+
+unit_format_version = 1
+
+# Definição de uma unidade
+def p_unit(p):
+    """unit : UNIT ID SEMI INTERFACE interface_list IMPLEMENTATION declarations functions END DOT"""
+    global parser_success
+    interface = {}
+    for signature in p[5]:
+        name = signature['name']
+        if not parser_functions.get(name):
+            print(f"Erro: Função '{name}' da interface de '{p[2]}' não tem implementação.")
+            parser_success = False
+        interface[name] = {'params': [list(param) for param in signature['params']],
+                           'type': signature['type']}
+    if parser_check_only:
+        p[0] = {'unit': p[2], 'interface': interface, 'globals': parser_var_count}
+        return
+    functions_code = "\n".join(f_code for f_code in parser_functions.values() if isinstance(f_code, str) and f_code)
+    if parser_function_spill is not None:
+        parser_function_spill.seek(0)
+        functions_code = parser_function_spill.read() + functions_code
+    deferred_code = annotate_stack(optimize_code("".join(parser_deferred_code)), f"'{p[2]}'")
+    code, _ = extract_source_map(functions_code + deferred_code)
+    p[0] = {
+        'format': unit_format_version,
+        'unit': p[2],
+        'interface': interface,
+        'globals': parser_var_count,
+        'init': "".join(parser_init_code),
+        'code': code,
+    }
+
+# Definição da lista de assinaturas da interface
+def p_interface_list(p):
+    """interface_list : interface_list function_signature
+                      | function_signature"""
+    if len(p) == 3:
+        register_function(p[2])
+        p[0] = p[1] + [p[2]]
+    else:
+        register_function(p[1])
+        p[0] = [p[1]]
+
+# Nomes das variáveis de estado do compilador, guardadas durante a compilação de uma unidade
+compiler_state_names = (
+    'parser_success', 'parser_functions', 'parser_params', 'parser_function_types',
+    'parser_current_function', 'parser_unit_code', 'parser_var', 'parser_var_count',
+    'parser_var_types', 'parser_init_code', 'parser_deferred_code', 'parser_runtime_slots',
+    'label_seq_num', 'parser_output', 'parser_function_spill', 'parser_pure_functions',
+    'parser_constants', 'parser_negated_conditions',
+)
+
+# Repõe o estado inicial do compilador
+def reset_compiler_state():
+    global parser_success, parser_functions, parser_params, parser_function_types
+    global parser_current_function, parser_unit_code, parser_var, parser_var_count
+    global parser_var_types, parser_init_code, parser_deferred_code, parser_runtime_slots
+    global label_seq_num, parser_output, parser_function_spill, parser_pure_functions
+    global parser_constants, parser_negated_conditions
+    parser_success = True
+    parser_functions = {}
+    parser_params = {}
+    parser_function_types = {}
+    parser_current_function = None
+    parser_unit_code = []
+    parser_var = {}
+    parser_var_count = 0
+    parser_var_types = {}
+    parser_init_code = []
+    parser_deferred_code = []
+    parser_runtime_slots = {}
+    label_seq_num = 0
+    parser_output = None
+    parser_function_spill = None
+    parser_pure_functions = {}
+    parser_constants = {}
+    parser_negated_conditions = {}
+
+# Compila o texto de uma unidade com um estado próprio e devolve o artefacto (ou None)
+def compile_unit_source(source):
+    saved_state = {name: globals()[name] for name in compiler_state_names}
+    reset_compiler_state()
+    try:
+        unit_lexer = pascal_lex.lexer.clone()
+        unit_lexer.lineno = 1
+        artifact = parser_engine.parse(source, lexer=unit_lexer)
+        if not parser_success or not isinstance(artifact, dict):
+            artifact = None
+    finally:
+        globals().update(saved_state)
+    return artifact
+
+# Procura o fonte (.pas) e o artefacto (.ewu) de uma unidade nas directorias de unidades
+def find_unit_files(unit_name):
+    import os
+    for directory in parser_unit_paths:
+        for base_name in (unit_name, unit_name.lower()):
+            base_path = os.path.join(directory, base_name)
+            if os.path.exists(base_path + '.pas') or os.path.exists(base_path + '.ewu'):
+                source_path = base_path + '.pas' if os.path.exists(base_path + '.pas') else None
+                return source_path, base_path + '.ewu'
+    return None, None
+
+# Lê um artefacto; devolve None se não existir ou for de outra versão
+def read_unit_artifact(artifact_path):
+    import json
+    try:
+        with open(artifact_path, 'r', encoding='utf-8') as f:
+            artifact = json.load(f)
+    except (IOError, ValueError):
+        return None
+    if not isinstance(artifact, dict) or artifact.get('format') != unit_format_version:
+        return None
+    return artifact
+
+# Escreve um artefacto de unidade
+def write_unit_artifact(artifact_path, artifact):
+    import json
+    with open(artifact_path, 'w', encoding='utf-8') as f:
+        json.dump(artifact, f, ensure_ascii=False)
+        f.write("\n")
+
+# Devolve o artefacto de uma unidade, recompilando-a só se o fonte mudou
+def load_unit(unit_name):
+    import hashlib
+    source_path, artifact_path = find_unit_files(unit_name)
+    if artifact_path is None:
+        print(f"Erro: Unidade '{unit_name}' não encontrada.")
+        return None
+    artifact = read_unit_artifact(artifact_path)
+    if source_path is None:
+        if artifact is None:
+            print(f"Erro: Artefacto da unidade '{unit_name}' inválido: {artifact_path}.")
+        return artifact
+
+    with open(source_path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    source_hash = hashlib.sha256(source.encode('utf-8')).hexdigest()
+    if artifact is not None and artifact.get('source_hash') == source_hash:
+        return artifact
+
+    artifact = compile_unit_source(source)
+    if artifact is None:
+        print(f"Erro: Falha ao compilar a unidade '{unit_name}' ({source_path}).")
+        return None
+    artifact['source_hash'] = source_hash
+    if parser_check_only:
+        # Em --check a unidade só é verificada: não há código para guardar
+        return artifact
+    try:
+        write_unit_artifact(artifact_path, artifact)
+    except IOError:
+        print(f"Aviso: Não foi possível escrever o artefacto '{artifact_path}'.")
+    return artifact
+
+# Relocaliza o código de uma unidade: globais deslocadas de 'base' e rótulos privados prefixados.
+# Os rótulos são os definidos em 'labels_code' (por defeito o próprio código): a
+# inicialização refere ramos de CASE definidos no código da unidade.
+def relocate_unit_code(code, base, prefix, exported, labels_code=None):
+    lines = code.splitlines()
+    labels_lines = lines if labels_code is None else labels_code.splitlines()
+    labels = {line.strip()[:-1] for line in labels_lines if line.strip().endswith(':')}
+    renamed = {label: f"{prefix}_{label}" for label in labels if label not in exported}
+    out = []
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.endswith(':') and stripped[:-1] in renamed:
+            out.append(f"{renamed[stripped[:-1]]}:")
+            continue
+        parts = stripped.split(None, 1)
+        if len(parts) == 2:
+            op, arg = parts[0].lower(), parts[1]
+            if op in ('pusha', 'jump', 'jz') and arg in renamed:
+                stripped = f"{parts[0]} {renamed[arg]}"
+            elif op in ('pushg', 'storeg'):
+                stripped = f"{parts[0]} {int(arg) + base}"
+            elif op == 'pushi' and 0 < i < len(lines) - 1 and \
+                    lines[i - 1].strip().lower() == 'pushgp' and lines[i + 1].strip().lower() == 'padd':
+                stripped = f"{parts[0]} {int(arg) + base}"
+        out.append(stripped)
+    return "".join(line + "\n" for line in out)
+
+# Liga uma unidade ao programa: importa a interface e junta o código relocalizado
+def link_unit(unit_name):
+    global parser_success, parser_var_count
+    artifact = load_unit(unit_name)
+    if artifact is None:
+        parser_success = False
+        return
+    for name, entry in artifact['interface'].items():
+        if name in parser_functions:
+            print(f"Erro: Função '{name}' da unidade '{unit_name}' já está declarada.")
+            parser_success = False
+            continue
+        register_function({'name': name,
+                           'params': [tuple(param) for param in entry['params']],
+                           'type': entry['type']})
+        parser_functions[name] = None
+    base = parser_var_count
+    parser_var_count += artifact['globals']
+    if parser_check_only:
+        return
+    prefix = artifact['unit'].lower()
+    exported = set(artifact['interface'])
+    if artifact['init']:
+        parser_init_code.append(relocate_unit_code(artifact['init'], base, prefix, exported, artifact['code']))
+    parser_unit_code.append(relocate_unit_code(artifact['code'], base, prefix, exported))
 
 # Definição das instruções do programa
 def p_statements(p):
@@ -288,6 +1085,7 @@ def p_statement(p):
                  | for_statement
                  | if_statement
                  | while_statement
+                 | case_statement
                  | statement_compound
                  | concrete_empty_statement""" 
     p[0] = p[1]
@@ -310,10 +1108,21 @@ def p_assignment_statement(p):
         p[0] = ""
         return
 
+    if lhs_var_info['type'] == 'constant':
+        print(f"Erro: Não é possível atribuir à constante '{lhs_var_info['name']}'.")
+        parser_success = False
+        p[0] = ""
+        return
+
     final_rhs_code = rhs_expr_code
     target_basetype = lhs_var_info.get('basetype', 'integer')
 
-    if target_basetype == "real" and rhs_expr_type == "integer":
+    if is_set_type(target_basetype):
+        final_rhs_code = set_coerce((rhs_expr_code, rhs_expr_type), set_domain(target_basetype))
+    elif is_set_type(rhs_expr_type):
+        print(f"Erro: Não é possível atribuir um conjunto a '{lhs_var_info['name']}' do tipo {target_basetype}.")
+        parser_success = False
+    elif target_basetype == "real" and rhs_expr_type == "integer":
         final_rhs_code += "itof\n"
     elif target_basetype == "integer" and rhs_expr_type == "real":
         final_rhs_code += "ftoi\n"
@@ -321,55 +1130,83 @@ def p_assignment_statement(p):
     if lhs_var_info['type'] == 'simple':
         var_name = lhs_var_info['name']
         p[0] = final_rhs_code + f"storeg {parser_var[var_name]}\n"
-    elif lhs_var_info['type'] == 'indexed':
-        array_name = lhs_var_info['name']
-        index_code = lhs_var_info['index_code']
-        array_slot = parser_var[array_name]
-        low_bound = lhs_var_info.get('low_bound', 1)
-        
-        addr_calc_code = "pushgp\n"                             
-        addr_calc_code += f"pushi {array_slot}\n"             
-        addr_calc_code += "padd\n"                            
-        
-        addr_calc_code += index_code                          
-        addr_calc_code += f"pushi {low_bound}\n"              
-        addr_calc_code += "sub\n"                             
-        
-        p[0] = addr_calc_code + final_rhs_code + "storen\n" 
+    elif lhs_var_info['type'] == 'frame':
+        p[0] = final_rhs_code + f"storel {lhs_var_info['offset']}\n"
+        if lhs_var_info['name'] == parser_current_function['name'] and is_self_call(final_rhs_code):
+            # Candidata a chamada de cauda; p_function decide se está mesmo na cauda
+            p[0] = tail_call_marker + p[0]
+    elif lhs_var_info['type'] == 'indexed_array':
+        p[0] = indexed_address_code(lhs_var_info) + final_rhs_code + "storen\n" 
+    elif lhs_var_info['type'] == 'indexed_packed':
+        p[0] = packed_store_code(lhs_var_info, final_rhs_code)
     else:
         p[0] = ""
+    if p[0]:
+        p[0] = line_marker(p.lineno(2)) + p[0]
+
+# Extrai o texto de uma expressão literal que pode ser escrita em tempo de compilação
+def constant_write_text(code, expr_type):
+    if expr_type == "string" and code.startswith('pushs "') and code.endswith('"\n') and code.count("\n") == 1:
+        return code[len('pushs "'):-len('"\n')]
+    if expr_type in ("integer", "boolean") and code.startswith("pushi ") and code.count("\n") == 1:
+        return code[len("pushi "):-1]
+    return None
+
+# Junta itens constantes consecutivos numa única escrita de string
+def fuse_write_items(items, newline=False):
+    code_parts = []
+    pending_text = []
+    for code, const_text in items:
+        if const_text is not None:
+            pending_text.append(const_text)
+            continue
+        if pending_text:
+            code_parts.append(f"pushs \"{''.join(pending_text)}\"\nwrites\n")
+            pending_text = []
+        code_parts.append(code)
+    if pending_text:
+        if newline:
+            pending_text.append("\\n")
+            newline = False
+        code_parts.append(f"pushs \"{''.join(pending_text)}\"\nwrites\n")
+    if newline:
+        code_parts.append("writeln\n")
+    return "".join(code_parts)
 
 # Definição das instruções de escrita
 def p_writeln_statement(p):
     """writeln_statement : WRITELN LPAREN writelist RPAREN""" 
-    p[0] = p[3] + "writeln\n" 
+    p[0] = line_marker(p.lineno(1)) + fuse_write_items(p[3], newline=True)
 
 # Definição da lista de itens a escrever
 def p_write_statement(p):
     """write_statement : WRITE LPAREN writelist RPAREN""" 
-    p[0] = p[3]
+    p[0] = line_marker(p.lineno(1)) + fuse_write_items(p[3])
 
 # Definição da lista de itens a escrever
 def p_writelist(p):
     """writelist : writelist COMMA writeitem
                  | writeitem"""
-    p[0] = p[1] + p[3] if len(p) == 4 else p[1]
+    p[0] = p[1] + [p[3]] if len(p) == 4 else [p[1]]
 
-# Definição do item a escrever
+# Definição do item a escrever: (código, texto constante ou None)
 def p_writeitem_expr(p):
     """writeitem : expression"""
     code, expr_type = p[1]
-    if expr_type == "string": 
-        p[0] = code + "writes\n"
+    const_text = constant_write_text(code, expr_type)
+    if const_text is not None:
+        p[0] = (code, const_text)
+    elif expr_type == "string": 
+        p[0] = (code + "writes\n", None)
     elif expr_type == "real":
-        p[0] = code + "writef\n"
+        p[0] = (code + "writef\n", None)
     elif expr_type == "boolean": 
-        p[0] = code + "writei\n"
+        p[0] = (code + "writei\n", None)
     elif expr_type == "integer": 
-        p[0] = code + "writei\n"
+        p[0] = (code + "writei\n", None)
     else:
         print(f"Aviso: Tipo de expressão desconhecido '{expr_type}' em p_writeitem_expr. Usando writei por defeito.")
-        p[0] = code + "writei\n" 
+        p[0] = (code + "writei\n", None)
 
 # Definição do item a escrever como variável
 def p_readln_statement(p):
@@ -382,21 +1219,23 @@ def p_readln_statement(p):
         p[0] = ""
         return
 
+    if var_info['type'] == 'constant':
+        print(f"Erro: READLN não pode alterar a constante '{var_info['name']}'.")
+        parser_success = False
+        p[0] = ""
+        return
+
+    if var_info['type'] == 'indexed_packed':
+        print(f"Erro: READLN não suporta elementos do array compactado '{var_info['name']}'.")
+        parser_success = False
+        p[0] = ""
+        return
+
     addr_calc_code = ""
     is_indexed = False
     if var_info['type'] == 'indexed_array':
         is_indexed = True
-        array_name = var_info['name']
-        index_code_for_addr = var_info.get('index_code', "")
-        array_slot = parser_var[array_name]
-        low_bound = var_info.get('low_bound', 1)
-
-        addr_calc_code += "pushgp\n"                     
-        addr_calc_code += f"pushi {array_slot}\n"       
-        addr_calc_code += "padd\n"                      
-        addr_calc_code += index_code_for_addr 
-        addr_calc_code += f"pushi {low_bound}\n"        
-        addr_calc_code += "sub\n" 
+        addr_calc_code = indexed_address_code(var_info)
 
     base_read_code = "read\n" 
     conversion_code = ""
@@ -424,12 +1263,16 @@ def p_readln_statement(p):
             p[0] = ""
             return
         p[0] = full_read_and_convert_code + f"storeg {parser_var[var_name]}\n"
+    elif var_info['type'] == 'frame':
+        p[0] = full_read_and_convert_code + f"storel {var_info['offset']}\n"
     elif is_indexed:
         p[0] = addr_calc_code + full_read_and_convert_code + "storen\n" 
     else:
         print(f"Erro: Tipo de variável não suportado '{var_info['type']}' para atribuição em READLN.")
         parser_success = False
         p[0] = ""
+    if p[0]:
+        p[0] = line_marker(p.lineno(1)) + p[0]
 
 # Definição da instrução FOR
 def p_for_statement(p):
@@ -438,16 +1281,33 @@ def p_for_statement(p):
     global parser_success, parser_var_count, parser_var
     
     loop_var_name = p[2]
-    if loop_var_name not in parser_var:
+    frame_variable = function_frame_variable(loop_var_name)
+    if frame_variable is not None and not frame_variable.get('local'):
+        print(f"Erro: Parâmetro '{loop_var_name}' não pode ser variável de ciclo.")
+        parser_success = False
+        p[0] = ""
+        return
+    if frame_variable is None and loop_var_name not in parser_var:
         print(f"Erro: variável de ciclo '{loop_var_name}' não declarada.")
         parser_success = False
         p[0] = ""
         return
 
-    loop_var_slot = parser_var[loop_var_name]
-    
-    limit_storage_slot = parser_var_count 
-    parser_var_count += 1 
+    if frame_variable is not None:
+        load, store = "pushl", "storel"
+        loop_var_slot = frame_variable['offset']
+    else:
+        load, store = "pushg", "storeg"
+        loop_var_slot = parser_var[loop_var_name]
+    if parser_current_function is not None:
+        # Dentro de uma função, o limite fica na moldura (recursão segura)
+        limit_load, limit_store = "pushl", "storel"
+        limit_storage_slot = parser_current_function['local_count']
+        parser_current_function['local_count'] += 1
+    else:
+        limit_load, limit_store = "pushg", "storeg"
+        limit_storage_slot = parser_var_count 
+        parser_var_count += 1 
 
     init_expr_code, init_expr_type = p[4] 
     limit_expr_code, limit_expr_type = p[6] 
@@ -475,21 +1335,25 @@ def p_for_statement(p):
         p[0] = ""
         return
         
+    marker = line_marker(p.lineno(1))
     p[0] = (
+        marker +
         init_expr_code +                            
-        f"storeg {loop_var_slot}\n" +               
+        f"{store} {loop_var_slot}\n" +               
         limit_expr_code +                           
-        f"storeg {limit_storage_slot}\n" +     
+        f"{limit_store} {limit_storage_slot}\n" +     
         f"{loop_label}:\n" +                        
-        f"pushg {loop_var_slot}\n" +                
-        f"pushg {limit_storage_slot}\n" +          
+        marker +
+        f"{load} {loop_var_slot}\n" +                
+        f"{limit_load} {limit_storage_slot}\n" +          
         f"{comparison_instruction}\n" +            
         f"jz {end_label}\n" +                      
         body_code +                                
-        f"pushg {loop_var_slot}\n" +               
+        marker +
+        f"{load} {loop_var_slot}\n" +               
         "pushi 1\n" +                              
         f"{step_instruction}\n" +                  
-        f"storeg {loop_var_slot}\n" +              
+        f"{store} {loop_var_slot}\n" +              
         f"jump {loop_label}\n" +                   
         f"{end_label}:\n"                          
     )
@@ -504,10 +1368,17 @@ def p_expression_boolean(p):
 def p_expression_logical(p):
     """expression : expression AND expression
                   | expression OR expression"""
-    op_code = p[2].upper() 
-    left_code, _ = p[1] 
-    right_code, _ = p[3] 
-    p[0] = (left_code + right_code + op_code + "\n", "boolean")
+    left_code, left_type = p[1] 
+    right_code, right_type = p[3] 
+    first_code, second_code, op_code = ordered_operands(left_code, right_code, p[2].upper())
+    code = first_code + second_code + op_code + "\n"
+    p[0] = (code, "boolean")
+    # Com operandos booleanos (0/1) a negação dispensa 'not'; o mesmo código com outros
+    # tipos anula a entrada
+    if left_type == right_type == "boolean" and parser_negated_conditions.get(code, "") is not None:
+        parser_negated_conditions[code] = logical_negation_code(first_code, second_code, op_code.lower())
+    else:
+        parser_negated_conditions[code] = None
 
 # Definição da negação lógica
 def p_expression_relop(p):
@@ -525,6 +1396,10 @@ def p_expression_relop(p):
     left_code, left_type = p[1]
     right_code, right_type = p[3]
     operator_symbol = p[2]
+
+    if is_set_type(left_type) or is_set_type(right_type):
+        p[0] = set_compare(operator_symbol, p[1], p[3])
+        return
     
     final_code_parts = []
     op_instruction = ""
@@ -563,11 +1438,10 @@ def p_expression_relop(p):
 
     if operator_symbol == '<>':
         if left_type == "real" or right_type == "real":
-            final_left = left_code + ("itof\n" if left_type == "integer" else "")
-            final_right = right_code + ("itof\n" if right_type == "integer" else "")
-            p[0] = (final_left + final_right + "equal\nnot\n", result_type)
-        else: 
-            p[0] = (left_code + right_code + "equal\nnot\n", result_type)
+            left_code = left_code + ("itof\n" if left_type == "integer" else "")
+            right_code = right_code + ("itof\n" if right_type == "integer" else "")
+        first_code, second_code, _ = ordered_operands(left_code, right_code, "equal")
+        p[0] = (first_code + second_code + "equal\nnot\n", result_type)
         return
 
     if left_type == "real" or right_type == "real":
@@ -589,14 +1463,28 @@ def p_expression_relop(p):
         p[0] = ("", result_type)
         return
         
-    final_code_parts.append(op_instruction + "\n")
-    p[0] = ("".join(final_code_parts), result_type)
+    first_code, second_code, op_instruction = ordered_operands(*final_code_parts, op_instruction)
+    p[0] = (first_code + second_code + op_instruction + "\n", result_type)
 
 # Definição da expressão parênteses
 def p_expression_paren(p):
     """expression : LPAREN expression RPAREN"""
     p[0] = p[2]
 
+# Definição do menos unário: 0 - x (dobrado para 'pushi -n' quando x é constante)
+def p_expression_uminus(p):
+    """expression : MINUS expression %prec UMINUS"""
+    global parser_success
+    code, expr_type = p[2]
+    if expr_type == "integer":
+        p[0] = ("pushi 0\n" + code + "sub\n", "integer")
+    elif expr_type == "real":
+        p[0] = ("pushf 0.0\n" + code + "fsub\n", "real")
+    else:
+        print(f"Erro: Menos unário requer um valor numérico, mas foi {expr_type}.")
+        parser_success = False
+        p[0] = ("", "integer")
+
 # Definição da expressão de divisão
 def p_expression_div(p): 
     """expression : expression DIV expression""" 
@@ -621,6 +1509,7 @@ def p_if_statement(p):
     """if_statement : IF expression THEN statement %prec IFX
                     | IF expression THEN statement ELSE statement"""
     cond_code, _ = p[2] 
+    cond_code = line_marker(p.lineno(1)) + cond_code
     then_statement_code = p[4]
     
     label_num = generate_unique_label_num()
@@ -647,6 +1536,37 @@ def p_if_statement(p):
             f"{label_end}:\n"   
         )
 
+# Comparações inteiras e a sua negação
+negated_comparisons = {'inf': 'supeq', 'supeq': 'inf', 'infeq': 'sup', 'sup': 'infeq'}
+
+# Negação da condição sem instruções extra, ou None se não houver
+def free_negation_code(cond_code):
+    lines = cond_code.splitlines()
+    last = lines[-1].strip().lower() if lines else ""
+    if last in negated_comparisons:
+        return "\n".join(lines[:-1] + [negated_comparisons[last]]) + "\n"
+    if last == "not":
+        return "\n".join(lines[:-1]) + "\n"
+    return parser_negated_conditions.get(cond_code)
+
+# Negação de X and/or Y com X e Y em 0/1, negando de graça um dos operandos:
+# not (X and Y) = X <= not Y = not X >= Y; not (X or Y) = X < not Y = not X > Y
+def logical_negation_code(first_code, second_code, op):
+    second_negated = free_negation_code(second_code)
+    if second_negated is not None:
+        return first_code + second_negated + ("infeq" if op == "and" else "inf") + "\n"
+    first_negated = free_negation_code(first_code)
+    if first_negated is not None:
+        return first_negated + second_code + ("supeq" if op == "and" else "sup") + "\n"
+    return None
+
+# Código que deixa na pilha a negação da condição dada
+def negate_condition_code(cond_code):
+    negated = free_negation_code(cond_code)
+    if negated is not None:
+        return negated
+    return cond_code + "not\n"
+
 # Definição da instrução while
 def p_while_statement(p):
     """while_statement : WHILE expression DO statement"""
@@ -656,16 +1576,750 @@ def p_while_statement(p):
     label_num = generate_unique_label_num()
     start_label = f"whilestart{label_num}" 
     end_label = f"whileend{label_num}"   
-    
+
+    # Condições com rótulos não podem ser duplicadas; ficam na forma original
+    if any(line.endswith(':') for line in cond_code.splitlines()):
+        p[0] = (
+            f"{start_label}:\n" +     
+            line_marker(p.lineno(1)) +
+            cond_code +                 
+            f"jz {end_label}\n" +       
+            body_code +                 
+            f"jump {start_label}\n" +   
+            f"{end_label}:\n"          
+        )
+        return
+
+    # Ciclo rodado: a condição é testada à entrada e repetida no fim do corpo,
+    # onde um único salto condicional volta ao início enquanto for verdadeira
+    marker = line_marker(p.lineno(1))
     p[0] = (
-        f"{start_label}:\n" +     
-        cond_code +                 
-        f"jz {end_label}\n" +       
-        body_code +                 
-        f"jump {start_label}\n" +   
-        f"{end_label}:\n"          
+        marker +
+        cond_code +
+        f"jz {end_label}\n" +
+        f"{start_label}:\n" +
+        body_code +
+        marker +
+        negate_condition_code(cond_code) +
+        f"jz {start_label}\n" +
+        f"{end_label}:\n"
+    )
+
+# Definição da instrução case
+def p_case_statement(p):
+    """case_statement : CASE expression OF case_list END
+                      | CASE expression OF case_list SEMI END
+                      | CASE expression OF case_list ELSE statements END
+                      | CASE expression OF case_list SEMI ELSE statements END"""
+    global parser_success, parser_var_count
+    selector_code, selector_type = p[2]
+    elements = p[4]
+    else_code = None
+    if p.slice[5].type == 'ELSE':
+        else_code = p[6]
+    elif len(p) == 9:
+        else_code = p[7]
+
+    if selector_type not in ("integer", "boolean"):
+        print(f"Erro: Selector de CASE deve ser ordinal, mas foi {selector_type}.")
+        parser_success = False
+        p[0] = ""
+        return
+
+    label_num = generate_unique_label_num()
+    end_label = f"caseend{label_num}"
+
+    # Cada ramo é colocado fora de linha e invocado com 'call'. A EWVM não tem saltos
+    # indirectos (só 'call' usa um endereço da pilha), por isso um CASE denso usa sempre
+    # uma tabela de ramos chamados; dentro de funções esses ramos correm uma moldura acima
+    # (ver shift_case_arms). Nas funções, um CASE disperso deixa os ramos em linha e
+    # alcança-os com 'jump', evitando o custo da chamada.
+    labels = sorted((low, high, None) for ranges, _ in elements for low, high in ranges)
+    table = bool(labels) and case_is_dense(labels)
+    inline_arms = parser_current_function is not None and not table
+    arm_end = f"jump {end_label}\n" if inline_arms else "return\n"
+    arms_code = []
+    intervals = []
+    for k, (ranges, body_code) in enumerate(elements):
+        arm_label = f"casearm{label_num}_{k}"
+        arms_code.append(f"{arm_label}:\n{body_code}{arm_end}")
+        for low, high in ranges:
+            if low > high:
+                print(f"Erro: Intervalo vazio {low}..{high} em CASE.")
+                parser_success = False
+            intervals.append((low, high, arm_label))
+    intervals.sort()
+    for (_, prev_high, _), (low, high, _) in zip(intervals, intervals[1:]):
+        if low <= prev_high:
+            print(f"Erro: Valor {low} repetido nas etiquetas do CASE.")
+            parser_success = False
+            p[0] = ""
+            return
+
+    else_label = None
+    if else_code is not None:
+        else_label = f"caseelse{label_num}"
+        arms_code.append(f"{else_label}:\n{else_code}{arm_end}")
+
+    # Dentro de funções o selector fica na moldura: uma chamada recursiva não o altera
+    selector = allocate_scratch_slot()
+    load_selector = f"{selector[0]} {selector[2]}\n"
+    store_selector = f"{selector[1]} {selector[2]}\n"
+
+    if inline_arms:
+        code = selector_code + store_selector
+        if intervals:
+            code += case_decision_tree_code(intervals, load_selector, else_label, inline_arms)
+        else:
+            code += case_call_code(else_label, inline_arms)
+        # Com ELSE, a árvore salta sempre para um ramo e não chega aqui
+        if else_label is None:
+            code += f"jump {end_label}\n"
+        p[0] = line_marker(p.lineno(1)) + code + "".join(arms_code) + f"{end_label}:\n"
+        return
+    defer_case_arms(arms_code)
+
+    if table:
+        code = case_jump_table_code(intervals, selector_code, load_selector, store_selector, else_label, label_num)
+    else:
+        code = selector_code + store_selector
+        if intervals:
+            code += case_decision_tree_code(intervals, load_selector, else_label, inline_arms)
+        else:
+            code += case_call_code(else_label, inline_arms)
+    p[0] = line_marker(p.lineno(1)) + code + f"{end_label}:\n"
+
+# Os ramos chamados ficam depois do 'stop' ou, dentro de uma função, depois do seu RETURN
+def defer_case_arms(arms_code):
+    if parser_current_function is not None:
+        parser_current_function['case_arms'].extend(arms_code)
+    else:
+        parser_deferred_code.extend(arms_code)
+
+# Um ramo chamado a partir de uma função corre com fp = fp da função + nº de locais
+# (ao nível das instruções a pilha só tem as locais, e 'call' não põe nada na pilha).
+# Os acessos à moldura descem 'frame_size' posições; uma chamada de cauda marcada
+# num ramo fica uma chamada normal, porque o ramo não termina no RETURN da função.
+def shift_case_arms(code, frame_size):
+    lines = []
+    for line in code.splitlines():
+        op, _, arg = line.partition(" ")
+        if line + "\n" == tail_call_marker:
+            continue
+        if op in ("pushl", "storel") and frame_size:
+            line = f"{op} {int(arg) - frame_size}"
+        elif op == "pushfp" and frame_size:
+            line = f"pushfp\npushi {-frame_size}\npadd"
+        lines.append(line)
+    return "".join(line + "\n" for line in lines)
+
+# Uma tabela de saltos compensa quando há etiquetas suficientes e poucos buracos
+def case_is_dense(intervals):
+    count = sum(high - low + 1 for low, high, _ in intervals)
+    span = intervals[-1][1] - intervals[0][0] + 1
+    return count >= 4 and span <= 2 * count and span <= 1024
+
+# Código que invoca um ramo (ou nada, se não existir)
+def case_call_code(arm_label, inline_arms):
+    if not arm_label:
+        return ""
+    if inline_arms:
+        return f"jump {arm_label}\n"
+    return f"pusha {arm_label}\ncall\n"
+
+# Tabela indexada de endereços de ramos, preenchida no arranque do programa
+def case_jump_table_code(intervals, selector_code, load_selector, store_selector, else_label, label_num):
+    global parser_var_count
+    low = intervals[0][0]
+    span = intervals[-1][1] - low + 1
+    table_slot = parser_var_count
+    parser_var_count += span
+
+    default_label = else_label
+    if default_label is None:
+        default_label = f"casenone{label_num}"
+        defer_case_arms([f"{default_label}:\nreturn\n"])
+    targets = [default_label] * span
+    for first, last, arm_label in intervals:
+        for value in range(first, last + 1):
+            targets[value - low] = arm_label
+    for offset, arm_label in enumerate(targets):
+        parser_init_code.append(f"pusha {arm_label}\nstoreg {table_slot + offset}\n")
+
+    out_label = f"caseout{label_num}"
+    end_label = f"casedispatched{label_num}"
+    return (
+        selector_code +
+        (f"pushi {low}\nsub\n" if low else "") +
+        store_selector +
+        load_selector +
+        "pushi 0\n" +
+        "supeq\n" +
+        load_selector +
+        f"pushi {span}\n" +
+        "inf\n" +
+        "and\n" +
+        f"jz {out_label}\n" +
+        "pushgp\n" +
+        f"pushi {table_slot}\n" +
+        "padd\n" +
+        load_selector +
+        "loadn\n" +
+        "call\n" +
+        f"jump {end_label}\n" +
+        f"{out_label}:\n" +
+        case_call_code(else_label, False) +
+        f"{end_label}:\n"
+    )
+
+# Árvore de decisão por pesquisa binária sobre os intervalos ordenados.
+# Com os ramos em linha e um ELSE, cada folha termina num 'jump' para um ramo,
+# por isso não se emitem saltos para o fim que nunca seriam executados.
+def case_decision_tree_code(intervals, load_selector, else_label, inline_arms):
+    always_jumps = inline_arms and else_label is not None
+    if len(intervals) == 1:
+        low, high, arm_label = intervals[0]
+        if low == high:
+            test_code = f"{load_selector}pushi {low}\nequal\n"
+        else:
+            test_code = (f"{load_selector}pushi {low}\nsupeq\n" +
+                         f"{load_selector}pushi {high}\ninfeq\nand\n")
+        label_num = generate_unique_label_num()
+        if else_label is None:
+            miss_label = f"casemiss{label_num}"
+            return test_code + f"jz {miss_label}\n" + case_call_code(arm_label, inline_arms) + f"{miss_label}:\n"
+        miss_label = f"casemiss{label_num}"
+        if always_jumps:
+            return (test_code + f"jz {miss_label}\n" + case_call_code(arm_label, inline_arms) +
+                    f"{miss_label}:\n" + case_call_code(else_label, inline_arms))
+        done_label = f"casehit{label_num}"
+        return (
+            test_code +
+            f"jz {miss_label}\n" +
+            case_call_code(arm_label, inline_arms) +
+            f"jump {done_label}\n" +
+            f"{miss_label}:\n" +
+            case_call_code(else_label, inline_arms) +
+            f"{done_label}:\n"
+        )
+
+    mid = len(intervals) // 2
+    pivot = intervals[mid][0]
+    label_num = generate_unique_label_num()
+    right_label = f"caseright{label_num}"
+    done_label = f"casesplit{label_num}"
+    if always_jumps:
+        return (
+            load_selector +
+            f"pushi {pivot}\n" +
+            "inf\n" +
+            f"jz {right_label}\n" +
+            case_decision_tree_code(intervals[:mid], load_selector, else_label, inline_arms) +
+            f"{right_label}:\n" +
+            case_decision_tree_code(intervals[mid:], load_selector, else_label, inline_arms)
+        )
+    return (
+        load_selector +
+        f"pushi {pivot}\n" +
+        "inf\n" +
+        f"jz {right_label}\n" +
+        case_decision_tree_code(intervals[:mid], load_selector, else_label, inline_arms) +
+        f"jump {done_label}\n" +
+        f"{right_label}:\n" +
+        case_decision_tree_code(intervals[mid:], load_selector, else_label, inline_arms) +
+        f"{done_label}:\n"
+    )
+
+# Definição da lista de ramos do case: [(intervalos, código), ...]
+def p_case_list(p):
+    """case_list : case_list SEMI case_element
+                 | case_element"""
+    p[0] = p[1] + [p[3]] if len(p) == 4 else [p[1]]
+
+# Definição de um ramo do case
+def p_case_element(p):
+    """case_element : case_label_list COLON statement"""
+    p[0] = (p[1], p[3])
+
+# Definição da lista de etiquetas de um ramo
+def p_case_label_list(p):
+    """case_label_list : case_label_list COMMA case_label
+                       | case_label"""
+    p[0] = p[1] + [p[3]] if len(p) == 4 else [p[1]]
+
+# Definição de uma etiqueta (valor ou intervalo)
+def p_case_label(p):
+    """case_label : case_constant
+                  | case_constant DOTDOT case_constant"""
+    p[0] = (p[1], p[3]) if len(p) == 4 else (p[1], p[1])
+
+# Definição de uma constante ordinal usada nas etiquetas
+def p_case_constant(p):
+    """case_constant : NUMBER
+                     | MINUS NUMBER
+                     | STRING_LITERAL
+                     | TRUE
+                     | FALSE
+                     | ID"""
+    global parser_success
+    token_type = p.slice[1].type
+    if token_type == 'ID':
+        const_code, const_type = parser_constants.get(p[1], ("", None))
+        if const_type == 'string' and len(const_code) == len('pushs "x"\n'):
+            p[0] = ord(const_code[len('pushs "')])
+        else:
+            p[0] = integer_constant_value(p[1])
+    elif token_type == 'MINUS':
+        p[0] = -p[2]
+    elif token_type == 'NUMBER':
+        p[0] = p[1]
+    elif token_type == 'STRING_LITERAL':
+        if len(p[1]) != 1:
+            print(f"Erro: Etiqueta de CASE '{p[1]}' deve ser um único carácter.")
+            parser_success = False
+            p[0] = 0
+        else:
+            p[0] = ord(p[1])
+    else:
+        p[0] = 1 if p[1].lower() == 'true' else 0
+
+# ====== Conjuntos ======
+
+# Os conjuntos de domínio pequeno são máscaras de bits: o elemento lo+k é o bit k.
+# A EWVM não tem deslocamentos nem operações bit a bit, por isso um deslocamento
+# é uma consulta à tabela de potências de 2 (preenchida no arranque) e o teste de
+# um bit é 'div' seguido de 'mod 2'. Os inteiros da EWVM têm 32 bits com sinal,
+# por isso só se usam os bits 0..30: a maior máscara (e potência da tabela) cabe
+# num inteiro positivo.
+
+set_max_width = 31
+
+# Verifica se um tipo é um conjunto (com domínio) ou um conjunto singular [e]
+def is_set_type(type_str):
+    return isinstance(type_str, str) and (type_str.startswith("set[") or type_str == "setelem")
+
+# Domínio (lo, hi) de um tipo "set[lo..hi]"
+def set_domain(type_str):
+    low_str, high_str = type_str[len("set["):-1].split("..")
+    return int(low_str), int(high_str)
+
+# Valor de um código que é apenas uma constante inteira, ou None
+def constant_int(code):
+    if code.startswith("pushi ") and code.count("\n") == 1:
+        try:
+            return int(code[len("pushi "):-1])
+        except ValueError:
+            return None
+    return None
+
+# Elementos de um conjunto constante (código "pushi máscara")
+def set_constant_elements(expr):
+    mask = constant_int(expr[0])
+    if mask is None or not expr[1].startswith("set["):
+        return None
+    low, _ = set_domain(expr[1])
+    return {low + k for k in range(mask.bit_length()) if mask >> k & 1}
+
+# Conjunto constante a partir dos seus elementos
+def set_constant_expr(elements):
+    if not elements:
+        return ("pushi 0\n", "set[0..0]")
+    low = min(elements)
+    mask = sum(1 << (e - low) for e in elements)
+    return (f"pushi {mask}\n", f"set[{low}..{max(elements)}]")
+
+# Reserva uma global temporária
+def allocate_temp_slot():
+    global parser_var_count
+    slot = parser_var_count
+    parser_var_count += 1
+    return slot
+
+# Reserva uma posição temporária: na moldura dentro de funções (uma chamada recursiva
+# não a altera), senão uma global; devolve (instrução de leitura, de escrita, posição)
+def allocate_scratch_slot():
+    if parser_current_function is not None:
+        slot = parser_current_function['local_count']
+        parser_current_function['local_count'] += 1
+        return "pushl", "storel", slot
+    return "pushg", "storeg", allocate_temp_slot()
+
+# Tabela de potências de 2 usada para deslocamentos em tempo de execução
+def pow2_table_slot():
+    global parser_var_count
+    if 'pow2' not in parser_runtime_slots:
+        slot = parser_var_count
+        parser_var_count += set_max_width
+        parser_runtime_slots['pow2'] = slot
+        for k in range(set_max_width):
+            parser_init_code.append(f"pushi {1 << k}\nstoreg {slot + k}\n")
+    return parser_runtime_slots['pow2']
+
+# Código que deixa 2^k na pilha, sendo k o valor deixado por 'index_code'
+def pow2_lookup_code(index_code):
+    return f"pushgp\npushi {pow2_table_slot()}\npadd\n{index_code}loadn\n"
+
+# Rotina partilhada que calcula a interseção bit a bit de duas máscaras
+def set_and_routine():
+    if 'setand' not in parser_runtime_slots:
+        a, b, r, k = (allocate_temp_slot() for _ in range(4))
+        parser_runtime_slots['setand'] = (a, b, r)
+        parser_deferred_code.append(
+            "setand:\n"
+            f"pushi 0\nstoreg {r}\npushi 1\nstoreg {k}\n"
+            "setandloop:\n"
+            f"pushg {a}\npushi 0\nsup\npushg {b}\npushi 0\nsup\nand\njz setandend\n"
+            f"pushg {r}\npushg {k}\npushg {a}\npushi 2\nmod\npushg {b}\npushi 2\nmod\nmul\nmul\nadd\nstoreg {r}\n"
+            f"pushg {a}\npushi 2\ndiv\nstoreg {a}\n"
+            f"pushg {b}\npushi 2\ndiv\nstoreg {b}\n"
+            f"pushg {k}\npushi 2\nmul\nstoreg {k}\n"
+            "jump setandloop\n"
+            "setandend:\n"
+            "return\n"
+        )
+    return parser_runtime_slots['setand']
+
+# Código da máscara de 'expr' no domínio 'domain'
+def set_coerce(expr, domain):
+    global parser_success
+    code, expr_type = expr
+    low, high = domain
+    elements = set_constant_elements(expr)
+    if elements is not None:
+        outside = sorted(e for e in elements if not low <= e <= high)
+        if outside:
+            print(f"Erro: Elemento {outside[0]} fora do domínio {low}..{high} do conjunto.")
+            parser_success = False
+            return "pushi 0\n"
+        return f"pushi {sum(1 << (e - low) for e in elements)}\n"
+    if expr_type == "setelem":
+        return pow2_lookup_code(code + (f"pushi {low}\nsub\n" if low else ""))
+    if expr_type.startswith("set[") and set_domain(expr_type) == domain:
+        return code
+    print(f"Erro: Conjunto do tipo {expr_type} incompatível com o domínio {low}..{high}.")
+    parser_success = False
+    return "pushi 0\n"
+
+# Código de (máscara em 'slot') AND (máscara constante): soma de blocos de bits contíguos
+def set_and_constant_code(slot, mask):
+    parts = []
+    k = 0
+    while mask >> k:
+        if not mask >> k & 1:
+            k += 1
+            continue
+        run = k
+        while mask >> run & 1:
+            run += 1
+        parts.append(f"pushg {slot}\npushi {1 << k}\ndiv\npushi {1 << (run - k)}\nmod\npushi {1 << k}\nmul\n")
+        k = run
+    if not parts:
+        return "pushi 0\n"
+    return parts[0] + "".join(part + "add\n" for part in parts[1:])
+
+# Domínio de uma operação entre conjuntos (o do operando não constante com domínio)
+def set_operation_domain(left, right):
+    for expr in (left, right):
+        if expr[1].startswith("set[") and set_constant_elements(expr) is None:
+            return set_domain(expr[1])
+    for expr in (left, right):
+        if set_constant_elements(expr) is not None and expr[1] != "set[0..0]":
+            return set_domain(expr[1])
+    return None
+
+# União (+), interseção (*) e diferença (-) de conjuntos
+def set_binop(op_char, left, right):
+    global parser_success
+    if not (is_set_type(left[1]) and is_set_type(right[1])) or op_char not in '+-*':
+        print(f"Erro: Operador '{op_char}' inválido entre {left[1]} e {right[1]}.")
+        parser_success = False
+        return ("", "integer")
+
+    left_elements = set_constant_elements(left)
+    right_elements = set_constant_elements(right)
+    if left_elements is not None and right_elements is not None:
+        result = {'+': left_elements | right_elements,
+                  '*': left_elements & right_elements,
+                  '-': left_elements - right_elements}[op_char]
+        return set_constant_expr(result)
+
+    domain = set_operation_domain(left, right)
+    if domain is None:
+        print("Erro: Não é possível determinar o domínio da operação entre conjuntos.")
+        parser_success = False
+        return ("", "integer")
+    result_type = f"set[{domain[0]}..{domain[1]}]"
+
+    # Um operando constante: a interseção com a constante é feita por blocos de bits
+    if left_elements is not None or right_elements is not None:
+        constant, other, constant_first = (left, right, True) if left_elements is not None else (right, left, False)
+        mask = constant_int(set_coerce(constant, domain))
+        slot = allocate_temp_slot()
+        code = set_coerce(other, domain) + f"storeg {slot}\n"
+        both = set_and_constant_code(slot, mask)
+        if op_char == '*':
+            code += both
+        elif op_char == '+':
+            code += f"pushg {slot}\n" + both + f"sub\npushi {mask}\nadd\n"
+        elif constant_first:
+            code += f"pushi {mask}\n" + both + "sub\n"
+        else:
+            code += f"pushg {slot}\n" + both + "sub\n"
+        return (code, result_type)
+
+    # Um operando singular [e]: a operação usa 2^(e-lo) e o bit correspondente
+    if left[1] == "setelem" or right[1] == "setelem":
+        if left[1] == "setelem" and right[1] == "setelem":
+            print("Erro: Não é possível determinar o domínio da operação entre conjuntos.")
+            parser_success = False
+            return ("", "integer")
+        element, other, element_first = (left, right, True) if left[1] == "setelem" else (right, left, False)
+        set_slot = allocate_temp_slot()
+        power_slot = allocate_temp_slot()
+        code = (set_coerce(other, domain) + f"storeg {set_slot}\n" +
+                set_coerce(element, domain) + f"storeg {power_slot}\n")
+        bit_times_power = (f"pushg {power_slot}\npushg {set_slot}\npushg {power_slot}\ndiv\n"
+                           "pushi 2\nmod\nmul\n")
+        if op_char == '*':
+            code += bit_times_power
+        elif op_char == '+':
+            code += f"pushg {set_slot}\npushg {power_slot}\nadd\n" + bit_times_power + "sub\n"
+        elif element_first:
+            code += f"pushg {power_slot}\n" + bit_times_power + "sub\n"
+        else:
+            code += f"pushg {set_slot}\n" + bit_times_power + "sub\n"
+        return (code, result_type)
+
+    # Dois conjuntos variáveis: interseção pela rotina partilhada
+    a, b, r = set_and_routine()
+    code = (set_coerce(left, domain) + set_coerce(right, domain) +
+            f"storeg {b}\nstoreg {a}\n")
+    call_code = "pusha setand\ncall\n"
+    if op_char == '*':
+        code += call_code + f"pushg {r}\n"
+    elif op_char == '+':
+        code += f"pushg {a}\npushg {b}\nadd\n" + call_code + f"pushg {r}\nsub\n"
+    else:
+        code += f"pushg {a}\n" + call_code + f"pushg {r}\nsub\n"
+    return (code, result_type)
+
+# Igualdade e diferença de conjuntos
+def set_compare(operator_symbol, left, right):
+    global parser_success
+    if operator_symbol not in ('=', '<>') or not (is_set_type(left[1]) and is_set_type(right[1])):
+        print(f"Erro: Comparação '{operator_symbol}' inválida entre {left[1]} e {right[1]}.")
+        parser_success = False
+        return ("", "boolean")
+    left_elements = set_constant_elements(left)
+    right_elements = set_constant_elements(right)
+    if left_elements is not None and right_elements is not None:
+        equal = left_elements == right_elements
+        return (f"pushi {int(equal == (operator_symbol == '='))}\n", "boolean")
+    domain = set_operation_domain(left, right)
+    if domain is None:
+        print("Erro: Não é possível determinar o domínio da comparação entre conjuntos.")
+        parser_success = False
+        return ("", "boolean")
+    code = set_coerce(left, domain) + set_coerce(right, domain) + "equal\n"
+    return (code + ("not\n" if operator_symbol == '<>' else ""), "boolean")
+
+# Intervalos contíguos [(lo, hi), ...] de um conjunto de inteiros
+def set_intervals(elements):
+    intervals = []
+    for e in sorted(elements):
+        if intervals and intervals[-1][1] == e - 1:
+            intervals[-1] = (intervals[-1][0], e)
+        else:
+            intervals.append((e, e))
+    return intervals
+
+# Definição do teste de pertença
+def p_expression_in(p):
+    """expression : expression IN expression"""
+    global parser_success
+    value_code, value_type = p[1]
+    set_expr = p[3]
+    if value_type not in ("integer", "boolean") or not is_set_type(set_expr[1]):
+        print(f"Erro: 'in' requer um valor ordinal e um conjunto, mas foi {value_type} in {set_expr[1]}.")
+        parser_success = False
+        p[0] = ("", "boolean")
+        return
+
+    if set_expr[1] == "setelem":
+        p[0] = (value_code + set_expr[0] + "equal\n", "boolean")
+        return
+
+    # O valor é usado várias vezes: só é reavaliado se for uma leitura simples que o
+    # conjunto (que pode chamar funções) não altera. Dentro de funções as posições
+    # temporárias ficam na moldura, para uma chamada recursiva no conjunto não as alterar.
+    if (value_code.count("\n") == 1 and value_code.split()[0] in ("pushg", "pushl", "pushi")
+            and "call" not in set_expr[0]):
+        load_value, code = value_code, ""
+    else:
+        value_load, value_store, value_slot = allocate_scratch_slot()
+        load_value, code = f"{value_load} {value_slot}\n", value_code + f"{value_store} {value_slot}\n"
+
+    elements = set_constant_elements(set_expr)
+    if elements is not None:
+        constant_value = constant_int(value_code)
+        if constant_value is not None:
+            p[0] = (f"pushi {int(constant_value in elements)}\n", "boolean")
+            return
+        intervals = set_intervals(elements)
+        if not intervals:
+            p[0] = ("pushi 0\n", "boolean")
+            return
+        # Poucos intervalos: comparações directas são mais baratas que a máscara
+        if len(intervals) <= 2 or intervals[-1][1] - intervals[0][0] + 1 > set_max_width:
+            tests = []
+            for low, high in intervals:
+                if low == high:
+                    tests.append(f"{load_value}pushi {low}\nequal\n")
+                else:
+                    tests.append(f"{load_value}pushi {low}\nsupeq\n{load_value}pushi {high}\ninfeq\nand\n")
+            p[0] = (code + tests[0] + "".join(test + "or\n" for test in tests[1:]), "boolean")
+            return
+        domain = (intervals[0][0], intervals[-1][1])
+        mask_code = set_coerce(set_expr, domain)
+    else:
+        domain = set_domain(set_expr[1])
+        mask_code = set_expr[0]
+
+    # Teste do bit (valor - lo): índice anulado fora do domínio para não sair da tabela
+    low, high = domain
+    width = high - low + 1
+    index_load, index_store, index_slot = allocate_scratch_slot()
+    range_load, range_store, range_slot = allocate_scratch_slot()
+    index = f"{index_load} {index_slot}\n"
+    in_range = f"{range_load} {range_slot}\n"
+    code += (
+        mask_code +
+        load_value + (f"pushi {low}\nsub\n" if low else "") + f"{index_store} {index_slot}\n" +
+        f"{index}pushi 0\nsupeq\n{index}pushi {width}\ninf\nand\n" +
+        f"{range_store} {range_slot}\n" +
+        pow2_lookup_code(f"{index}{in_range}mul\n") +
+        "div\npushi 2\nmod\n" +
+        f"{in_range}and\n"
+    )
+    p[0] = (code, "boolean")
+
+# ====== Arrays compactados ======
+
+# Um 'packed array[lo..hi] of boolean' guarda packed_bits elementos por global: o
+# elemento lo+k é o bit (k mod packed_bits) da global k div packed_bits. Tal como nos
+# conjuntos, o bit é lido com a tabela de potências de 2 seguida de 'div' e 'mod 2'.
+
+packed_bits = set_max_width
+
+# Limites (lo, hi) de um tipo "packed_array[lo..hi]_of_boolean"
+def packed_array_bounds(type_str):
+    low_str, high_str = type_str[len("packed_array["):type_str.index("]")].split("..")
+    return int(low_str), int(high_str)
+
+def packed_array_words(low, high):
+    return (high - low + packed_bits) // packed_bits
+
+# Índice relativo do elemento; devolve (código que o calcula, código que o carrega)
+def packed_index_code(var_info):
+    low = var_info['low_bound']
+    index_code = var_info['index_code'] + (f"pushi {low}\nsub\n" if low else "")
+    if index_code.count("\n") == 1 and index_code.split()[0] in ("pushg", "pushl", "pushi"):
+        return "", index_code
+    load, store, index_slot = allocate_scratch_slot()
+    return index_code + f"{store} {index_slot}\n", f"{load} {index_slot}\n"
+
+# Par (endereço, índice) da global que contém o elemento
+def packed_word_code(var_info, load_index):
+    return array_base_code(var_info) + f"{load_index}pushi {packed_bits}\ndiv\n"
+
+# Leitura do elemento: (palavra div 2^bit) mod 2
+def packed_load_code(var_info):
+    setup_code, load_index = packed_index_code(var_info)
+    return (setup_code + packed_word_code(var_info, load_index) + "loadn\n" +
+            pow2_lookup_code(f"{load_index}pushi {packed_bits}\nmod\n") + "div\npushi 2\nmod\n")
+
+# Escrita do elemento: retira o bit antigo da palavra e soma o novo valor vezes 2^bit.
+# O valor é calculado primeiro e fica na pilha; o endereço e o bit são calculados a
+# seguir, pelo que uma chamada no valor (que pode alterar o mesmo array, ou entrar
+# recursivamente aqui) não se intromete entre a leitura e a escrita da palavra.
+def packed_store_code(var_info, value_code):
+    value = constant_int(value_code)
+    setup_code, load_index = packed_index_code(var_info)
+    address_load, address_store, address_slot = allocate_scratch_slot()
+    bit_load, bit_store, bit_slot = allocate_scratch_slot()
+    address = f"{address_load} {address_slot}\n"
+    bit = f"{bit_load} {bit_slot}\n"
+    if value is None:
+        # (endereço, palavra + valor * 2^bit), com o valor já na pilha
+        word_code = value_code + setup_code
+        new_word_code = f"{bit}mul\n{address}swap\n{address}load 0\nadd\n"
+        new_bit_code = ""
+    else:
+        word_code = setup_code
+        new_word_code = f"{address}{address}load 0\n"
+        new_bit_code = f"{bit}add\n" if value else ""
+    return (
+        word_code +
+        packed_word_code(var_info, load_index) + f"padd\n{address_store} {address_slot}\n" +
+        pow2_lookup_code(f"{load_index}pushi {packed_bits}\nmod\n") + f"{bit_store} {bit_slot}\n" +
+        new_word_code +
+        f"{address}load 0\n{bit}div\npushi 2\nmod\n{bit}mul\nsub\n" +
+        new_bit_code +
+        "store 0\n"
     )
 
+# Definição do construtor de conjuntos
+def p_expression_set_constructor(p):
+    """expression : LBRACKET set_element_list RBRACKET
+                  | LBRACKET RBRACKET"""
+    global parser_success
+    if len(p) == 3:
+        p[0] = set_constant_expr(set())
+        return
+    elements = set()
+    variable_elements = []
+    for low_expr, high_expr in p[2]:
+        low_value = set_element_constant(low_expr)
+        high_value = set_element_constant(high_expr) if high_expr is not None else low_value
+        if low_value is None or high_value is None:
+            if high_expr is not None:
+                print("Erro: Intervalos em conjuntos devem ter limites constantes.")
+                parser_success = False
+            variable_elements.append(low_expr)
+        else:
+            elements.update(range(low_value, high_value + 1))
+    if not variable_elements:
+        p[0] = set_constant_expr(elements)
+    elif len(variable_elements) == 1 and not elements:
+        p[0] = (variable_elements[0][0], "setelem")
+    else:
+        print("Erro: Elementos não constantes só são suportados em conjuntos com um único elemento.")
+        parser_success = False
+        p[0] = set_constant_expr(elements)
+
+# Valor constante de um elemento de conjunto (inteiro, booleano ou carácter), ou None
+def set_element_constant(expr):
+    code, expr_type = expr
+    if expr_type in ("integer", "boolean"):
+        return constant_int(code)
+    if expr_type == "string":
+        text = constant_write_text(code, expr_type)
+        if text is not None and len(text) == 1:
+            return ord(text)
+    return None
+
+# Definição da lista de elementos de um conjunto
+def p_set_element_list(p):
+    """set_element_list : set_element_list COMMA set_element
+                        | set_element"""
+    p[0] = p[1] + [p[3]] if len(p) == 4 else [p[1]]
+
+# Definição de um elemento (valor ou intervalo) de um conjunto
+def p_set_element(p):
+    """set_element : expression
+                   | expression DOTDOT expression"""
+    p[0] = (p[1], p[3]) if len(p) == 4 else (p[1], None)
+
 # Definição da expressão binária
 def p_expression_binop(p):
     """expression : expression PLUS expression
@@ -680,6 +2334,10 @@ def p_expression_binop(p):
     op_code = ""
     result_type = "integer" 
 
+    if is_set_type(left_type) or is_set_type(right_type):
+        p[0] = set_binop(op_char, p[1], p[3])
+        return
+
     if op_char == '/':
         final_left_code = left_code + ("itof\n" if left_type == "integer" else "")
         final_right_code = right_code + ("itof\n" if right_type == "integer" else "")
@@ -704,7 +2362,12 @@ def p_expression_binop(p):
         p[0] = ("", result_type) 
         return
 
-    p[0] = (final_left_code + final_right_code + op_code + "\n", result_type)
+    # Com strings, 'add' concatena e a ordem dos operandos conta
+    if left_type == "string" or right_type == "string":
+        p[0] = (final_left_code + final_right_code + op_code + "\n", result_type)
+        return
+    first_code, second_code, op_code = ordered_operands(final_left_code, final_right_code, op_code)
+    p[0] = (first_code + second_code + op_code + "\n", result_type)
 
 # Definição da expressão a partir de uma variável
 def p_expression_from_variable(p):
@@ -725,26 +2388,30 @@ def p_expression_from_variable(p):
         basetype_str = var_info.get('basetype', "integer")
         p[0] = (f"pushg {parser_var[var_name]}\n", basetype_str)
 
+    elif var_info['type'] == 'frame':
+        p[0] = (f"pushl {var_info['offset']}\n", var_info['basetype'])
+
+    elif var_info['type'] == 'constant':
+        p[0] = (var_info['code'], var_info['basetype'])
+
     elif var_info['type'] == 'indexed_array': 
-        array_name = var_info['name']
-        index_code = var_info['index_code'] 
         element_basetype = var_info.get('basetype', "integer")
-        array_slot = parser_var[array_name]
-        low_bound = var_info.get('low_bound', 1)
-
-        code = "pushgp\n"
-        code += f"pushi {array_slot}\n"
-        code += "padd\n"
-        code += index_code 
-        code += f"pushi {low_bound}\n"
-        code += "sub\n" 
-        code += "loadn\n" 
-        p[0] = (code, element_basetype)
+        p[0] = (indexed_address_code(var_info) + "loadn\n", element_basetype)
+
+    elif var_info['type'] == 'indexed_packed':
+        p[0] = (packed_load_code(var_info), "boolean")
 
     elif var_info['type'] == 'indexed_string_char':
         string_var_name = var_info['name']
         index_code = var_info['index_code'] 
 
+        if 'string_code' in var_info:
+            p[0] = (var_info['string_code'] + index_code + "pushi 1\nsub\nCHARAT\n", "integer")
+            return
+        if 'frame_offset' in var_info:
+            p[0] = (f"pushl {var_info['frame_offset']}\n" + index_code + "pushi 1\nsub\nCHARAT\n", "integer")
+            return
+
         if string_var_name not in parser_var:
             print(f"Erro: Variável string '{string_var_name}' não encontrada.")
             parser_success = False
@@ -784,6 +2451,9 @@ def p_empty(p):
     'empty :'
     p[0] = "" 
 
+# Depois de um erro, o PLY retira estados até poder usar 'error' numa das regras de
+# recuperação abaixo e descarta tokens até ao próximo que a possa seguir (';', 'end', ...).
+# Erros nos 3 tokens seguintes não são reportados, evitando mensagens em cascata.
 def p_error(p):
     if p:
         print(f"Erro de sintaxe: {p.type}({p.value}) na linha {p.lineno}")
@@ -792,14 +2462,226 @@ def p_error(p):
     global parser_success
     parser_success = False
 
+# Recuperação: uma instrução com erro de sintaxe é descartada e a análise continua
+def p_statement_error(p):
+    """statement : error"""
+    p[0] = ""
+
+# Recuperação: uma declaração de variáveis com erro é descartada até ao ';'
+def p_var_declaration_error(p):
+    """var_declaration : error SEMI"""
+    p[0] = ""
+
+# ====== Tabela de strings ======
+
+# Com -O1 ou mais, um literal usado mais do que uma vez, ou em código que corre
+# repetidamente (ciclos do programa principal, funções e ramos de CASE), é criado
+# uma única vez no arranque: 'pushs' seguido de 'storeg' para uma global da tabela.
+# Cada uso passa a 'pushg' dessa global, em vez de criar uma nova string.
+
+# Literal de uma linha 'pushs "..."' (sem as aspas) ou None
+def string_literal(line):
+    line = line.strip()
+    if line.startswith('pushs "') and line.endswith('"'):
+        return line[len('pushs "'):-1]
+    return None
+
+# Linhas de 'code' que estão dentro de um ciclo (entre um rótulo e um 'jump' para trás)
+def lines_in_loops(lines):
+    label_positions = {line.strip()[:-1]: index for index, line in enumerate(lines) if line.strip().endswith(":")}
+    in_loop = [False] * len(lines)
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith("jump ") and label_positions.get(stripped[len("jump "):], index) < index:
+            for k in range(label_positions[stripped[len("jump "):]], index):
+                in_loop[k] = True
+    return in_loop
+
+# Escolhe os literais da tabela e reserva-lhes globais; devolve {literal: global}
+def build_string_pool(main_code, deferred_code, functions_code):
+    uses = {}
+    repeated = set()
+    main_lines = main_code.splitlines()
+    for line, in_loop in zip(main_lines, lines_in_loops(main_lines)):
+        literal = string_literal(line)
+        if literal is not None:
+            uses[literal] = uses.get(literal, 0) + 1
+            if in_loop:
+                repeated.add(literal)
+    function_lines = [deferred_code, functions_code]
+    if parser_function_spill is not None:
+        parser_function_spill.seek(0)
+        function_lines.append(parser_function_spill)
+    for lines in function_lines:
+        for line in (lines.splitlines() if isinstance(lines, str) else lines):
+            literal = string_literal(line)
+            if literal is not None:
+                uses[literal] = uses.get(literal, 0) + 1
+                repeated.add(literal)
+    if parser_function_spill is not None:
+        parser_function_spill.seek(0, io.SEEK_END)
+    return {literal: allocate_temp_slot() for literal, count in uses.items() if count > 1 or literal in repeated}
+
+# Troca os 'pushs' de literais da tabela pela leitura da respectiva global
+def use_string_pool(code, string_pool):
+    if not string_pool or 'pushs "' not in code:
+        return code
+    lines = code.split("\n")
+    for index, line in enumerate(lines):
+        literal = string_literal(line)
+        if literal is not None and literal in string_pool:
+            lines[index] = f"pushg {string_pool[literal]}"
+    return "\n".join(lines)
+
+# Lê o ficheiro de funções em blocos que terminam sempre no fim de uma linha
+def spill_chunks(spill):
+    pending = ""
+    for chunk in iter(lambda: spill.read(1 << 16), ""):
+        chunk = pending + chunk
+        cut = chunk.rfind("\n") + 1
+        pending = chunk[cut:]
+        if cut:
+            yield chunk[:cut]
+    if pending:
+        yield pending
+
 # ====== Criação do parser ======
 parser = yacc.yacc(debug=True)
+parser_engine = parser # motor de parsing em uso: o LALR do PLY ou o descendente recursivo (pascal_rd)
+
+# Compila 'source' escrevendo o programa em 'stream'; devolve (resultado, CodeWriter).
+# O resultado é "" para programas, o artefacto para unidades e None em caso de erro de sintaxe.
+def compile_program(source, stream, source_map=False):
+    global parser_output, parser_function_spill
+    reset_compiler_state()
+    parser_output = CodeWriter(stream, source_map=source_map)
+    parser_function_spill = None if parser_check_only else tempfile.TemporaryFile('w+', encoding='utf-8')
+    pascal_lex.lexer.lineno = 1
+    try:
+        result = parser_engine.parse(source, lexer=pascal_lex.lexer)
+    finally:
+        parser_output.close()
+        if parser_function_spill is not None:
+            parser_function_spill.close()
+    return result, parser_output
+
+# Verifica os ficheiros sem gerar código (--check): escreve os diagnósticos de cada um
+# precedidos do nome do ficheiro e devolve o nº de ficheiros com erros
+def check_sources(filenames, unit_dirs, out=None):
+    import contextlib
+    import os
+    import time
+    global parser_check_only, parser_unit_paths
+    out = out if out is not None else sys.stdout
+    failed = 0
+    started = time.perf_counter()
+    parser_check_only = True
+    try:
+        for filename in filenames:
+            try:
+                with open(filename, 'r', encoding='utf-8') as file:
+                    source = file.read()
+            except (FileNotFoundError, UnicodeDecodeError) as error:
+                out.write(f"{filename}: Erro: Não foi possível ler o ficheiro ({error}).\n")
+                failed += 1
+                continue
+            parser_unit_paths = [os.path.dirname(filename) or '.'] + unit_dirs + ['.']
+            diagnostics = io.StringIO()
+            with contextlib.redirect_stdout(diagnostics):
+                result, _ = compile_program(source, io.StringIO())
+            lines = [line for line in diagnostics.getvalue().splitlines() if line.strip()]
+            for line in lines:
+                out.write(f"{filename}: {line}\n")
+            if not parser_success or result is None:
+                failed += 1
+    finally:
+        parser_check_only = False
+    elapsed = time.perf_counter() - started
+    out.write(f"Verificados {len(filenames)} ficheiro(s) em {elapsed:.3f} s: {failed} com erros.\n")
+    return failed
+
+# ====== Mapa de fonte ======
+
+# Escreve código num ficheiro à medida que é gerado, retirando os marcadores de linha.
+# Com 'source_map' regista também a linha Pascal de cada instrução escrita.
+class CodeWriter:
+    def __init__(self, stream, source_map=True):
+        self.stream = stream
+        self.source_map = source_map
+        self.instruction_lines = []
+        self.current_line = 0
+        self.partial_line = ""
+
+    def write(self, code):
+        lines = (self.partial_line + code).split("\n")
+        self.partial_line = lines.pop()
+        clean_lines = []
+        for line in lines:
+            stripped = line.strip()
+            if stripped.startswith("//line "):
+                self.current_line = int(stripped[len("//line "):])
+                continue
+            clean_lines.append(line + "\n")
+            if self.source_map and stripped and not stripped.endswith(':') and not stripped.startswith("//"):
+                self.instruction_lines.append(self.current_line)
+                if stripped.lower() in ("return", "stop"):
+                    self.current_line = 0
+        self.stream.write("".join(clean_lines))
+
+    def close(self):
+        if self.partial_line:
+            self.write("\n")
+
+# Retira os marcadores de linha do código e devolve (código, linha Pascal por instrução)
+def extract_source_map(code):
+    writer = CodeWriter(io.StringIO())
+    writer.write(code)
+    writer.close()
+    return writer.stream.getvalue(), writer.instruction_lines
+
+# Escreve o mapa de fonte em JSON: índice de instrução -> linha Pascal
+def write_source_map(filename, source_filename, instruction_lines):
+    import json
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump({'source': source_filename, 'lines': instruction_lines}, f)
+        f.write("\n")
 
 # ====== Função principal para executar o parser ======
 if __name__ == "__main__":
-    input_filename = 'inputs/input4.txt'
-    if len(sys.argv) > 1:
-        input_filename = sys.argv[1]
+    import argparse
+    import os
+    arg_parser = argparse.ArgumentParser(description="Compila Pascal para EWVM.")
+    arg_parser.add_argument('input', nargs='*', default=['inputs/input4.txt'],
+                            help="fonte a compilar (com --check, um ou mais fontes)")
+    arg_parser.add_argument('-o', '--output', default='output.txt')
+    arg_parser.add_argument('--map', action='store_true',
+                            help="escreve o mapa de fonte (instrução -> linha Pascal) em <output>.map")
+    arg_parser.add_argument('-I', '--units', action='append', default=[], metavar='DIR',
+                            help="directoria adicional onde procurar unidades (USES)")
+    arg_parser.add_argument('-O', dest='opt_level', type=int, choices=sorted(ewvm_opt.optimization_levels),
+                            default=1, metavar='N', help="nível de optimização: 0, 1 (por defeito) ou 2")
+    arg_parser.add_argument('--pass-stats', action='store_true',
+                            help="mostra o tempo e as instruções retiradas por cada passagem")
+    arg_parser.add_argument('--verify-passes', action='store_true',
+                            help="verifica o grafo de fluxo depois de cada passagem")
+    arg_parser.add_argument('--eval-budget', type=int, default=parser_eval_budget, metavar='N',
+                            help="máximo de instruções ao avaliar funções puras durante a compilação")
+    arg_parser.add_argument('--parser', choices=('ply', 'rd'), default='ply',
+                            help="motor de parsing: LALR do PLY ou descendente recursivo")
+    arg_parser.add_argument('--check', action='store_true',
+                            help="só verifica sintaxe e semântica, sem gerar código; aceita vários fontes")
+    args = arg_parser.parse_args()
+    if args.parser == 'rd':
+        import pascal_rd
+        parser_engine = pascal_rd.RecursiveDescentParser(sys.modules[__name__])
+    if args.check and args.parser == 'rd':
+        # O descendente recursivo pára no primeiro erro de sintaxe de cada fonte
+        arg_parser.error("--check não suporta --parser rd (não recupera de erros de sintaxe)")
+    if args.check:
+        sys.exit(1 if check_sources(args.input, args.units) else 0)
+    if len(args.input) != 1:
+        arg_parser.error("só é possível compilar um fonte de cada vez (use --check para verificar vários)")
+    input_filename = args.input[0]
     
     try:
         with open(input_filename, 'r', encoding='utf-8') as file:
@@ -808,26 +2690,45 @@ if __name__ == "__main__":
         print(f"Erro: Ficheiro de entrada '{input_filename}' não encontrado.")
         sys.exit(1)
 
-    parser_success = True
-    parser_functions.clear()
-    parser_params.clear()
-    parser_var.clear()
-    parser_var_count = 0
-    parser_var_types.clear()
-    label_seq_num = 0
-    
-    codigo = parser.parse(source)
+    parser_unit_paths = [os.path.dirname(input_filename) or '.'] + args.units + ['.']
+    parser_pass_manager = ewvm_opt.PassManager(args.opt_level, verify=args.verify_passes)
+    parser_eval_budget = args.eval_budget
 
-    if parser_success and codigo is not None:
-        output_filename = 'output.txt'
+    # O programa é escrito num ficheiro temporário que só substitui o de saída se a compilação correr bem
+    output_filename = args.output
+    partial_filename = output_filename + '.partial'
+    try:
+        output_file = open(partial_filename, 'w', encoding='utf-8', buffering=1 << 16)
+    except IOError:
+        print(f"Erro: Não foi possível escrever no ficheiro '{output_filename}'.")
+        sys.exit(1)
+    try:
+        codigo, code_writer = compile_program(source, output_file, source_map=args.map)
+    finally:
+        output_file.close()
+
+    if parser_success and isinstance(codigo, dict):
+        # Compilar uma unidade produz apenas o seu artefacto
+        import hashlib
+        codigo['source_hash'] = hashlib.sha256(source.encode('utf-8')).hexdigest()
+        artifact_filename = os.path.splitext(input_filename)[0] + '.ewu'
         try:
-            with open(output_filename, 'w', encoding='utf-8') as f:
-                if parser_var_count > 0:
-                    f.write(f"pushn {parser_var_count}\n") 
-                
-                f.write(codigo)
-            print(f"Parsing completado com sucesso!")
+            write_unit_artifact(artifact_filename, codigo)
+            print(f"Unidade compilada para '{artifact_filename}'.")
         except IOError:
+            print(f"Erro: Não foi possível escrever no ficheiro '{artifact_filename}'.")
+    elif parser_success and codigo is not None:
+        try:
+            os.replace(partial_filename, output_filename)
+            if args.map:
+                write_source_map(os.path.splitext(output_filename)[0] + '.map', input_filename,
+                                 code_writer.instruction_lines)
+            print(f"Parsing completado com sucesso!")
+        except OSError:
             print(f"Erro: Não foi possível escrever no ficheiro '{output_filename}'.")
     else:
-        print('Parsing falhou!')
\ No newline at end of file
+        print('Parsing falhou!')
+    if os.path.exists(partial_filename):
+        os.remove(partial_filename)
+    if args.pass_stats:
+        parser_pass_manager.report()
@@ -29,8 +29,10 @@ tokens = [
     'GT',
     'ID',
     'IF',
+    'IMPLEMENTATION',
     'IN',
     'INTEGER',
+    'INTERFACE',
     'LABEL',
     'LBRACKET',
     'LE',
@@ -64,7 +66,9 @@ tokens = [
     'TO',
     'TRUE',
     'TYPE',
+    'UNIT',
     'UNTIL',
+    'USES',
     'VAR',
     'WHILE',
     'WITH',
@@ -188,6 +192,16 @@ def t_IF(t):
     t.type = 'IF'
     return t
 
+def t_IMPLEMENTATION(t):
+    r'\bimplementation\b'
+    t.type = 'IMPLEMENTATION'
+    return t
+
+def t_INTERFACE(t):
+    r'\binterface\b'
+    t.type = 'INTERFACE'
+    return t
+
 def t_IN(t):
     r'\bin\b'
     t.type = 'IN'
@@ -268,11 +282,21 @@ def t_TYPE(t):
     t.type = 'TYPE'
     return t
 
+def t_UNIT(t):
+    r'\bunit\b'
+    t.type = 'UNIT'
+    return t
+
 def t_UNTIL(t):
     r'\buntil\b'
     t.type = 'UNTIL'
     return t
 
+def t_USES(t):
+    r'\buses\b'
+    t.type = 'USES'
+    return t
+
 def t_VAR(t):
     r'\bvar\b'
     t.type = 'VAR'
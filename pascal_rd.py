@@ -0,0 +1,609 @@
+import sys
+import time
+from ply.lex import LexToken
+
+# ====== Parser descendente recursivo ======
+
+# Alternativa ao LALR do PLY para a mesma gramática. Reutiliza as acções p_* de pascal_gt,
+# chamando-as pela mesma ordem das reduções LR (pós-ordem da árvore), pelo que o código
+# gerado é idêntico. As regras que só copiam valores ou constroem listas (statement, type,
+# statement_sequence, writelist, ...) são resolvidas aqui sem chamar a acção.
+# O ganho é pequeno: com '--bench --repeat 5' em inputs/ o RD é ~1.1x mais rápido,
+# quer na compilação completa quer a partir de tokens, porque o tempo é dominado
+# pelo lexer e pelas acções p_* (geração de código), que os dois motores partilham.
+
+# Precedência dos operadores binários (maior = liga mais)
+binary_precedence = {
+    'OR': 1,
+    'AND': 2,
+    'EQ': 3, 'NEQ': 3, 'LT': 3, 'LE': 3, 'GT': 3, 'GE': 3, 'IN': 3,
+    'PLUS': 4, 'MINUS': 4,
+    'TIMES': 5, 'DIVIDE': 5, 'DIV': 5, 'MOD': 5,
+}
+nonassoc_level = 3
+
+# Nome da acção de cada operador binário
+binary_actions = {
+    'OR': 'p_expression_logical', 'AND': 'p_expression_logical',
+    'EQ': 'p_expression_relop', 'NEQ': 'p_expression_relop', 'LT': 'p_expression_relop',
+    'LE': 'p_expression_relop', 'GT': 'p_expression_relop', 'GE': 'p_expression_relop',
+    'IN': 'p_expression_in',
+    'PLUS': 'p_expression_binop', 'MINUS': 'p_expression_binop',
+    'TIMES': 'p_expression_binop', 'DIVIDE': 'p_expression_binop',
+    'DIV': 'p_expression_div', 'MOD': 'p_expression_mod',
+}
+
+# Primeiros tokens de uma constante de CASE
+case_constant_tokens = {'NUMBER', 'MINUS', 'STRING_LITERAL', 'TRUE', 'FALSE', 'ID'}
+
+class SyntaxErrorAbort(Exception):
+    pass
+
+# Equivalente ao YaccProduction do PLY: p[0] é o resultado e p[1..n] os valores da regra.
+# Em 'slice' só os terminais são tokens; os não terminais têm lineno 0, como no PLY.
+class Production(list):
+    __slots__ = ('slice',)
+
+    def lineno(self, n):
+        return getattr(self.slice[n], 'lineno', 0)
+
+# Token sentinela no fim da entrada
+class EndToken:
+    type = None
+
+class RecursiveDescentParser:
+    def __init__(self, actions):
+        self.actions = actions
+        self.binary_actions = {op: getattr(actions, name) for op, name in binary_actions.items()}
+
+    # ---- Infra-estrutura ----
+
+    # 'tokens' permite reutilizar uma lista de tokens já produzida pelo lexer
+    def parse(self, source=None, lexer=None, tokens=None):
+        if tokens is None:
+            lexer = lexer if lexer is not None else self.actions.pascal_lex.lexer
+            lexer.input(source)
+            tokens = list(iter(lexer.token, None))
+        self.tokens = tokens + [EndToken()]
+        self.end = len(tokens)
+        self.pos = 0
+        try:
+            result = self.parse_source()
+            if self.pos < self.end:
+                self.error()
+            return result
+        except SyntaxErrorAbort:
+            return None
+
+    # Chama a acção com os símbolos da regra: tokens para terminais, valores para não terminais
+    def reduce(self, action, *symbols):
+        p = Production([None])
+        for symbol in symbols:
+            p.append(symbol.value if symbol.__class__ is LexToken else symbol)
+        p.slice = (None,) + symbols
+        action(p)
+        return p[0]
+
+    def peek(self):
+        return self.tokens[self.pos].type
+
+    def peek_next(self):
+        return self.tokens[self.pos + 1].type if self.pos < self.end else None
+
+    def advance(self):
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def expect(self, token_type):
+        token = self.tokens[self.pos]
+        if token.type != token_type:
+            self.error()
+        self.pos += 1
+        return token
+
+    def error(self):
+        self.actions.p_error(self.tokens[self.pos] if self.pos < self.end else None)
+        raise SyntaxErrorAbort()
+
+    # ---- Programa, unidades e declarações ----
+
+    def parse_source(self):
+        if self.peek() == 'UNIT':
+            return self.parse_unit()
+        return self.parse_program()
+
+    def parse_program(self):
+        a = self.actions
+        t_program = self.expect('PROGRAM')
+        t_id = self.expect('ID')
+        t_semi = self.expect('SEMI')
+        uses = self.parse_uses_clause()
+        declarations = self.parse_declarations()
+        self.parse_functions()
+        t_begin = self.expect('BEGIN')
+        statements = self.parse_statements()
+        t_end = self.expect('END')
+        t_dot = self.expect('DOT')
+        return self.reduce(a.p_program, t_program, t_id, t_semi, uses, declarations,
+                           "", t_begin, statements, t_end, t_dot)
+
+    def parse_unit(self):
+        a = self.actions
+        t_unit = self.expect('UNIT')
+        t_id = self.expect('ID')
+        t_semi = self.expect('SEMI')
+        t_interface = self.expect('INTERFACE')
+        interface_list = self.reduce(a.p_interface_list, self.parse_function_signature())
+        while self.peek() == 'FUNCTION':
+            interface_list = self.reduce(a.p_interface_list, interface_list, self.parse_function_signature())
+        t_implementation = self.expect('IMPLEMENTATION')
+        declarations = self.parse_declarations()
+        self.parse_functions()
+        t_end = self.expect('END')
+        t_dot = self.expect('DOT')
+        return self.reduce(a.p_unit, t_unit, t_id, t_semi, t_interface, interface_list,
+                           t_implementation, declarations, "", t_end, t_dot)
+
+    def parse_uses_clause(self):
+        if self.peek() != 'USES':
+            return self.reduce(self.actions.p_uses_clause, "")
+        t_uses = self.advance()
+        id_list = self.parse_id_list()
+        t_semi = self.expect('SEMI')
+        return self.reduce(self.actions.p_uses_clause, t_uses, id_list, t_semi)
+
+    # As declarações de variáveis só têm efeitos laterais; o código de cada uma é ""
+    def parse_declarations(self):
+        if self.peek() == 'CONST':
+            t_const = self.advance()
+            const_list = self.reduce(self.actions.p_const_declaration_list, self.parse_const_declaration())
+            while self.peek() == 'ID':
+                const_list = self.reduce(self.actions.p_const_declaration_list, const_list,
+                                         self.parse_const_declaration())
+            if self.peek() != 'VAR':
+                return self.reduce(self.actions.p_declarations_const, t_const, const_list)
+            t_var = self.advance()
+            return self.reduce(self.actions.p_declarations_const, t_const, const_list, t_var,
+                               self.parse_var_declaration_list())
+        if self.peek() != 'VAR':
+            return ""
+        self.advance()
+        return self.parse_var_declaration_list()
+
+    def parse_var_declaration_list(self):
+        code = self.parse_var_declaration()
+        while self.peek() == 'ID':
+            code += self.parse_var_declaration()
+        return code
+
+    def parse_const_declaration(self):
+        t_id = self.expect('ID')
+        t_eq = self.expect('EQ')
+        value = self.parse_expression()
+        return self.reduce(self.actions.p_const_declaration, t_id, t_eq, value, self.expect('SEMI'))
+
+    def parse_var_declaration(self):
+        id_list = self.parse_id_list()
+        t_colon = self.expect('COLON')
+        var_type = self.parse_type()
+        t_semi = self.expect('SEMI')
+        return self.reduce(self.actions.p_var_declaration, id_list, t_colon, var_type, t_semi)
+
+    def parse_id_list(self):
+        ids = [self.expect('ID').value]
+        while self.peek() == 'COMMA':
+            self.advance()
+            ids.append(self.expect('ID').value)
+        return ids
+
+    def parse_type(self):
+        token_type = self.peek()
+        if token_type == 'PACKED':
+            t_packed = self.advance()
+            t_array = self.expect('ARRAY')
+            t_lbracket = self.expect('LBRACKET')
+            index_range = self.parse_index_range()
+            t_rbracket = self.expect('RBRACKET')
+            t_of = self.expect('OF')
+            element_type = self.parse_type()
+            return self.reduce(self.actions.p_packed_array_type, t_packed, t_array, t_lbracket, index_range,
+                               t_rbracket, t_of, element_type)
+        if token_type == 'ARRAY':
+            t_array = self.advance()
+            t_lbracket = self.expect('LBRACKET')
+            index_range = self.parse_index_range()
+            t_rbracket = self.expect('RBRACKET')
+            t_of = self.expect('OF')
+            element_type = self.parse_type()
+            return self.reduce(self.actions.p_array_type, t_array, t_lbracket, index_range,
+                               t_rbracket, t_of, element_type)
+        if token_type == 'SET':
+            t_set = self.advance()
+            t_of = self.expect('OF')
+            if self.peek() == 'BOOLEAN':
+                element = self.advance()
+            else:
+                element = self.parse_index_range()
+            return self.reduce(self.actions.p_set_type, t_set, t_of, element)
+        if token_type == 'RECORD':
+            t_record = self.advance()
+            field_list = self.reduce(self.actions.p_field_list, self.parse_field_declaration())
+            while self.peek() == 'SEMI':
+                t_semi = self.advance()
+                if self.peek() == 'END':
+                    return self.reduce(self.actions.p_record_type, t_record, field_list, t_semi, self.advance())
+                field_list = self.reduce(self.actions.p_field_list, field_list, t_semi,
+                                         self.parse_field_declaration())
+            return self.reduce(self.actions.p_record_type, t_record, field_list, self.expect('END'))
+        if token_type in ('INTEGER', 'BOOLEAN', 'STRING', 'REAL'):
+            return self.reduce(self.actions.p_simple_type, self.advance())
+        self.error()
+
+    def parse_field_declaration(self):
+        id_list = self.parse_id_list()
+        t_colon = self.expect('COLON')
+        return self.reduce(self.actions.p_field_declaration, id_list, t_colon, self.parse_type())
+
+    def parse_index_range(self):
+        low = self.parse_index_bound()
+        t_dotdot = self.expect('DOTDOT')
+        return self.reduce(self.actions.p_index_range, low, t_dotdot, self.parse_index_bound())
+
+    def parse_index_bound(self):
+        if self.peek() == 'ID':
+            return self.reduce(self.actions.p_index_bound, self.advance())
+        return self.reduce(self.actions.p_index_bound, self.expect('NUMBER'))
+
+    # ---- Funções ----
+
+    def parse_functions(self):
+        while self.peek() == 'FUNCTION':
+            self.parse_function()
+
+    def parse_function(self):
+        a = self.actions
+        header = self.reduce(a.p_function_header, self.parse_function_signature())
+        declarations = self.parse_declarations()
+        t_begin = self.expect('BEGIN')
+        statements = self.parse_statements()
+        t_end = self.expect('END')
+        t_semi = self.expect('SEMI')
+        return self.reduce(a.p_function, header, declarations, t_begin, statements, t_end, t_semi)
+
+    def parse_function_signature(self):
+        t_function = self.expect('FUNCTION')
+        t_id = self.expect('ID')
+        if self.peek() == 'COLON':
+            t_colon = self.advance()
+            return_type = self.parse_type()
+            t_semi = self.expect('SEMI')
+            return self.reduce(self.actions.p_function_signature, t_function, t_id, t_colon, return_type, t_semi)
+        t_lparen = self.expect('LPAREN')
+        param_list = [self.parse_param()]
+        while self.peek() == 'SEMI':
+            self.advance()
+            param_list.append(self.parse_param())
+        t_rparen = self.expect('RPAREN')
+        t_colon = self.expect('COLON')
+        return_type = self.parse_type()
+        t_semi = self.expect('SEMI')
+        return self.reduce(self.actions.p_function_signature, t_function, t_id, t_lparen,
+                           param_list, t_rparen, t_colon, return_type, t_semi)
+
+    def parse_param(self):
+        name = self.expect('ID').value
+        self.expect('COLON')
+        return (name, self.parse_type())
+
+    # ---- Instruções ----
+
+    def parse_statements(self):
+        codes = []
+        code = self.parse_statement()
+        if code:
+            codes.append(code)
+        while self.peek() == 'SEMI':
+            self.advance()
+            code = self.parse_statement()
+            if code:
+                codes.append(code)
+        return "".join(codes)
+
+    def parse_statement(self):
+        token_type = self.peek()
+        a = self.actions
+        if token_type == 'ID':
+            variable = self.parse_variable(self.advance())
+            t_assign = self.expect('ASSIGN')
+            return self.reduce(a.p_assignment_statement, variable, t_assign, self.parse_expression())
+        if token_type == 'WRITELN' or token_type == 'WRITE':
+            return self.parse_write(token_type)
+        if token_type == 'READLN':
+            t_readln = self.advance()
+            t_lparen = self.expect('LPAREN')
+            variable = self.parse_variable(self.expect('ID'))
+            t_rparen = self.expect('RPAREN')
+            return self.reduce(a.p_readln_statement, t_readln, t_lparen, variable, t_rparen)
+        if token_type == 'FOR':
+            return self.parse_for()
+        if token_type == 'IF':
+            return self.parse_if()
+        if token_type == 'WHILE':
+            t_while = self.advance()
+            condition = self.parse_expression()
+            t_do = self.expect('DO')
+            body = self.parse_statement()
+            return self.reduce(a.p_while_statement, t_while, condition, t_do, body)
+        if token_type == 'CASE':
+            return self.parse_case()
+        if token_type == 'BEGIN':
+            self.advance()
+            statements = self.parse_statements()
+            self.expect('END')
+            return statements
+        return ""
+
+    def parse_write(self, token_type):
+        writeitem = self.actions.p_writeitem_expr
+        t_write = self.advance()
+        t_lparen = self.expect('LPAREN')
+        writelist = [self.reduce(writeitem, self.parse_expression())]
+        while self.peek() == 'COMMA':
+            self.advance()
+            writelist.append(self.reduce(writeitem, self.parse_expression()))
+        t_rparen = self.expect('RPAREN')
+        if token_type == 'WRITELN':
+            return self.reduce(self.actions.p_writeln_statement, t_write, t_lparen, writelist, t_rparen)
+        return self.reduce(self.actions.p_write_statement, t_write, t_lparen, writelist, t_rparen)
+
+    def parse_for(self):
+        t_for = self.advance()
+        t_id = self.expect('ID')
+        t_assign = self.expect('ASSIGN')
+        start = self.parse_expression()
+        if self.peek() not in ('TO', 'DOWNTO'):
+            self.error()
+        t_direction = self.advance()
+        limit = self.parse_expression()
+        t_do = self.expect('DO')
+        body = self.parse_statement()
+        return self.reduce(self.actions.p_for_statement, t_for, t_id, t_assign, start,
+                           t_direction, limit, t_do, body)
+
+    # O ELSE pertence ao IF mais próximo, como no LALR (shift preferido)
+    def parse_if(self):
+        t_if = self.advance()
+        condition = self.parse_expression()
+        t_then = self.expect('THEN')
+        then_statement = self.parse_statement()
+        if self.peek() != 'ELSE':
+            return self.reduce(self.actions.p_if_statement, t_if, condition, t_then, then_statement)
+        t_else = self.advance()
+        else_statement = self.parse_statement()
+        return self.reduce(self.actions.p_if_statement, t_if, condition, t_then, then_statement,
+                           t_else, else_statement)
+
+    def parse_case(self):
+        t_case = self.advance()
+        selector = self.parse_expression()
+        t_of = self.expect('OF')
+        case_list = [self.parse_case_element()]
+        while self.peek() == 'SEMI' and self.peek_next() in case_constant_tokens:
+            self.advance()
+            case_list.append(self.parse_case_element())
+        symbols = [t_case, selector, t_of, case_list]
+        if self.peek() == 'SEMI':
+            symbols.append(self.advance())
+        if self.peek() == 'ELSE':
+            symbols.append(self.advance())
+            symbols.append(self.parse_statements())
+        symbols.append(self.expect('END'))
+        return self.reduce(self.actions.p_case_statement, *symbols)
+
+    def parse_case_element(self):
+        label_list = [self.parse_case_label()]
+        while self.peek() == 'COMMA':
+            self.advance()
+            label_list.append(self.parse_case_label())
+        self.expect('COLON')
+        return (label_list, self.parse_statement())
+
+    def parse_case_label(self):
+        low = self.parse_case_constant()
+        if self.peek() != 'DOTDOT':
+            return (low, low)
+        self.advance()
+        return (low, self.parse_case_constant())
+
+    def parse_case_constant(self):
+        token_type = self.peek()
+        if token_type == 'MINUS':
+            t_minus = self.advance()
+            return self.reduce(self.actions.p_case_constant, t_minus, self.expect('NUMBER'))
+        if token_type in case_constant_tokens:
+            return self.reduce(self.actions.p_case_constant, self.advance())
+        self.error()
+
+    # ---- Expressões (precedence climbing) ----
+
+    def parse_expression(self, min_level=1):
+        left = self.parse_primary()
+        while True:
+            operator = self.tokens[self.pos].type
+            level = binary_precedence.get(operator)
+            if level is None or level < min_level:
+                return left
+            t_operator = self.advance()
+            right = self.parse_expression(level + 1)
+            left = self.reduce(self.binary_actions[operator], left, t_operator, right)
+            # Os operadores relacionais não são associativos: 'a < b < c' é um erro
+            if level == nonassoc_level and binary_precedence.get(self.peek()) == nonassoc_level:
+                self.error()
+
+    def parse_primary(self):
+        token_type = self.peek()
+        a = self.actions
+        if token_type == 'ID':
+            t_id = self.advance()
+            if self.peek() == 'LPAREN':
+                return self.parse_function_call(t_id)
+            return self.reduce(a.p_expression_from_variable, self.parse_variable(t_id))
+        if token_type == 'NUMBER':
+            return self.reduce(a.p_expression_number, self.advance())
+        if token_type == 'STRING_LITERAL':
+            return self.reduce(a.p_expression_from_literal_string, self.advance())
+        if token_type == 'REAL':
+            return self.reduce(a.p_expression_real, self.advance())
+        if token_type == 'TRUE' or token_type == 'FALSE':
+            return self.reduce(a.p_expression_boolean, self.advance())
+        if token_type == 'MINUS':
+            # O menos unário liga mais do que qualquer operador binário
+            t_minus = self.advance()
+            return self.reduce(a.p_expression_uminus, t_minus, self.parse_primary())
+        if token_type == 'LPAREN':
+            self.advance()
+            expression = self.parse_expression()
+            self.expect('RPAREN')
+            return expression
+        if token_type == 'LBRACKET':
+            return self.parse_set_constructor()
+        self.error()
+
+    def parse_variable(self, t_id):
+        if self.peek() == 'DOT':
+            t_dot = self.advance()
+            return self.reduce(self.actions.p_variable_field, t_id, t_dot, self.expect('ID'))
+        if self.peek() != 'LBRACKET':
+            return self.reduce(self.actions.p_variable, t_id)
+        t_lbracket = self.advance()
+        index = self.parse_expression()
+        t_rbracket = self.expect('RBRACKET')
+        if self.peek() == 'DOT':
+            t_dot = self.advance()
+            return self.reduce(self.actions.p_variable_field, t_id, t_lbracket, index, t_rbracket,
+                               t_dot, self.expect('ID'))
+        return self.reduce(self.actions.p_variable, t_id, t_lbracket, index, t_rbracket)
+
+    def parse_function_call(self, t_id):
+        t_lparen = self.advance()
+        if self.peek() == 'RPAREN':
+            return self.reduce(self.actions.p_expression_function_call, t_id, t_lparen, self.advance())
+        arguments = [self.parse_expression()]
+        while self.peek() == 'COMMA':
+            self.advance()
+            arguments.append(self.parse_expression())
+        t_rparen = self.expect('RPAREN')
+        return self.reduce(self.actions.p_expression_function_call, t_id, t_lparen, arguments, t_rparen)
+
+    def parse_set_constructor(self):
+        t_lbracket = self.advance()
+        if self.peek() == 'RBRACKET':
+            return self.reduce(self.actions.p_expression_set_constructor, t_lbracket, self.advance())
+        element_list = [self.parse_set_element()]
+        while self.peek() == 'COMMA':
+            self.advance()
+            element_list.append(self.parse_set_element())
+        t_rbracket = self.expect('RBRACKET')
+        return self.reduce(self.actions.p_expression_set_constructor, t_lbracket, element_list, t_rbracket)
+
+    def parse_set_element(self):
+        low = self.parse_expression()
+        if self.peek() != 'DOTDOT':
+            return (low, None)
+        self.advance()
+        return (low, self.parse_expression())
+
+# ====== Comparação e medição dos dois motores ======
+
+# Motor que alimenta o parser com tokens já produzidos, para medir só o parsing
+class PretokenizedEngine:
+    def __init__(self, engine, tokens):
+        self.engine = engine
+        self.tokens = tokens
+
+    def parse(self, source=None, lexer=None):
+        if isinstance(self.engine, RecursiveDescentParser):
+            return self.engine.parse(tokens=self.tokens)
+        token_iter = iter(self.tokens)
+        return self.engine.parse(tokenfunc=lambda: next(token_iter, None))
+
+# Compila 'source' com o motor indicado; devolve (código, linhas do mapa de fonte, sucesso)
+def compile_with(compiler, engine, source):
+    import io
+    compiler.parser_engine = engine
+    stream = io.StringIO()
+    result, writer = compiler.compile_program(source, stream, source_map=True)
+    ok = compiler.parser_success and result is not None
+    return stream.getvalue(), writer.instruction_lines, ok
+
+def main(argv=None):
+    import argparse
+    import contextlib
+    import io
+    import os
+    arg_parser = argparse.ArgumentParser(description="Parser descendente recursivo: comparação e medição face ao PLY.")
+    arg_parser.add_argument('files', nargs='*', help="programas Pascal (por defeito inputs/*.txt)")
+    arg_parser.add_argument('--diff', action='store_true',
+                            help="verifica que o código gerado pelos dois motores é idêntico")
+    arg_parser.add_argument('--bench', action='store_true', help="mede o tempo de compilação de cada motor")
+    arg_parser.add_argument('--repeat', type=int, default=20)
+    args = arg_parser.parse_args(argv)
+
+    # Importar pascal_gt constrói as tabelas do PLY; as mensagens de aviso vão para stderr
+    import pascal_gt
+    rd_engine = RecursiveDescentParser(pascal_gt)
+    files = args.files
+    if not files:
+        files = sorted(os.path.join('inputs', name) for name in os.listdir('inputs'))
+    sources = {}
+    for filename in files:
+        with open(filename, 'r', encoding='utf-8') as f:
+            sources[filename] = f.read()
+
+    failures = 0
+    if args.diff or not args.bench:
+        for filename, source in sources.items():
+            pascal_gt.parser_unit_paths = [os.path.dirname(filename) or '.', '.']
+            with contextlib.redirect_stdout(io.StringIO()) as ply_messages:
+                ply_result = compile_with(pascal_gt, pascal_gt.parser, source)
+            with contextlib.redirect_stdout(io.StringIO()) as rd_messages:
+                rd_result = compile_with(pascal_gt, rd_engine, source)
+            if ply_result == rd_result and ply_messages.getvalue() == rd_messages.getvalue():
+                print(f"{filename}: idêntico ({len(ply_result[0].splitlines())} linhas)")
+            else:
+                failures += 1
+                print(f"{filename}: DIFERENTE")
+                if ply_messages.getvalue() != rd_messages.getvalue():
+                    print(f"  PLY: {ply_messages.getvalue().strip()}")
+                    print(f"  RD:  {rd_messages.getvalue().strip()}")
+    if args.bench:
+        # O lexer é partilhado pelos dois motores: mede-se a compilação completa e,
+        # à parte, a compilação a partir de tokens já produzidos (parsing + acções)
+        token_lists = {}
+        for filename, source in sources.items():
+            pascal_gt.pascal_lex.lexer.input(source)
+            token_lists[filename] = list(iter(pascal_gt.pascal_lex.lexer.token, None))
+        timings = {}
+        for name, engine in (('ply', pascal_gt.parser), ('rd', rd_engine)):
+            for mode in ('completo', 'sem lexer'):
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    for _ in range(args.repeat):
+                        for filename, source in sources.items():
+                            pascal_gt.parser_unit_paths = [os.path.dirname(filename) or '.', '.']
+                            if mode == 'completo':
+                                compile_with(pascal_gt, engine, source)
+                            else:
+                                compile_with(pascal_gt, PretokenizedEngine(engine, token_lists[filename]), source)
+                timings[name, mode] = time.perf_counter() - start
+        count = args.repeat * len(sources)
+        for mode in ('completo', 'sem lexer'):
+            ply_time, rd_time = timings['ply', mode], timings['rd', mode]
+            print(f"{mode}: ply {ply_time / count * 1000:.2f} ms, rd {rd_time / count * 1000:.2f} ms "
+                  f"por ficheiro ({ply_time / rd_time:.2f}x)")
+    pascal_gt.parser_engine = pascal_gt.parser
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
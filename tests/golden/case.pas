@@ -0,0 +1,50 @@
+program Dias;
+var
+    d, i: integer;
+    s: string;
+
+function Peso(n: integer): integer;
+var
+    base: integer;
+begin
+    base := n * 10;
+    case n of
+        0: Peso := base;
+        1: Peso := base + 1;
+        2: Peso := base + 2;
+        3: Peso := base + 3;
+        4: Peso := base + 4
+    else
+        Peso := 0 - 1
+    end
+end;
+
+begin
+    for i := 0 to 6 do
+        write(Peso(i), ' ');
+    writeln('');
+    for i := 0 to 9 do
+    begin
+        case i of
+            1: writeln('um');
+            2, 3: writeln('dois ou tres');
+            4..6: writeln('quatro a seis');
+            7: begin writeln('sete'); writeln('!') end
+        else
+            writeln('outro ', i)
+        end
+    end;
+    for i := 0 to 12 do
+        case i * 100 of
+            100: writeln('cem');
+            500..599: write('quinhentos ');
+            1000: writeln('mil')
+        end;
+    writeln('');
+    s := 'a1z';
+    for i := 1 to 3 do
+        case s[i] of
+            'a': writeln('letra a');
+            '1': writeln('digito 1');
+        end
+end.
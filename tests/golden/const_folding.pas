@@ -0,0 +1,17 @@
+program ConstFolding;
+const
+  N = 17;
+  HALF = N div 2;
+  REST = N mod 5;
+  NEG = -N;
+  BACK = -(-3) * 2;
+  NMOD = -7 mod 2;
+  NDIV = -7 div 2;
+var a: array[1..HALF] of integer;
+    x: integer;
+begin
+  x := 5;
+  a[HALF] := -x * 2;
+  writeln(HALF, ' ', REST, ' ', NEG, ' ', BACK, ' ', NMOD, ' ', NDIV);
+  writeln(a[8], ' ', -2.5, ' ', - - x, ' ', 3 - -x)
+end.
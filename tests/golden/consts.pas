@@ -0,0 +1,38 @@
+program Consts;
+const
+  N = 10;
+  M = N * 2 + 1;
+  LETTER = 'b';
+  GREETING = 'ola';
+  FLAG = true;
+  HALF = 2.5;
+  NEG = 0 - 3;
+var
+  a: array[1..M] of integer;
+  s: set of 0..N;
+  i, t: integer;
+function scale(x: integer): integer;
+const
+  K = 3;
+begin
+  scale := x * K + N
+end;
+begin
+  for i := 1 to M do
+    a[i] := i * N;
+  t := 0;
+  for i := 1 to M do
+    t := t + a[i];
+  writeln(t, ' ', M, ' ', NEG, ' ', HALF);
+  writeln(GREETING, ' ', FLAG, ' ', scale(N));
+  s := [1, N];
+  if N in s then writeln('in');
+  case 2 * 5 of
+    N: writeln('dez');
+    M: writeln('vinte e um')
+  end;
+  case GREETING[1] of
+    LETTER: writeln('letra b');
+    'o': writeln('letra o')
+  end
+end.
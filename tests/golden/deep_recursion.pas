@@ -0,0 +1,13 @@
+program Deep;
+var n: integer;
+function soma(k: integer): integer;
+begin
+  if k = 0 then
+    soma := 0
+  else
+    soma := k + soma(k - 1)
+end;
+begin
+  readln(n);
+  writeln(soma(n))
+end.
@@ -0,0 +1,7 @@
+program DivZ;
+var a, b: integer;
+begin
+  a := 1; b := 0;
+  writeln('antes');
+  writeln(a div b)
+end.
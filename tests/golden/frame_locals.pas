@@ -0,0 +1,31 @@
+program R3;
+var r: integer;
+function fib(n: integer): integer;
+var
+  a, b: integer;
+begin
+  if n < 2 then
+    fib := n
+  else
+  begin
+    a := fib(n - 1);
+    b := fib(n - 2);
+    fib := a + b
+  end
+end;
+function loop(n: integer; acc: integer): integer;
+var
+  t, i: integer;
+begin
+  t := 0;
+  for i := 1 to n do
+    t := t + i;
+  if n = 0 then
+    loop := acc
+  else
+    loop := loop(n - 1, acc + t)
+end;
+begin
+  readln(r);
+  writeln(fib(15), fib(r), ' ', loop(r * 10, 0))
+end.
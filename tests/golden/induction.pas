@@ -0,0 +1,24 @@
+program Inducao;
+var
+    a: array[1..10] of integer;
+    b: array[0..10] of integer;
+    i, soma, n: integer;
+begin
+    n := 10;
+    for i := 1 to n do
+        a[i] := i * i;
+    soma := 0;
+    for i := 1 to n do
+        soma := soma + a[i];
+    writeln(soma);
+    for i := 2 to n do
+        b[i] := a[i] - a[i - 1];
+    for i := n downto 2 do
+        writeln(i, ' ', b[i], ' ', a[i - 1]);
+    for i := 1 to n do
+    begin
+        readln(a[i]);
+        soma := soma + a[i];
+    end;
+    writeln(soma);
+end.
@@ -0,0 +1,22 @@
+program SU;
+var a, b, c, d, e: integer; ok: boolean; arr: array[1..5] of integer;
+begin
+  a := 1; b := 2; c := 3; d := 4; e := 5;
+  arr[1] := 10; arr[2] := 20; arr[3] := 30;
+  writeln(a + b * (c + d * (e + a * (b + c))));
+  writeln(a + (b + (c + (d + e))));
+  writeln(a * (b * (c * (d * e))));
+  ok := a < b + c * d;
+  writeln(ok);
+  ok := a >= b + c * d;
+  writeln(ok);
+  ok := a <> b + c;
+  writeln(ok);
+  ok := 1.5 < a + b * c;
+  writeln(ok);
+  writeln(1.5 + a * (b + c));
+  writeln(a - b * (c + d));
+  writeln(arr[1] + arr[a + 1] * arr[b + 1]);
+  ok := (a = 1) and ((b = 2) or (c = d + e));
+  writeln(ok);
+end.
@@ -0,0 +1,54 @@
+program Puras;
+var
+    x, r: integer;
+
+function Fact(n: integer): integer;
+begin
+    if n <= 1 then
+        Fact := 1
+    else
+        Fact := n * Fact(n - 1);
+end;
+
+function Potencia(b: integer; e: integer): integer;
+var
+    i, acc: integer;
+begin
+    acc := 1;
+    for i := 1 to e do
+        acc := acc * b;
+    Potencia := acc;
+end;
+
+function Comb(n: integer; k: integer): integer;
+begin
+    Comb := Fact(n) div (Fact(k) * Fact(n - k));
+end;
+
+function Par(n: integer): boolean;
+begin
+    Par := n mod 2 = 0;
+end;
+
+function LeX(n: integer): integer;
+begin
+    LeX := x + n;
+end;
+
+function Lento(n: integer): integer;
+var
+    j, s: integer;
+begin
+    s := 0;
+    for j := 1 to n do
+        s := s + j;
+    Lento := s;
+end;
+
+begin
+    x := 5;
+    r := Fact(10);
+    writeln(r, ' ', Potencia(2, 20), ' ', Comb(10, 3), ' ', Fact(Fact(3)));
+    writeln(LeX(1), ' ', Fact(x), ' ', Lento(10), ' ', Lento(100000));
+    if Par(Fact(4)) then writeln('par');
+end.
@@ -0,0 +1,26 @@
+program Records;
+var
+  pts: array[1..100] of record x, y: integer; alive: boolean end;
+  origin: record x: integer; y: integer end;
+  i, sum, n: integer;
+begin
+  origin.x := 3;
+  origin.y := 4;
+  for i := 1 to 100 do
+  begin
+    pts[i].x := i + origin.x;
+    pts[i].y := i * origin.y;
+    pts[i].alive := (i mod 3) = 0
+  end;
+  sum := 0;
+  n := 0;
+  for i := 1 to 100 do
+    if pts[i].alive then
+    begin
+      sum := sum + pts[i].x + pts[i].y;
+      n := n + 1
+    end;
+  readln(pts[5].x);
+  writeln(sum, ' ', n, ' ', pts[5].x + origin.y);
+  writeln(pts[100].y, ' ', pts[1].x)
+end.
@@ -0,0 +1,32 @@
+program Sets;
+var s, t, u: set of 0..15;
+    i, n, c: integer;
+    b: boolean;
+begin
+  s := [1, 3, 5..8];
+  t := [2..4];
+  u := s + t;
+  c := 0;
+  for i := 0 to 15 do
+    if i in u then c := c + 1;
+  writeln('count ', c);
+  u := s * t;
+  for i := 0 to 15 do
+    if i in u then writeln('inter ', i);
+  u := s - [5];
+  n := 7;
+  u := u + [n];
+  u := u - [1];
+  for i := 0 to 15 do
+    if i in u then write(i, ' ');
+  writeln('');
+  b := 20 in u;
+  writeln(b);
+  n := 3;
+  if n in [1, 3, 9, 11, 13] then writeln('odd set');
+  if n in [0..5] then writeln('range');
+  if u = [3, 6, 7, 8] then writeln('eq');
+  if u <> s then writeln('neq');
+  t := [];
+  if t = [] then writeln('empty')
+end.
@@ -0,0 +1,22 @@
+program Pool;
+var
+  i, n: integer;
+  s: string;
+function show(x: integer): integer;
+begin
+  writeln('valor: ', x);
+  show := x
+end;
+begin
+  writeln('inicio');
+  n := 0;
+  for i := 1 to 3000 do
+  begin
+    write('linha ');
+    s := 'abc';
+    if i mod 1000 = 0 then
+      n := n + show(i)
+  end;
+  writeln('valor: ', n);
+  writeln(s, ' fim')
+end.
@@ -0,0 +1,43 @@
+program Cauda;
+var
+    r: integer;
+
+function SomaAte(n: integer; acc: integer): integer;
+begin
+    if n = 0 then
+        SomaAte := acc
+    else
+        SomaAte := SomaAte(n - 1, acc + n);
+end;
+
+function Mdc(a: integer; b: integer): integer;
+begin
+    if b = 0 then
+        Mdc := a
+    else
+        Mdc := Mdc(b, a mod b);
+end;
+
+function Fact(n: integer): integer;
+begin
+    if n <= 1 then
+        Fact := 1
+    else
+        Fact := n * Fact(n - 1);
+end;
+
+function Conta(n: integer): integer;
+begin
+    Conta := 0;
+    if n > 0 then
+        Conta := Conta(n - 1);
+    writeln('x');
+end;
+
+begin
+    r := SomaAte(100000, 0);
+    writeln(r);
+    writeln(Mdc(1071, 462));
+    writeln(Fact(10));
+    writeln(Conta(2));
+end.
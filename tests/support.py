@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+
+# Utilitários dos testes de ponta a ponta: compilam fontes Pascal com pascal_gt.py e
+# correm o código EWVM gerado com ewvm.py, cada um no seu processo (o compilador usa
+# estado global).
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def run_tool(args, stdin=""):
+    return subprocess.run([sys.executable, *args], input=stdin, capture_output=True,
+                          text=True, cwd=ROOT, timeout=120)
+
+# Compila um ficheiro Pascal; devolve a saída do compilador
+def compile_file(source_file, output_file, level=1, *options):
+    result = run_tool(["pascal_gt.py", str(source_file), "-O", str(level), "-o", str(output_file), *options])
+    return result.stdout
+
+# Compila 'source' (texto Pascal) e devolve (saída do compilador, ficheiro EWVM)
+def compile_source(tmp_path, source, level=1, name="prog"):
+    source_file = tmp_path / f"{name}.pas"
+    source_file.write_text(source, encoding='utf-8')
+    output_file = tmp_path / f"{name}.ewvm"
+    return compile_file(source_file, output_file, level), output_file
+
+def run_program(program_file, stdin="", *options):
+    result = run_tool(["ewvm.py", str(program_file), *options], stdin)
+    assert result.returncode == 0, result.stdout + result.stderr
+    return result.stdout
+
+def assert_clean(compiler_output):
+    assert "Parsing completado com sucesso!" in compiler_output, compiler_output
+    assert "Aviso:" not in compiler_output, compiler_output
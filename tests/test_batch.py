@@ -0,0 +1,30 @@
+import pytest
+
+from support import assert_clean, compile_source, run_program, run_tool
+
+# Termina para n >= 0 e fica em ciclo infinito para n negativo
+LOOP_UNLESS_POSITIVE = """program Loop;
+var n, k: integer;
+begin
+  readln(n);
+  k := 0;
+  while n <> k do
+    k := k + 1;
+  writeln(k)
+end.
+"""
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_timeout_marks_hanging_case_as_failure(tmp_path, jobs):
+    compiler_output, program = compile_source(tmp_path, LOOP_UNLESS_POSITIVE)
+    assert_clean(compiler_output)
+    cases = tmp_path / "cases"
+    cases.mkdir()
+    (cases / "ok.in").write_text("3\n", encoding='utf-8')
+    (cases / "ok.out").write_text(run_program(program, "3\n"), encoding='utf-8')
+    (cases / "hang.in").write_text("-1\n", encoding='utf-8')
+    result = run_tool(["ewvm_batch.py", str(program), str(cases), "-j", jobs, "--timeout", "0.5"])
+    assert result.returncode == 1
+    assert "FALHOU hang" in result.stdout
+    assert "tempo limite de 0.5 s excedido" in result.stdout
+    assert "passaram 1, falharam 1" in result.stdout
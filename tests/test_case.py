@@ -0,0 +1,77 @@
+import pytest
+
+from support import assert_clean, compile_source, run_program, run_tool
+
+CASE_IN_FUNCTION = """program CaseFn;
+var r: integer;
+function f(n: integer): integer;
+var t: integer;
+begin
+  t := n * 2;
+  case n of
+    1: t := t + 10;
+    2, 3: t := t + 20;
+    5..7: t := t + 50
+  else
+    t := t - 1
+  end;
+  f := t
+end;
+begin
+  for r := 0 to 8 do
+    writeln(f(r))
+end.
+"""
+
+@pytest.mark.parametrize("level", [0, 1, 2])
+def test_case_with_else_in_function_with_locals(tmp_path, level):
+    compiler_output, program = compile_source(tmp_path, CASE_IN_FUNCTION, level)
+    assert_clean(compiler_output)
+    lines = [line for line in program.read_text(encoding='utf-8').splitlines() if line.startswith("//stack")]
+    assert len(lines) == 6  # programa principal, função 'f' e os seus quatro ramos
+    assert run_program(program).split() == ["-1", "12", "24", "26", "7", "60", "62", "64", "15"]
+
+# CASE densos (tabela de saltos) numa função recursiva, um deles dentro de um ramo:
+# os ramos correm uma moldura acima e o selector fica numa posição da moldura
+CASE_TABLE_RECURSIVE = """program CaseRec;
+var i: integer;
+function g(n: integer): integer;
+var t, u: integer;
+begin
+  u := n * 3;
+  case n mod 5 of
+    0: t := n;
+    1: t := g(n - 1) + u;
+    2, 3: begin
+         t := g(n - 1);
+         case t mod 4 of
+           0: t := t + 1;
+           1: t := t + 2;
+           2: t := t + u;
+           3: g := 0
+         end
+       end
+  else
+    t := g(n - 1) - 1
+  end;
+  g := t + u
+end;
+begin
+  for i := 0 to 12 do
+    writeln(g(i))
+end.
+"""
+
+@pytest.mark.parametrize("level", [0, 1, 2])
+def test_case_jump_table_in_recursive_function(tmp_path, level):
+    compiler_output, program = compile_source(tmp_path, CASE_TABLE_RECURSIVE, level)
+    assert_clean(compiler_output)
+    code = program.read_text(encoding='utf-8')
+    function_code = code[code.index("\ng:\n"):]
+    assert function_code.count("loadn\ncall\n") == 2
+    assert "storeg" not in function_code
+    expected = ["0", "6", "18", "36", "47", "20", "56", "78", "126", "152", "40", "106", "178"]
+    assert run_program(program).split() == expected
+    translated = run_tool(["ewvm.py", str(program), "--backend", "py"])
+    assert translated.returncode == 0 and translated.stderr == ""
+    assert translated.stdout.split() == expected
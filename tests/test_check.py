@@ -0,0 +1,62 @@
+import io
+import sys
+
+from support import ROOT, run_tool
+
+# --check verifica vários fontes de seguida: cada erro sai com o nome do ficheiro,
+# um fonte com erros não impede a verificação dos seguintes e o código de saída é 1
+SOURCES = {
+    'ok.pas': """program Ok;
+var x: integer;
+begin
+  x := 1;
+  writeln(x)
+end.
+""",
+    'syntax.pas': """program Syntax;
+var x: integer;
+begin
+  x := ;
+  writeln(x);
+  x := 2 +
+end.
+""",
+    'semantic.pas': """program Semantic;
+var x: integer;
+begin
+  y := 1;
+  writeln(x)
+end.
+""",
+}
+
+def write_sources(tmp_path):
+    filenames = []
+    for name, source in SOURCES.items():
+        (tmp_path / name).write_text(source, encoding='utf-8')
+        filenames.append(str(tmp_path / name))
+    return filenames
+
+def test_check_reports_every_error(tmp_path):
+    result = run_tool(["pascal_gt.py", "--check", *write_sources(tmp_path)])
+    assert result.returncode == 1, result.stdout
+    lines = result.stdout.splitlines()
+    assert not any("ok.pas" in line for line in lines)
+    syntax_errors = [line for line in lines if "syntax.pas: Erro de sintaxe" in line]
+    assert len(syntax_errors) == 2, result.stdout
+    assert any("semantic.pas: Erro: Variável 'y' não declarada." in line for line in lines)
+    assert "Verificados 3 ficheiro(s)" in lines[-1] and lines[-1].endswith("2 com erros.")
+
+def test_check_restores_code_generation(tmp_path):
+    sys.path.insert(0, ROOT)
+    try:
+        import pascal_gt
+    finally:
+        sys.path.remove(ROOT)
+    assert pascal_gt.check_sources(write_sources(tmp_path), [], out=io.StringIO()) == 2
+    assert not pascal_gt.parser_check_only
+
+def test_check_rejects_recursive_descent(tmp_path):
+    result = run_tool(["pascal_gt.py", "--check", "--parser", "rd", *write_sources(tmp_path)])
+    assert result.returncode == 2
+    assert "--check não suporta --parser rd" in result.stderr
@@ -0,0 +1,24 @@
+from support import compile_source, run_program
+
+# As constantes são dobradas em tempo de compilação com 'div', 'mod' e menos unário;
+# um divisor zero é um erro da declaração (e não um erro de execução mais tarde)
+
+def test_const_division_by_zero_is_rejected(tmp_path):
+    source = "program Z;\nconst\n  A = 3 div 0;\n  B = 1 mod (2 - 2);\n  C = -4 div 2;\nbegin\n  writeln(C)\nend.\n"
+    compiler_output, _ = compile_source(tmp_path, source)
+    assert "Erro: Divisão por zero no valor da constante 'A'." in compiler_output
+    assert "Erro: Divisão por zero no valor da constante 'B'." in compiler_output
+    assert "'C'" not in compiler_output
+
+def test_const_folds_to_single_push(tmp_path):
+    source = "program F;\nconst\n  N = 17;\n  K = -(N div 2) mod 3;\nbegin\n  writeln(K)\nend.\n"
+    compiler_output, program = compile_source(tmp_path, source, 0)
+    assert "Parsing completado com sucesso!" in compiler_output
+    code = program.read_text(encoding='utf-8')
+    assert "div" not in code and "mod" not in code
+    assert run_program(program) == "-2\n"
+
+def test_unary_minus_requires_number(tmp_path):
+    source = "program U;\nbegin\n  writeln(-'a')\nend.\n"
+    compiler_output, _ = compile_source(tmp_path, source)
+    assert "Erro: Menos unário requer um valor numérico, mas foi string." in compiler_output
@@ -0,0 +1,7 @@
+from support import compile_source
+
+def test_no_stack_warnings_after_errors(tmp_path):
+    source = "program E;\nvar a: integer;\nbegin\n  a := 1;\n  writeln(b + );\n  writeln(c)\nend.\n"
+    compiler_output, _ = compile_source(tmp_path, source)
+    assert "Parsing falhou!" in compiler_output
+    assert "Aviso: Pilha desequilibrada" not in compiler_output
@@ -0,0 +1,81 @@
+from support import assert_clean, compile_source, run_program
+
+# Convenção de chamada: o chamador reserva o resultado, empilha os argumentos, chama e
+# retira-os com 'pop n'; na função, o parâmetro i de n está em fp-(n-i) e o resultado
+# em fp-(n+1). As assinaturas ficam registadas antes do corpo (recursão).
+
+CALLS = """program Calls;
+var i: integer;
+function fact(n: integer): integer;
+begin
+  if n <= 1 then fact := 1
+  else fact := n * fact(n - 1)
+end;
+function digits(a: integer; b: integer; c: integer): integer;
+begin
+  digits := a * 100 + b * 10 + c
+end;
+function seven: integer;
+begin
+  seven := 7
+end;
+begin
+  writeln(fact(6));
+  writeln(digits(1, 2, 3));
+  writeln(digits(seven(), fact(3), digits(0, 0, 4)));
+  for i := 1 to 3 do
+    writeln(digits(i, seven(), i) + fact(i))
+end.
+"""
+
+def test_calls_pass_arguments_and_result_through_the_frame(tmp_path):
+    compiler_output, program = compile_source(tmp_path, CALLS)
+    assert_clean(compiler_output)
+    code = [line.strip() for line in program.read_text(encoding='utf-8').splitlines()]
+    calls = [index for index, line in enumerate(code) if line == "pusha digits"]
+    assert calls and all(code[index + 1:index + 3] == ["call", "pop 3"] for index in calls)
+    expected = ["720", "123", "764", "172", "274", "379"]
+    assert run_program(program).split() == expected
+    assert run_program(program, "", "--backend", "py").split() == expected
+
+def test_argument_count_is_checked(tmp_path):
+    source = CALLS.replace("digits(1, 2, 3)", "digits(1, 2)")
+    compiler_output, _ = compile_source(tmp_path, source)
+    assert "Erro: Função 'digits' espera 3 argumento(s), mas recebeu 2." in compiler_output
+    assert "Parsing falhou!" in compiler_output
+
+def test_parameter_cannot_be_loop_variable(tmp_path):
+    source = "program P;\nfunction f(n: integer): integer;\nbegin\n  for n := 1 to 2 do\n    f := n\nend;\nbegin\n  writeln(f(1))\nend.\n"
+    compiler_output, _ = compile_source(tmp_path, source)
+    assert "Erro: Parâmetro 'n' não pode ser variável de ciclo." in compiler_output
+
+STRING_PARAMETER_INDEX = """program StrParam;
+var s: string;
+function first(t: string; k: integer): integer;
+begin
+  first := t[k]
+end;
+function count(t: string; c: integer): integer;
+var i, n: integer;
+begin
+  n := 0;
+  for i := 1 to length(t) do
+    if t[i] = c then n := n + 1;
+  count := n
+end;
+begin
+  s := 'banana';
+  writeln(first(s, 2));
+  writeln(count(s, s[2]))
+end.
+"""
+
+def test_string_parameter_can_be_indexed(tmp_path):
+    compiler_output, program = compile_source(tmp_path, STRING_PARAMETER_INDEX)
+    assert_clean(compiler_output)
+    assert run_program(program).split() == ["97", "3"]
+
+def test_integer_parameter_cannot_be_indexed(tmp_path):
+    source = "program P;\nfunction f(n: integer): integer;\nbegin\n  f := n[1]\nend;\nbegin\n  writeln(f(1))\nend.\n"
+    compiler_output, _ = compile_source(tmp_path, source)
+    assert "não pode ser indexada" in compiler_output
@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+from support import ROOT, assert_clean, compile_file, run_tool
+
+# Saídas de referência: cada programa de tests/golden (e cada inputs/<nome>.txt com
+# um tests/golden/<nome>.out) é compilado em -O0/-O1/-O2 sem avisos e corrido com
+# stdin <nome>.in; a saída tem de ser igual a <nome>.out no interpretador (com e sem
+# superinstruções, pilha genérica e de inteiros) e na tradução para Python. Se existir
+# <nome>.error, o programa tem de terminar com 'Erro de execução' contendo esse texto,
+# depois de escrever <nome>.out.
+
+GOLDEN = os.path.join(ROOT, 'tests', 'golden')
+
+def golden_programs():
+    programs = []
+    for filename in sorted(os.listdir(GOLDEN)):
+        name, extension = os.path.splitext(filename)
+        if extension != '.out':
+            continue
+        source = os.path.join(GOLDEN, name + '.pas')
+        if not os.path.exists(source):
+            source = os.path.join(ROOT, 'inputs', name + '.txt')
+        programs.append(pytest.param(name, source, id=name))
+    return programs
+
+def read_golden(name, extension):
+    filename = os.path.join(GOLDEN, name + extension)
+    if not os.path.exists(filename):
+        return ""
+    with open(filename, 'r', encoding='utf-8') as f:
+        return f.read()
+
+# Corre o programa e compara com a saída (e o erro) de referência
+def assert_golden_run(program, stdin, expected, error, *options):
+    result = run_tool(["ewvm.py", str(program), *options], stdin)
+    if not error:
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert result.stdout == expected
+        return
+    assert result.returncode == 1, result.stdout + result.stderr
+    output, _, last_line = result.stdout.rstrip("\n").rpartition("\n")
+    assert last_line.startswith("Erro de execução:") and error in last_line, result.stdout
+    assert output + "\n" == expected
+
+@pytest.mark.parametrize("level", [0, 1, 2])
+@pytest.mark.parametrize("name, source", golden_programs())
+def test_golden_output(tmp_path, name, source, level):
+    program = tmp_path / f"{name}.ewvm"
+    assert_clean(compile_file(source, program, level))
+    stdin, expected = read_golden(name, '.in'), read_golden(name, '.out')
+    error = read_golden(name, '.error').strip()
+    assert_golden_run(program, stdin, expected, error)
+    assert_golden_run(program, stdin, expected, error, "--backend", "py")
+    if level == 1:
+        assert_golden_run(program, stdin, expected, error, "--no-fuse")
+        assert_golden_run(program, stdin, expected, error, "--stack", "int")
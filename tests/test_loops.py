@@ -0,0 +1,73 @@
+import re
+
+import pytest
+
+from support import ROOT, assert_clean, compile_file, compile_source, run_program, run_tool
+
+# O while é rodado: a condição é testada uma vez por iteração, no fim do corpo, por um
+# único salto condicional de volta ao início (sem 'not' nem 'jump')
+
+def loop_block(program):
+    lines = [line.strip() for line in program.read_text(encoding='utf-8').splitlines()]
+    lines = [line for line in lines if line and not line.startswith('//')]
+    start = next(i for i, line in enumerate(lines) if re.fullmatch(r"whilestart\d+:", line))
+    label = lines[start][:-1]
+    end = lines.index(f"jz {label}", start)
+    return lines[start + 1:end + 1]
+
+def executed_instructions(program, stdin):
+    result = run_tool(["ewvm.py", str(program), "--stats"], stdin)
+    assert result.returncode == 0, result.stdout + result.stderr
+    return int(re.search(r"Instruções executadas: (\d+)", result.stderr).group(1))
+
+WHILE_AND = """program WhileAnd;
+var i, n: integer;
+    ok: boolean;
+begin
+  readln(n);
+  i := 0;
+  ok := true;
+  while (i < n) and ok do
+    i := i + 1;
+  writeln(i)
+end.
+"""
+
+@pytest.mark.parametrize("level", [0, 1, 2])
+def test_rotated_while_tests_condition_once(tmp_path, level):
+    program = tmp_path / "prog.ewvm"
+    source = tmp_path / "prog.pas"
+    source.write_text(WHILE_AND, encoding='utf-8')
+    assert_clean(compile_file(source, program, level))
+    block = loop_block(program)
+    assert not any(line.split()[0].lower() in ('not', 'jump', 'jz') for line in block[:-1]), block
+    assert run_program(program, "25\n") == "25\n"
+    per_iteration = (executed_instructions(program, "30\n") - executed_instructions(program, "20\n")) // 10
+    assert per_iteration == len(block)
+
+@pytest.mark.parametrize("level", [0, 1, 2])
+def test_prime_loop_back_edge_has_no_not(tmp_path, level):
+    program = tmp_path / "input4.ewvm"
+    assert_clean(compile_file(ROOT + "/inputs/input4.txt", program, level))
+    block = loop_block(program)
+    assert block[-2].lower() != 'not', block
+    assert not any(line.split()[0].lower() in ('not', 'jump') for line in block), block
+    assert run_program(program, "97\n") == run_program(program, "97\n", "--backend", "py")
+
+# Com operandos inteiros, AND/OR não dão 0/1 garantido; a negação mantém o 'not'
+WHILE_INTEGER_AND = """program WhileIntAnd;
+var i, m: integer;
+begin
+  i := 0;
+  m := 2;
+  while (i < 5) and m do
+    i := i + 1;
+  writeln(i)
+end.
+"""
+
+def test_integer_operands_keep_not(tmp_path):
+    compiler_output, program = compile_source(tmp_path, WHILE_INTEGER_AND)
+    assert_clean(compiler_output)
+    assert loop_block(program)[-2].lower() == 'not'
+    assert run_program(program) == "5\n"
@@ -0,0 +1,73 @@
+import pytest
+
+from support import assert_clean, compile_source, run_program
+
+PACKED_WORD_BOUNDARY = """program Flags;
+var flags: packed array[0..99] of boolean;
+    i, n: integer;
+begin
+  for i := 0 to 99 do
+    flags[i] := (i mod 3) = 0;
+  flags[30] := true;
+  flags[31] := false;
+  n := 0;
+  for i := 0 to 99 do
+    if flags[i] then n := n + 1;
+  writeln(n)
+end.
+"""
+
+def test_packed_words_fit_signed_32_bit_integers(tmp_path):
+    compiler_output, program = compile_source(tmp_path, PACKED_WORD_BOUNDARY)
+    assert_clean(compiler_output)
+    pushed = [int(line.split()[1]) for line in program.read_text(encoding='utf-8').splitlines()
+              if line.startswith("pushi ")]
+    assert max(pushed) < 2 ** 31
+    assert run_program(program).split() == ["34"]
+
+# A escrita de um elemento avalia o valor antes de ler a palavra: uma chamada no
+# valor que altera o mesmo array não pode ser desfeita pela escrita
+SET_NEXT = """program SetNext;
+var flags: packed array[0..9] of boolean;
+function setnext(k: integer): boolean;
+begin
+  flags[k + 1] := true;
+  setnext := true
+end;
+begin
+  flags[0] := setnext(0);
+  writeln(flags[0], ' ', flags[1])
+end.
+"""
+
+def test_store_value_calls_function_writing_same_array(tmp_path):
+    compiler_output, program = compile_source(tmp_path, SET_NEXT)
+    assert_clean(compiler_output)
+    assert run_program(program).split() == ["1", "1"]
+
+RECURSIVE_MARK = """program Mark;
+var flags: {kind}array[0..5] of boolean;
+    i: integer;
+function mark(k: integer): boolean;
+begin
+  if k = 0 then
+    mark := true
+  else
+  begin
+    flags[k] := mark(k - 1);
+    mark := false
+  end
+end;
+begin
+  flags[0] := mark(5);
+  for i := 0 to 5 do
+    write(flags[i], ' ');
+  writeln('')
+end.
+"""
+
+@pytest.mark.parametrize("kind", ["packed ", ""])
+def test_recursive_store_matches_unpacked_array(tmp_path, kind):
+    compiler_output, program = compile_source(tmp_path, RECURSIVE_MARK.replace("{kind}", kind))
+    assert_clean(compiler_output)
+    assert run_program(program).split() == ["0", "1", "0", "0", "0", "0"]
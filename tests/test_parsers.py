@@ -0,0 +1,23 @@
+import os
+
+import pytest
+
+from support import ROOT, run_tool
+
+# O parser descendente recursivo (pascal_rd.py) tem de gerar exactamente o mesmo
+# código, mapa de fonte e mensagens que o LALR do PLY
+
+INPUTS = sorted(os.path.join('inputs', name) for name in os.listdir(os.path.join(ROOT, 'inputs')))
+GOLDEN_SOURCES = sorted(os.path.join('tests', 'golden', name)
+                        for name in os.listdir(os.path.join(ROOT, 'tests', 'golden')) if name.endswith('.pas'))
+
+def assert_identical(*files):
+    result = run_tool(["pascal_rd.py", "--diff", *map(str, files)])
+    assert result.returncode == 0, result.stdout + result.stderr
+    lines = result.stdout.splitlines()
+    assert len(lines) == len(files)
+    assert all(": idêntico" in line for line in lines), result.stdout
+
+@pytest.mark.parametrize("filename", INPUTS + GOLDEN_SOURCES)
+def test_rd_matches_ply_on_files(filename):
+    assert_identical(filename)
@@ -0,0 +1,70 @@
+import re
+
+import pytest
+
+from support import assert_clean, compile_file, run_tool
+from test_golden import assert_golden_run, golden_programs, read_golden
+
+# Gestor de passagens: em -O2 com --verify-passes o grafo de fluxo é verificado depois
+# de cada passagem, e --pass-stats mostra as execuções e as instruções retiradas
+
+def pass_stats(compiler_output):
+    stats = {}
+    for match in re.finditer(r"^  (\w+)\s+(\d+)\s+[\d.]+\s+(-?\d+)$", compiler_output, re.MULTILINE):
+        stats[match.group(1)] = (int(match.group(2)), int(match.group(3)))
+    return stats
+
+@pytest.mark.parametrize("name, source", golden_programs())
+def test_golden_programs_verify_at_o2(tmp_path, name, source):
+    program = tmp_path / f"{name}.ewvm"
+    compiler_output = compile_file(source, program, 2, "--verify-passes", "--pass-stats")
+    assert_clean(compiler_output)
+    assert "Erro interno na optimização" not in compiler_output
+    assert "Optimização -O2" in compiler_output
+    assert list(pass_stats(compiler_output)) == ['fold', 'ivsr', 'cse', 'jumps', 'unreachable']
+    stdin, expected = read_golden(name, '.in'), read_golden(name, '.out')
+    assert_golden_run(program, stdin, expected, read_golden(name, '.error').strip())
+
+NEUTRAL = """program Neutral;
+var x, y: integer;
+begin
+  readln(y);
+  x := y + 0;
+  x := x * 1;
+  writeln(x)
+end.
+"""
+
+def test_pass_stats_counts_removed_instructions(tmp_path):
+    source = tmp_path / "neutral.pas"
+    source.write_text(NEUTRAL, encoding='utf-8')
+    compiler_output = compile_file(source, tmp_path / "neutral.ewvm", 2, "--pass-stats")
+    assert_clean(compiler_output)
+    runs, removed = pass_stats(compiler_output)['fold']
+    assert runs >= 1
+    assert removed >= 4
+
+def test_level_zero_runs_no_passes(tmp_path):
+    source = tmp_path / "neutral.pas"
+    source.write_text(NEUTRAL, encoding='utf-8')
+    compiler_output = compile_file(source, tmp_path / "neutral.ewvm", 0, "--pass-stats")
+    assert_clean(compiler_output)
+    assert "(nenhuma passagem activa)" in compiler_output
+    assert "pushi 0\nadd" in (tmp_path / "neutral.ewvm").read_text(encoding='utf-8')
+
+# Uma passagem que apaga um rótulo ainda referido tem de ser apanhada pela verificação
+BROKEN_PASS = """
+import ewvm_opt
+ewvm_opt.optimization_passes['fold'] = lambda instructions, allocate_slot: [
+    instruction for instruction in instructions if instruction[1] != ':']
+manager = ewvm_opt.PassManager(1, verify=True)
+try:
+    manager.run("ciclo:\\npushi 1\\njz ciclo\\nstop\\n", lambda: 0)
+except ewvm_opt.VerificationError as error:
+    print(error)
+"""
+
+def test_verification_catches_broken_pass():
+    result = run_tool(["-c", BROKEN_PASS])
+    assert result.returncode == 0, result.stderr
+    assert "passagem 'fold'" in result.stdout and "ciclo" in result.stdout
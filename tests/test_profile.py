@@ -0,0 +1,70 @@
+import json
+import re
+
+from support import assert_clean, compile_file, run_tool
+
+# O mapa de fonte dá a linha Pascal de cada instrução (com a indexação do carregador do
+# ewvm.py) e o --profile soma as execuções por linha e por função
+
+PROGRAM = """program Prof;
+var i, s: integer;
+function sq(x: integer): integer;
+begin
+  sq := x * x
+end;
+begin
+  s := 0;
+  for i := 1 to 10 do
+    s := s + sq(i);
+  writeln(s)
+end.
+"""
+
+def compile_with_map(tmp_path):
+    source = tmp_path / "prof.pas"
+    source.write_text(PROGRAM, encoding='utf-8')
+    program = tmp_path / "prof.ewvm"
+    assert_clean(compile_file(source, program, 1, "--map"))
+    instructions = [line.strip() for line in program.read_text(encoding='utf-8').splitlines()]
+    instructions = [line for line in instructions if line and not line.endswith(':') and not line.startswith('//')]
+    source_map = json.loads((tmp_path / "prof.map").read_text(encoding='utf-8'))
+    return program, instructions, source_map
+
+def test_map_gives_pascal_line_of_each_instruction(tmp_path):
+    _, instructions, source_map = compile_with_map(tmp_path)
+    lines = source_map['lines']
+    assert source_map['source'].endswith("prof.pas")
+    assert len(lines) == len(instructions)
+    by_instruction = dict(zip(instructions, lines))
+    assert by_instruction['mul'] == 5
+    assert by_instruction['pusha sq'] == 10
+    assert by_instruction['call'] == 10
+    assert by_instruction['writei'] == 11
+    assert by_instruction['stop'] == 11
+
+def profile_counts(report, title):
+    section = report.split(title, 1)[1]
+    counts = {}
+    for line in section.splitlines()[1:]:
+        match = re.match(r"\s+(linha \S+|\w+)\s+(\d+)\s", line)
+        if match is None:
+            if counts:
+                break
+            continue
+        counts[match.group(1)] = int(match.group(2))
+    return counts
+
+def test_profile_counts_lines_and_functions(tmp_path):
+    program, _, source_map = compile_with_map(tmp_path)
+    result = run_tool(["ewvm.py", str(program), "--profile", "--stats", "--top", "20"])
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert result.stdout == "385\n"
+    lines = profile_counts(result.stderr, "Linhas Pascal mais quentes")
+    functions = profile_counts(result.stderr, "Funções mais quentes")
+    executed = int(re.search(r"Instruções executadas: (\d+)", result.stderr).group(1))
+    static = {line: source_map['lines'].count(line) for line in (5, 10)}
+    # O corpo de sq e a linha da chamada correm uma vez por iteração
+    assert lines['linha 5'] == 10 * static[5]
+    assert lines['linha 10'] == 10 * static[10]
+    assert functions['sq'] == lines['linha 5']
+    assert sum(lines.values()) == sum(functions.values()) == executed
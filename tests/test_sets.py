@@ -0,0 +1,35 @@
+import pytest
+
+from support import assert_clean, compile_source, run_program
+
+def test_set_domain_limited_to_31_elements(tmp_path):
+    source = "program S;\nvar a: set of 0..31;\nbegin\n  a := [1];\n  writeln(1 in a)\nend.\n"
+    compiler_output, _ = compile_source(tmp_path, source)
+    assert "máximo 31 elementos" in compiler_output
+
+# O conjunto chama 'g' recursivamente depois de o valor de 'in' ser guardado:
+# a chamada interna não pode alterar o valor da externa
+IN_RECURSIVE = """program InRec;
+var i: integer;
+function g(n: integer): integer;
+begin
+  if n <= 0 then
+    g := 1
+  else if (n + 1) in ([3, 5] + [g(n - 1)]) then
+    g := n + 10
+  else
+    g := n
+end;
+begin
+  for i := 0 to 6 do
+    writeln(g(i))
+end.
+"""
+
+@pytest.mark.parametrize("level", [0, 1, 2])
+def test_in_value_survives_recursive_call(tmp_path, level):
+    compiler_output, program = compile_source(tmp_path, IN_RECURSIVE, level)
+    assert_clean(compiler_output)
+    expected = ["1", "1", "12", "3", "14", "5", "6"]
+    assert run_program(program).split() == expected
+    assert run_program(program, "", "--backend", "py").split() == expected
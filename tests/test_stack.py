@@ -0,0 +1,68 @@
+import re
+
+import pytest
+
+from support import assert_clean, compile_file, compile_source, run_tool
+from test_golden import golden_programs, read_golden
+
+# O limite estático ('//stack' de cada rotina somado pela pior cadeia de chamadas) tem
+# de cobrir a pilha observada; a pilha de inteiros é reservada com esse tamanho
+
+@pytest.mark.parametrize("level", [0, 1, 2])
+@pytest.mark.parametrize("name, source", golden_programs())
+def test_static_bound_covers_observed_stack(tmp_path, name, source, level):
+    if read_golden(name, '.error'):
+        pytest.skip("o programa termina com erro de execução")
+    program = tmp_path / f"{name}.ewvm"
+    assert_clean(compile_file(source, program, level))
+    result = run_tool(["ewvm.py", str(program), "--profile", "--stats"], read_golden(name, '.in'))
+    assert result.returncode == 0, result.stdout + result.stderr
+    output = result.stdout + result.stderr
+    bound = re.search(r"Pilha: limite estático (\d+)", output)
+    if bound is None:
+        pytest.skip("sem limite estático (recursão)")
+    observed = re.search(r"Pilha: máximo observado (\d+)", output)
+    assert int(observed.group(1)) <= int(bound.group(1))
+
+LOOP = """program Loop;
+var i, s: integer;
+begin
+  s := 0;
+  for i := 1 to 10 do
+    s := s + i * (i + 1);
+  writeln(s)
+end.
+"""
+
+def test_integer_stack_is_sized_from_bound(tmp_path):
+    compiler_output, program = compile_source(tmp_path, LOOP)
+    assert_clean(compiler_output)
+    result = run_tool(["ewvm.py", str(program), "--stack", "int"])
+    assert result.stdout == "440\n"
+    # Com um cabeçalho '//stack' subestimado o array reservado não chega: não cresce
+    code = program.read_text(encoding='utf-8')
+    program.write_text(re.sub(r"//stack \d+", "//stack 1", code), encoding='utf-8')
+    result = run_tool(["ewvm.py", str(program), "--stack", "int"])
+    assert result.returncode == 1 and "Erro de execução" in result.stdout
+    assert run_tool(["ewvm.py", str(program)]).stdout == "440\n"
+
+# --bench-stack mede as duas pilhas num programa só de inteiros e só a genérica se houver strings
+def test_bench_stack_reports_both_modes(tmp_path):
+    compiler_output, program = compile_source(tmp_path, LOOP)
+    assert_clean(compiler_output)
+    result = run_tool(["ewvm.py", str(program), "--bench-stack", "--repeat", "1"])
+    assert result.returncode == 0, result.stdout + result.stderr
+    lines = result.stdout.splitlines()
+    assert lines[0].split() == ["pilha", "tempo", "(ms)", "instr/s", "pico", "(KiB)"]
+    assert [line.split()[0] for line in lines[1:]] == ["list", "int"]
+    assert all(float(value) > 0 for line in lines[1:] for value in line.split()[1:])
+
+def test_bench_stack_with_strings_uses_generic_stack_only(tmp_path):
+    source = "program S;\nvar s: string;\nbegin\n  readln(s);\n  writeln(length(s))\nend.\n"
+    compiler_output, program = compile_source(tmp_path, source)
+    assert_clean(compiler_output)
+    result = run_tool(["ewvm.py", str(program), "--bench-stack", "--repeat", "1"], "abc\n")
+    assert result.returncode == 0, result.stdout + result.stderr
+    lines = result.stdout.splitlines()
+    assert lines[0] == "O programa usa strings ou reais: só a pilha genérica é aplicável."
+    assert [line.split()[0] for line in lines[2:]] == ["list"]
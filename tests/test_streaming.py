@@ -0,0 +1,31 @@
+import pytest
+
+from support import assert_clean, compile_file, run_tool
+from test_golden import golden_programs
+
+# O código das funções vai para um ficheiro temporário assim que cada função fica
+# completa; o programa escrito tem de ser byte a byte igual ao gerado todo em memória
+
+# Compila sem ficheiro de saída nem ficheiro temporário: o programa é devolvido como texto
+IN_MEMORY = """
+import sys
+import ewvm_opt, pascal_gt, pascal_lex
+with open(sys.argv[1], encoding='utf-8') as f:
+    source = f.read()
+pascal_gt.parser_pass_manager = ewvm_opt.PassManager(int(sys.argv[2]))
+pascal_gt.reset_compiler_state()
+pascal_lex.lexer.lineno = 1
+code = pascal_gt.parser.parse(source, lexer=pascal_lex.lexer)
+with open(sys.argv[3], 'w', encoding='utf-8', newline='') as f:
+    f.write(code)
+"""
+
+@pytest.mark.parametrize("level", [0, 2])
+@pytest.mark.parametrize("name, source", golden_programs())
+def test_streamed_output_matches_in_memory(tmp_path, name, source, level):
+    streamed = tmp_path / f"{name}.ewvm"
+    assert_clean(compile_file(source, streamed, level))
+    in_memory = tmp_path / f"{name}.memory.ewvm"
+    result = run_tool(["-c", IN_MEMORY, str(source), str(level), str(in_memory)])
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert streamed.read_bytes() == in_memory.read_bytes()
@@ -0,0 +1,18 @@
+import os
+import shutil
+
+from support import ROOT, assert_clean, compile_file, run_program
+
+UNITS = os.path.join(ROOT, 'tests', 'units')
+
+def test_unit_compiled_twice_uses_cached_artifact(tmp_path):
+    for filename in ('MathUtils.pas', 'prog.pas'):
+        shutil.copy(os.path.join(UNITS, filename), tmp_path)
+    with open(os.path.join(UNITS, 'prog.out'), 'r', encoding='utf-8') as f:
+        expected = f.read()
+    program = tmp_path / "prog.ewvm"
+    # A primeira compilação gera MathUtils.ewu; a segunda reutiliza-o
+    for _ in range(2):
+        assert_clean(compile_file(tmp_path / "prog.pas", program))
+        assert (tmp_path / "MathUtils.ewu").exists()
+        assert run_program(program) == expected
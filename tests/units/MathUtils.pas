@@ -0,0 +1,30 @@
+unit MathUtils;
+interface
+  function Square(x: integer): integer;
+  function Fact(n: integer): integer;
+  function Classify(n: integer): integer;
+implementation
+var calls: integer;
+function Helper(a: integer; b: integer): integer;
+begin
+  calls := calls + 1;
+  Helper := a * b
+end;
+function Square(x: integer): integer;
+begin
+  Square := Helper(x, x)
+end;
+function Fact(n: integer): integer;
+begin
+  if n <= 1 then Fact := 1 else Fact := n * Fact(n - 1)
+end;
+function Classify(n: integer): integer;
+begin
+  case n of
+    0: Classify := 100;
+    1, 2: Classify := 200;
+    3..5: Classify := n * 1000
+  else Classify := 0 - 1
+  end
+end;
+end.
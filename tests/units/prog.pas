@@ -0,0 +1,17 @@
+program UseIt;
+uses MathUtils;
+var i, t: integer;
+function Twice(y: integer): integer;
+begin
+  Twice := y + y
+end;
+begin
+  t := 0;
+  for i := 1 to 5 do
+    t := t + Square(i);
+  writeln('sum squares ', t);
+  writeln('fact ', Fact(10));
+  writeln('twice ', Twice(Square(3)));
+  for i := 0 to 6 do write(Classify(i), ' ');
+  writeln('')
+end.